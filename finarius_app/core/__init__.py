@@ -19,6 +19,7 @@ from .utils import (
     parse_date,
     format_date,
     get_date_range,
+    get_date_range_array,
     format_currency,
     format_percentage,
     round_decimal,
@@ -27,6 +28,8 @@ from .utils import (
     validate_amount,
     safe_divide,
     calculate_percentage_change,
+    safe_divide_array,
+    percentage_change_array,
 )
 
 __all__ = [
@@ -50,6 +53,7 @@ __all__ = [
     "parse_date",
     "format_date",
     "get_date_range",
+    "get_date_range_array",
     # Number utilities
     "format_currency",
     "format_percentage",
@@ -61,5 +65,7 @@ __all__ = [
     # Data utilities
     "safe_divide",
     "calculate_percentage_change",
+    "safe_divide_array",
+    "percentage_change_array",
 ]
 
@@ -32,6 +32,9 @@ class Config:
 
     _instance: Optional["Config"] = None
     _config: Dict[str, Any] = {}
+    # Incremented whenever configuration values are loaded or set, so callers
+    # can cache values derived from them
+    version: int = 0
 
     def __new__(cls, config_path: Optional[str] = None) -> "Config":
         """Create or return existing Config instance (singleton pattern)."""
@@ -59,6 +62,7 @@ class Config:
         """
         # Start with defaults
         self._config = self._get_defaults()
+        Config.version += 1
 
         # Load from config file
         file_config = self._load_from_file(config_path)
@@ -341,6 +345,7 @@ class Config:
             config = config[k]
 
         config[keys[-1]] = value
+        Config.version += 1
 
     def to_dict(self) -> Dict[str, Any]:
         """Get full configuration as dictionary.
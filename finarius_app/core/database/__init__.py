@@ -94,6 +94,9 @@ def init_db(db_path: Optional[str] = None) -> Database:
         # Create tables (idempotent - will not recreate if they exist)
         create_all_tables(conn)
 
+        # Superseded by the covering idx_prices_symbol_date_desc index
+        conn.execute("DROP INDEX IF EXISTS idx_prices_symbol_date")
+
         conn.commit()
         logger.info("Database initialized successfully")
         return db
@@ -1,11 +1,26 @@
 """Database connection management module."""
 
+import re
 import sqlite3
 import logging
-from typing import Optional, List
+from typing import Optional, List, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Number of prepared statements sqlite3 keeps per connection, keyed by SQL text.
+# Query helpers use fixed SQL strings, so each distinct query is parsed only once.
+STATEMENT_CACHE_SIZE = 256
+
+# INSERT ... RETURNING needs SQLite 3.35+; older libraries (still linked by some
+# Python 3.9/3.10 builds) fall back to reading the inserted row by its rowid
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Splits "INSERT [OR ...] INTO <table> ... RETURNING <columns>" for that fallback
+_INSERT_RETURNING_RE = re.compile(
+    r"^(\s*INSERT\b.*?\bINTO\s+(\w+)\b.*?)\bRETURNING\s+(.+?)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 class Database:
     """Database connection manager with singleton pattern.
@@ -36,6 +51,20 @@ class Database:
         if self._connection is None:
             self._connection = self._create_connection()
 
+    @classmethod
+    def get(cls) -> "Database":
+        """Get the shared Database instance, creating it on first use.
+
+        Cheaper than ``Database()`` for callers that only need the existing
+        instance: it is returned directly without re-running ``__init__``.
+
+        Returns:
+            Shared Database instance.
+        """
+        if cls._instance is not None:
+            return cls._instance
+        return cls()
+
     def _create_connection(self) -> sqlite3.Connection:
         """Create and configure SQLite database connection.
 
@@ -50,6 +79,7 @@ class Database:
                 self._db_path,
                 check_same_thread=False,
                 timeout=30.0,
+                cached_statements=STATEMENT_CACHE_SIZE,
             )
             conn.row_factory = sqlite3.Row
             # Enable foreign key constraints
@@ -104,12 +134,76 @@ class Database:
             logger.error(f"Params: {params}")
             raise
 
-    def executemany(self, query: str, params_list: List[tuple]) -> sqlite3.Cursor:
+    def execute_returning(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        """Execute a write query with a RETURNING clause and fetch its row.
+
+        The returned row is read before committing, so an INSERT can hand back
+        its generated ID and defaults in the same statement. On SQLite older
+        than 3.35, an INSERT runs without the clause and the returned columns
+        are selected by the inserted row's rowid instead.
+
+        Args:
+            query: SQL query string ending in a RETURNING clause.
+            params: Query parameters.
+
+        Returns:
+            First returned row or None if no row was written.
+
+        Raises:
+            sqlite3.Error: If query execution fails.
+            sqlite3.NotSupportedError: If RETURNING is unsupported and the
+                query is not an INSERT.
+        """
+        try:
+            conn = self.get_connection()
+            if SUPPORTS_RETURNING:
+                rows = conn.execute(query, params).fetchall()
+            else:
+                rows = self._insert_then_select(conn, query, params)
+            conn.commit()
+            return rows[0] if rows else None
+        except sqlite3.Error as e:
+            logger.error(f"Error executing query: {e}")
+            logger.error(f"Query: {query}")
+            logger.error(f"Params: {params}")
+            raise
+
+    @staticmethod
+    def _insert_then_select(
+        conn: sqlite3.Connection, query: str, params: tuple
+    ) -> List[sqlite3.Row]:
+        """Run an INSERT ... RETURNING query without RETURNING support.
+
+        Args:
+            conn: Database connection.
+            query: INSERT query string ending in a RETURNING clause.
+            params: Query parameters.
+
+        Returns:
+            The inserted row's returned columns (empty if nothing was inserted).
+
+        Raises:
+            sqlite3.NotSupportedError: If the query is not an INSERT.
+        """
+        match = _INSERT_RETURNING_RE.match(query)
+        if match is None:
+            raise sqlite3.NotSupportedError(
+                f"RETURNING requires SQLite 3.35+ (found {sqlite3.sqlite_version})"
+            )
+        insert, table, returning = match.groups()
+        cursor = conn.execute(insert, params)
+        if cursor.rowcount < 1:
+            return []
+        return conn.execute(
+            f"SELECT {returning} FROM {table} WHERE rowid = ?", (cursor.lastrowid,)
+        ).fetchall()
+
+    def executemany(self, query: str, params_list: Iterable[tuple]) -> sqlite3.Cursor:
         """Execute a SQL query multiple times with different parameters.
 
         Args:
             query: SQL query string.
-            params_list: List of parameter tuples.
+            params_list: Parameter tuples; any iterable, including a generator.
 
         Returns:
             Cursor object.
@@ -54,6 +54,10 @@ def create_transactions_table(conn: sqlite3.Connection) -> None:
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_transactions_account_date ON transactions(account_id, date)"
     )
+    # Scanned backwards, (symbol, date, rowid) serves ORDER BY date DESC, id DESC without a sort
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_transactions_symbol_date ON transactions(symbol, date)"
+    )
 
 
 def create_prices_table(conn: sqlite3.Connection) -> None:
@@ -79,7 +83,10 @@ def create_prices_table(conn: sqlite3.Connection) -> None:
     # Create indexes
     conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_symbol ON prices(symbol)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_date ON prices(date)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_symbol_date ON prices(symbol, date DESC)")
+    # Covering index so latest-close lookups never touch the table
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_prices_symbol_date_desc ON prices(symbol, date DESC, close)"
+    )
 
 
 def create_schema_version_table(conn: sqlite3.Connection) -> None:
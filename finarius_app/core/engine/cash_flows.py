@@ -4,12 +4,13 @@ This module handles tracking of cash flows including deposits, withdrawals,
 and dividends from transactions.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterable, Optional, Any
 from datetime import date
 import logging
 
 from ..database import Database
 from ..models.queries import get_transactions_by_account
+from ..models.transaction import Transaction
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,18 @@ def get_cash_flows(
     transactions = get_transactions_by_account(
         account_id, start_date=start_date, end_date=end_date, db=db
     )
+    return cash_flows_from_transactions(transactions)
 
+
+def cash_flows_from_transactions(transactions: Iterable[Transaction]) -> List[Dict[str, Any]]:
+    """Convert transactions to cash flows, skipping non-cash-flow types.
+
+    Args:
+        transactions: Transaction instances, in any order.
+
+    Returns:
+        List of cash flow dictionaries sorted by date, as returned by get_cash_flows.
+    """
     cash_flows: List[Dict[str, Any]] = []
 
     for transaction in transactions:
@@ -80,6 +80,27 @@ def calculate_portfolio_value(
     return total_value
 
 
+def get_frequency_delta(frequency: str) -> timedelta:
+    """Get the date increment between snapshots of a given frequency.
+
+    Args:
+        frequency: Frequency of snapshots ('daily', 'weekly', 'monthly').
+            Unknown values fall back to daily.
+
+    Returns:
+        Time between consecutive snapshots.
+    """
+    if frequency == "daily":
+        return timedelta(days=1)
+    if frequency == "weekly":
+        return timedelta(weeks=1)
+    if frequency == "monthly":
+        # Approximate monthly (30 days)
+        return timedelta(days=30)
+    logger.warning(f"Unknown frequency '{frequency}', using daily")
+    return timedelta(days=1)
+
+
 def calculate_portfolio_value_over_time(
     account_id: int,
     start_date: date,
@@ -113,18 +134,7 @@ def calculate_portfolio_value_over_time(
 
     values: Dict[date, float] = {}
     current_date = start_date
-
-    # Determine date increment based on frequency
-    if frequency == "daily":
-        delta = timedelta(days=1)
-    elif frequency == "weekly":
-        delta = timedelta(weeks=1)
-    elif frequency == "monthly":
-        # Approximate monthly (30 days)
-        delta = timedelta(days=30)
-    else:
-        logger.warning(f"Unknown frequency '{frequency}', using daily")
-        delta = timedelta(days=1)
+    delta = get_frequency_delta(frequency)
 
     while current_date <= end_date:
         value = calculate_portfolio_value(
@@ -137,15 +147,18 @@ def calculate_portfolio_value_over_time(
 
 
 def get_portfolio_breakdown(
-    account_id: int,
+    account_id: Optional[int],
     breakdown_date: date,
     db: Optional[Database] = None,
     price_downloader: Optional[PriceDownloader] = None,
 ) -> Dict[str, Dict[str, float]]:
     """Get portfolio breakdown by symbol.
 
+    With account_id None, positions of all accounts are combined per symbol,
+    so each symbol is priced once.
+
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         breakdown_date: Date for breakdown.
         db: Database instance. If None, creates a new instance.
         price_downloader: PriceDownloader instance. If None, creates a new instance.
@@ -4,30 +4,27 @@ This module handles calculation of portfolio positions from transactions,
 including handling BUY/SELL transactions and stock splits.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 from datetime import date
 import logging
 
 from ..database import Database
-from ..models.queries import get_transactions_by_account
+from ..models.transaction import Transaction
+from ..models.queries import get_transactions_by_account, get_transactions_by_type
 
 logger = logging.getLogger(__name__)
 
 
-def get_positions(
-    account_id: int,
-    position_date: date,
-    db: Optional[Database] = None,
+def positions_from_transactions(
+    transactions: Iterable[Transaction],
 ) -> Dict[str, Dict[str, float]]:
-    """Get positions at specific date.
+    """Replay one account's transactions into positions.
 
-    Calculates positions by processing all transactions up to and including
-    the specified date. Handles BUY/SELL transactions and tracks cost basis.
+    Handles BUY/SELL transactions and tracks cost basis; other transaction
+    types are ignored.
 
     Args:
-        account_id: Account ID.
-        position_date: Date to calculate positions.
-        db: Database instance. If None, creates a new instance.
+        transactions: Transactions of a single account, in any order.
 
     Returns:
         Dictionary mapping symbol -> {
@@ -36,16 +33,7 @@ def get_positions(
             'avg_price': float      # Average price per unit (PRU)
         }
     """
-    if db is None:
-        from ..database import Database
-
-        db = Database()
-
-    # Get all transactions up to and including the date
-    transactions = get_transactions_by_account(
-        account_id, end_date=position_date, db=db
-    )
-    transactions.sort(key=lambda t: (t.date, t.id))
+    transactions = sorted(transactions, key=lambda t: (t.date, t.id))
 
     positions: Dict[str, Dict[str, float]] = {}
 
@@ -117,9 +105,57 @@ def get_positions(
                     positions[symbol]["avg_price"] = 0.0
 
     # Remove positions with zero quantity
-    positions = {k: v for k, v in positions.items() if v["qty"] > 0}
+    return {k: v for k, v in positions.items() if v["qty"] > 0}
 
-    return positions
+
+def get_positions(
+    account_id: Optional[int],
+    position_date: date,
+    db: Optional[Database] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Get positions at specific date.
+
+    Calculates positions by processing all transactions up to and including
+    the specified date. Handles BUY/SELL transactions and tracks cost basis.
+
+    With account_id None, each account's positions are tracked separately
+    (cost basis is per account) and then combined per symbol.
+
+    Args:
+        account_id: Account ID, or None for all accounts.
+        position_date: Date to calculate positions.
+        db: Database instance. If None, creates a new instance.
+
+    Returns:
+        Dictionary mapping symbol -> {
+            'qty': float,           # Current quantity
+            'cost_basis': float,    # Total cost basis (including fees)
+            'avg_price': float      # Average price per unit (PRU)
+        }
+    """
+    if db is None:
+        from ..database import Database
+
+        db = Database()
+
+    if account_id is None:
+        combined: Dict[str, Dict[str, float]] = {}
+        for positions in get_all_positions(position_date, db).values():
+            for symbol, position in positions.items():
+                total = combined.setdefault(
+                    symbol, {"qty": 0.0, "cost_basis": 0.0, "avg_price": 0.0}
+                )
+                total["qty"] += position["qty"]
+                total["cost_basis"] += position["cost_basis"]
+        for total in combined.values():
+            total["avg_price"] = total["cost_basis"] / total["qty"]
+        return combined
+
+    # Get all transactions up to and including the date
+    transactions = get_transactions_by_account(
+        account_id, end_date=position_date, db=db
+    )
+    return positions_from_transactions(transactions)
 
 
 def get_all_positions(
@@ -128,27 +164,35 @@ def get_all_positions(
 ) -> Dict[int, Dict[str, Dict[str, float]]]:
     """Get positions across all accounts.
 
+    Reads the BUY and SELL transactions of every account in two queries,
+    whatever the number of accounts.
+
     Args:
         position_date: Date to calculate positions.
         db: Database instance. If None, creates a new instance.
 
     Returns:
-        Dictionary mapping account_id -> positions dict.
+        Dictionary mapping account_id -> positions dict (accounts without
+        open positions are left out).
     """
     if db is None:
         from ..database import Database
 
         db = Database()
 
-    from ..models.queries import get_all_accounts
+    transactions_by_account: Dict[int, List[Transaction]] = {}
+    for transaction_type in ("BUY", "SELL"):
+        for transaction in get_transactions_by_type(
+            transaction_type, end_date=position_date, db=db
+        ):
+            transactions_by_account.setdefault(transaction.account_id, []).append(transaction)
 
-    accounts = get_all_accounts(db)
     all_positions: Dict[int, Dict[str, Dict[str, float]]] = {}
 
-    for account in accounts:
-        positions = get_positions(account.id, position_date, db)
+    for account_id, transactions in transactions_by_account.items():
+        positions = positions_from_transactions(transactions)
         if positions:
-            all_positions[account.id] = positions
+            all_positions[account_id] = positions
 
     return all_positions
 
@@ -0,0 +1,38 @@
+"""Optional Numba JIT support for Finarius numeric kernels.
+
+Numba is an optional dependency (install with: pip install finarius[jit]).
+When it is not installed, :func:`njit` returns functions unchanged, so every
+kernel decorated with it must also be valid plain NumPy code.
+"""
+
+from typing import Any
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+# Whether kernels are actually compiled
+NUMBA_AVAILABLE = numba is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile a function with ``numba.njit`` when Numba is available.
+
+    Accepts the same arguments as ``numba.njit`` and works both as ``@njit``
+    and ``@njit(cache=True, ...)``. Without Numba, it is a no-op decorator.
+
+    Returns:
+        The compiled function, or the original function without Numba.
+
+    Example:
+        >>> @njit(cache=True)
+        ... def total(values):
+        ...     return values.sum()
+    """
+    if numba is not None:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -38,6 +38,12 @@ from .risk_metrics import (
     calculate_volatility,
     calculate_beta,
 )
+from .performance import (
+    PerformanceBundle,
+    RiskBundle,
+    compute_performance_bundle,
+    compute_risk_bundle,
+)
 
 __all__ = [
     # Main class
@@ -70,5 +76,10 @@ __all__ = [
     "calculate_max_drawdown",
     "calculate_volatility",
     "calculate_beta",
+    # Combined performance metrics
+    "PerformanceBundle",
+    "RiskBundle",
+    "compute_performance_bundle",
+    "compute_risk_bundle",
 ]
 
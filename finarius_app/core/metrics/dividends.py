@@ -10,15 +10,15 @@ import logging
 
 from ..database import Database
 from ..prices.downloader import PriceDownloader
-from ..models.queries import get_price
-from ..engine.cash_flows import get_cash_flows
+from ..models.queries import get_price, get_transactions_by_type
+from ..engine.cash_flows import cash_flows_from_transactions, get_cash_flows
 from ..engine.positions import get_positions
 
 logger = logging.getLogger(__name__)
 
 
 def get_dividend_history(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
@@ -26,7 +26,7 @@ def get_dividend_history(
     """Get all dividend transactions in date range.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts (one query).
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
@@ -39,6 +39,10 @@ def get_dividend_history(
 
         db = Database()
 
+    if account_id is None:
+        transactions = get_transactions_by_type("DIVIDEND", start_date, end_date, db)
+        return cash_flows_from_transactions(transactions)
+
     cash_flows = get_cash_flows(account_id, start_date, end_date, db)
     dividends = [cf for cf in cash_flows if cf["type"] == "DIVIDEND"]
 
@@ -94,7 +98,7 @@ def calculate_dividend_yield(
 
 
 def calculate_dividend_income(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
@@ -102,7 +106,7 @@ def calculate_dividend_income(
     """Calculate total dividend income in date range.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
@@ -120,7 +124,7 @@ def calculate_dividend_income(
 
 
 def get_dividend_by_symbol(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
@@ -128,7 +132,7 @@ def get_dividend_by_symbol(
     """Get dividend income broken down by symbol.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
@@ -148,9 +152,7 @@ def get_dividend_by_symbol(
         symbol = div.get("symbol")
         if symbol:
             symbol = symbol.upper()
-            if symbol not in by_symbol:
-                by_symbol[symbol] = 0.0
-            by_symbol[symbol] += div["amount"]
+            by_symbol[symbol] = by_symbol.get(symbol, 0.0) + div["amount"]
 
     return by_symbol
 
@@ -0,0 +1,55 @@
+"""Numeric kernels for performance metrics.
+
+Kernels operate on NumPy arrays and are JIT-compiled with Numba when it is
+installed (see :mod:`finarius_app.core.jit`); otherwise they run as plain
+NumPy code.
+"""
+
+import numpy as np
+
+from ..jit import njit
+
+
+@njit(cache=True, error_model="numpy")
+def irr_kernel(
+    flows: np.ndarray,
+    years: np.ndarray,
+    guess: float = 0.1,
+    max_iterations: int = 100,
+    tolerance: float = 1e-6,
+) -> float:
+    """Find the rate where the net present value of cash flows is zero.
+
+    Uses Newton-Raphson iteration, keeping the rate above -99%.
+
+    Args:
+        flows: Cash flow amounts (float64), negative for money put in.
+        years: Time of each flow in years since the first flow (float64).
+        guess: Initial rate (default: 0.1 = 10%).
+        max_iterations: Maximum number of Newton steps.
+        tolerance: Net present value (and derivative) treated as zero.
+
+    Returns:
+        The rate as decimal, or NaN if the iteration does not converge.
+    """
+    rate = guess
+    for _ in range(max_iterations):
+        discount = (1.0 + rate) ** years
+        if not np.all(np.isfinite(discount)):
+            break
+
+        npv = np.sum(flows / discount)
+        if abs(npv) < tolerance:
+            return rate
+
+        derivative = -np.sum(years * flows / (discount * (1.0 + rate)))
+        if abs(derivative) < tolerance:
+            break
+
+        rate = rate - npv / derivative
+
+        # Prevent negative rates that are too extreme
+        if rate < -0.99:
+            rate = -0.99
+
+    return np.nan
@@ -119,9 +119,12 @@ class MetricsCalculator:
         account_id: int,
         start_date: date,
         end_date: date,
+        frequency: str = "daily",
     ) -> Dict[date, float]:
         """Get realized gains history over time."""
-        return get_realized_gains_history(account_id, start_date, end_date, self.db)
+        return get_realized_gains_history(
+            account_id, start_date, end_date, self.db, frequency
+        )
 
     # Unrealized gains methods
     def calculate_unrealized_gains(
@@ -157,10 +160,11 @@ class MetricsCalculator:
         account_id: int,
         start_date: date,
         end_date: date,
+        frequency: str = "daily",
     ) -> Dict[date, float]:
         """Get unrealized gains history over time."""
         return get_unrealized_gains_history(
-            account_id, start_date, end_date, self.db, self.price_downloader
+            account_id, start_date, end_date, self.db, self.price_downloader, frequency
         )
 
     # Return methods
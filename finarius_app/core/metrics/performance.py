@@ -0,0 +1,353 @@
+"""Combined performance metrics module.
+
+This module calculates the metrics shown together on the analytics page in
+one pass each: the return metrics (total return, CAGR, IRR, TWRR, volatility
+and their histories) and the risk metrics (Sharpe ratio, maximum drawdown,
+volatility and beta), sharing cash flows and daily portfolio values between
+them.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional
+from datetime import date, timedelta
+import logging
+
+from ..database import Database
+from ..prices.downloader import PriceDownloader
+from ..engine.portfolio_value import calculate_portfolio_value
+from ..engine.cash_flows import get_cash_flows
+from ..models.queries import get_prices
+from ..prices.cache import ConnectionLRUCache
+from .realized_gains import calculate_realized_gains
+from .unrealized_gains import calculate_unrealized_gains
+from .returns import cagr_from_values, irr_from_cash_flows, twrr_from_cash_flows
+from .risk_metrics import (
+    beta_from_values,
+    max_drawdown_from_values,
+    sharpe_from_return,
+    volatility_from_values,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of (account, date) portfolio values kept between calls
+PORTFOLIO_VALUE_CACHE_SIZE = 4096
+
+# (account_id, date ordinal) -> portfolio value; dropped on any database write,
+# so values stay current after transactions or prices change. Periods that
+# overlap (e.g. "Last 30 Days" then "Last 90 Days") share their valuations.
+_portfolio_value_cache = ConnectionLRUCache(PORTFOLIO_VALUE_CACHE_SIZE)
+
+
+class PerformanceBundle:
+    """Performance metrics of one account over one period."""
+
+    __slots__ = (
+        "total_return",
+        "total_return_percentage",
+        "cagr",
+        "irr",
+        "twrr",
+        "volatility",
+        "cagr_history",
+        "irr_history",
+        "twrr_history",
+    )
+
+    def __init__(
+        self,
+        total_return: float,
+        total_return_percentage: float,
+        cagr: float,
+        irr: Optional[float],
+        twrr: float,
+        volatility: float,
+        cagr_history: Dict[date, float],
+        irr_history: Dict[date, Optional[float]],
+        twrr_history: Dict[date, float],
+    ) -> None:
+        """Initialize PerformanceBundle instance.
+
+        Args:
+            total_return: Total return amount.
+            total_return_percentage: Total return as decimal.
+            cagr: CAGR as decimal.
+            irr: IRR as decimal, or None if it could not be calculated.
+            twrr: TWRR as decimal.
+            volatility: Annualized volatility as decimal.
+            cagr_history: Dictionary mapping date -> CAGR up to that date.
+            irr_history: Dictionary mapping date -> IRR up to that date.
+            twrr_history: Dictionary mapping date -> TWRR up to that date.
+        """
+        self.total_return = total_return
+        self.total_return_percentage = total_return_percentage
+        self.cagr = cagr
+        self.irr = irr
+        self.twrr = twrr
+        self.volatility = volatility
+        self.cagr_history = cagr_history
+        self.irr_history = irr_history
+        self.twrr_history = twrr_history
+
+
+def compute_performance_bundle(
+    account_id: int,
+    start_date: date,
+    end_date: date,
+    db: Optional[Database] = None,
+    price_downloader: Optional[PriceDownloader] = None,
+) -> PerformanceBundle:
+    """Calculate all performance metrics of a period at once.
+
+    Gives the same results as calling calculate_total_return,
+    calculate_total_return_percentage, calculate_cagr, calculate_irr,
+    calculate_twrr, calculate_volatility and the CAGR/IRR/TWRR history
+    functions separately, but loads the period's cash flows once and values
+    the portfolio once per day instead of once per metric and history point.
+
+    Args:
+        account_id: Account ID.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        db: Database instance. If None, creates a new instance.
+        price_downloader: PriceDownloader instance. If None, creates a new instance.
+
+    Returns:
+        PerformanceBundle with the period's metrics and daily histories.
+    """
+    if db is None:
+        from ..database import Database
+
+        db = Database()
+
+    if price_downloader is None:
+        from ..prices.downloader import PriceDownloader
+
+        price_downloader = PriceDownloader(db=db)
+
+    # Cash flows are sorted by date, so a prefix holds the flows up to any date
+    cash_flows = get_cash_flows(account_id, start_date, end_date, db)
+    cf_dates = [cf["date"] for cf in cash_flows]
+
+    values: Dict[date, float] = {}
+
+    def value_at(value_date: date) -> float:
+        """Get the portfolio value at a date, valuing each date once."""
+        if value_date not in values:
+            values[value_date] = _portfolio_value(
+                account_id, value_date, db, price_downloader
+            )
+        return values[value_date]
+
+    start_value = value_at(start_date)
+
+    cagr_history: Dict[date, float] = {}
+    irr_history: Dict[date, Optional[float]] = {}
+    twrr_history: Dict[date, float] = {}
+    current_date = start_date
+
+    while current_date <= end_date:
+        current_value = value_at(current_date)
+        flows_to_date = cash_flows[:bisect_right(cf_dates, current_date)]
+
+        cagr_history[current_date] = cagr_from_values(
+            start_date, current_date, start_value, current_value
+        )
+        irr_history[current_date] = irr_from_cash_flows(
+            flows_to_date, start_date, current_date, start_value, current_value
+        )
+        twrr_history[current_date] = twrr_from_cash_flows(
+            flows_to_date, start_date, current_date, value_at
+        )
+        current_date += timedelta(days=1)
+
+    if end_date < start_date:
+        # Empty period: the scalar metrics still follow the separate functions
+        end_value = value_at(end_date)
+        cagr = cagr_from_values(start_date, end_date, start_value, end_value)
+        irr = irr_from_cash_flows(cash_flows, start_date, end_date, start_value, end_value)
+        twrr = twrr_from_cash_flows(cash_flows, start_date, end_date, value_at)
+    else:
+        cagr = cagr_history[end_date]
+        irr = irr_history[end_date]
+        twrr = twrr_history[end_date]
+
+    total_return = _total_return(
+        account_id, start_date, end_date, cash_flows, db, price_downloader
+    )
+    total_return_percentage = total_return / start_value if start_value != 0 else 0.0
+
+    volatility = volatility_from_values(
+        {value_date: values[value_date] for value_date in cagr_history}
+    )
+
+    return PerformanceBundle(
+        total_return=total_return,
+        total_return_percentage=total_return_percentage,
+        cagr=cagr,
+        irr=irr,
+        twrr=twrr,
+        volatility=volatility,
+        cagr_history=cagr_history,
+        irr_history=irr_history,
+        twrr_history=twrr_history,
+    )
+
+
+class RiskBundle:
+    """Risk metrics of one account over one period."""
+
+    __slots__ = ("sharpe_ratio", "max_drawdown", "volatility", "beta")
+
+    def __init__(
+        self,
+        sharpe_ratio: Optional[float],
+        max_drawdown: float,
+        volatility: float,
+        beta: Optional[float],
+    ) -> None:
+        """Initialize RiskBundle instance.
+
+        Args:
+            sharpe_ratio: Sharpe ratio, or None if volatility is zero.
+            max_drawdown: Maximum drawdown as decimal.
+            volatility: Annualized volatility as decimal.
+            beta: Beta vs the benchmark, or None if it could not be calculated.
+        """
+        self.sharpe_ratio = sharpe_ratio
+        self.max_drawdown = max_drawdown
+        self.volatility = volatility
+        self.beta = beta
+
+
+def compute_risk_bundle(
+    account_id: int,
+    start_date: date,
+    end_date: date,
+    risk_free_rate: float = 0.02,
+    benchmark_symbol: str = "SPY",
+    db: Optional[Database] = None,
+    price_downloader: Optional[PriceDownloader] = None,
+) -> RiskBundle:
+    """Calculate all risk metrics of a period at once.
+
+    Gives the same results as calling calculate_sharpe_ratio,
+    calculate_max_drawdown, calculate_volatility and calculate_beta
+    separately, but values the portfolio over the period once instead of once
+    per metric.
+
+    Args:
+        account_id: Account ID.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        risk_free_rate: Risk-free rate as decimal (default: 0.02 = 2%).
+        benchmark_symbol: Benchmark symbol for beta (default: 'SPY').
+        db: Database instance. If None, creates a new instance.
+        price_downloader: PriceDownloader instance. If None, creates a new instance.
+
+    Returns:
+        RiskBundle with the period's metrics. Beta is None when the benchmark
+        prices cannot be loaded.
+    """
+    if db is None:
+        from ..database import Database
+
+        db = Database()
+
+    if price_downloader is None:
+        from ..prices.downloader import PriceDownloader
+
+        price_downloader = PriceDownloader(db=db)
+
+    values: Dict[date, float] = {}
+    current_date = start_date
+    while current_date <= end_date:
+        values[current_date] = _portfolio_value(
+            account_id, current_date, db, price_downloader
+        )
+        current_date += timedelta(days=1)
+    volatility = volatility_from_values(values)
+
+    # Sharpe ratio uses the total return percentage over the period
+    start_value = values.get(start_date)
+    if start_value is None:
+        start_value = _portfolio_value(account_id, start_date, db, price_downloader)
+    if start_value == 0:
+        portfolio_return = 0.0
+    else:
+        cash_flows = get_cash_flows(account_id, start_date, end_date, db)
+        portfolio_return = _total_return(
+            account_id, start_date, end_date, cash_flows, db, price_downloader
+        ) / start_value
+
+    try:
+        benchmark_prices = get_prices(benchmark_symbol, start_date, end_date, db)
+        beta = beta_from_values(values, benchmark_prices)
+    except Exception as e:
+        logger.warning(f"Could not calculate beta vs {benchmark_symbol}: {e}")
+        beta = None
+
+    return RiskBundle(
+        sharpe_ratio=sharpe_from_return(
+            portfolio_return, volatility, start_date, end_date, risk_free_rate
+        ),
+        max_drawdown=max_drawdown_from_values(values),
+        volatility=volatility,
+        beta=beta,
+    )
+
+
+def _total_return(
+    account_id: int,
+    start_date: date,
+    end_date: date,
+    cash_flows: List[Dict[str, Any]],
+    db: Database,
+    price_downloader: PriceDownloader,
+) -> float:
+    """Calculate total return (realized + unrealized gains + dividends).
+
+    Args:
+        account_id: Account ID.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        cash_flows: Cash flows in the period, as returned by get_cash_flows.
+        db: Database instance.
+        price_downloader: PriceDownloader instance.
+
+    Returns:
+        Total return amount, as returned by calculate_total_return.
+    """
+    realized = calculate_realized_gains(account_id, start_date, end_date, db)
+    unrealized = calculate_unrealized_gains(
+        account_id, end_date, db, price_downloader
+    )
+    dividends = sum(
+        cf["amount"] for cf in cash_flows if cf["type"] == "DIVIDEND"
+    )
+    return realized + unrealized + dividends
+
+
+def _portfolio_value(
+    account_id: int,
+    value_date: date,
+    db: Database,
+    price_downloader: PriceDownloader,
+) -> float:
+    """Get the portfolio value at a date, reusing it until the database changes.
+
+    Args:
+        account_id: Account ID.
+        value_date: Valuation date.
+        db: Database instance.
+        price_downloader: PriceDownloader instance.
+
+    Returns:
+        Total portfolio value, as returned by calculate_portfolio_value.
+    """
+    key = (account_id, value_date.toordinal())
+    value = _portfolio_value_cache.get(db, key)
+    if value is None:
+        value = calculate_portfolio_value(account_id, value_date, db, price_downloader)
+        _portfolio_value_cache.put(db, key, value)
+    return value
@@ -5,18 +5,73 @@ tracking cost basis and calculating PnL per sale.
 """
 
 from typing import Dict, Optional, List
-from datetime import date
+from datetime import date, timedelta
 import logging
 
 from ..database import Database
-from ..models.queries import get_transactions_by_account
+from ..models.transaction import Transaction
+from ..models.queries import get_transactions_by_account, get_transactions_by_type
 from ..engine.positions import get_positions
+from ..engine.portfolio_value import get_frequency_delta
 
 logger = logging.getLogger(__name__)
 
 
+def _get_sales(
+    account_id: Optional[int],
+    start_date: date,
+    end_date: date,
+    db: Database,
+) -> List[Transaction]:
+    """Get the SELL transactions in a date range that a gain can be computed for.
+
+    Args:
+        account_id: Account ID, or None for all accounts.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        db: Database instance.
+
+    Returns:
+        SELL transactions with a symbol, quantity and price.
+    """
+    if account_id is None:
+        # One query across all accounts instead of one per account
+        transactions = get_transactions_by_type("SELL", start_date, end_date, db)
+    else:
+        transactions = get_transactions_by_account(
+            account_id, start_date=start_date, end_date=end_date, db=db
+        )
+
+    return [
+        t for t in transactions
+        if t.type == "SELL" and t.symbol and t.qty is not None and t.price is not None
+    ]
+
+
+def _realized_gain(sale: Transaction, db: Database) -> Optional[float]:
+    """Calculate the realized gain/loss of one sale.
+
+    Args:
+        sale: SELL transaction.
+        db: Database instance.
+
+    Returns:
+        Proceeds minus cost basis, or None if the account held no position in
+        the symbol before the sale.
+    """
+    # Positions the day before the sale give the cost basis (PRU) of the sold shares
+    positions = get_positions(sale.account_id, sale.date - timedelta(days=1), db)
+    position = positions.get(sale.symbol.upper())
+    if position is None:
+        return None
+
+    cost_basis = sale.qty * position["avg_price"]
+    proceeds = (sale.qty * sale.price) - (sale.fee or 0.0)
+    return proceeds - cost_basis
+
+
 def calculate_realized_gains(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
@@ -27,7 +82,7 @@ def calculate_realized_gains(
     the cost basis of sold positions and comparing to sale proceeds.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
@@ -40,56 +95,22 @@ def calculate_realized_gains(
 
         db = Database()
 
-    # Get all SELL transactions in date range
-    transactions = get_transactions_by_account(
-        account_id, start_date=start_date, end_date=end_date, db=db
-    )
-
     total_realized = 0.0
 
-    for transaction in transactions:
-        if transaction.type != "SELL":
-            continue
-
-        if not transaction.symbol or transaction.qty is None or transaction.price is None:
-            continue
-
-        symbol = transaction.symbol.upper()
-        sell_qty = transaction.qty
-        sell_price = transaction.price
-        sell_fee = transaction.fee or 0.0
-
-        # Get positions just before this sale to get cost basis
-        # Use transaction date minus 1 day to get position before sale
-        from datetime import timedelta
-
-        position_date = transaction.date - timedelta(days=1)
-        positions = get_positions(account_id, position_date, db)
-
-        if symbol not in positions:
+    for sale in _get_sales(account_id, start_date, end_date, db):
+        realized = _realized_gain(sale, db)
+        if realized is None:
             logger.warning(
-                f"No position found for {symbol} before SELL on {transaction.date}"
+                f"No position found for {sale.symbol.upper()} before SELL on {sale.date}"
             )
             continue
-
-        position = positions[symbol]
-        avg_cost = position["avg_price"]
-
-        # Calculate cost basis for sold shares
-        cost_basis = sell_qty * avg_cost
-
-        # Calculate proceeds (sale price * qty - fees)
-        proceeds = (sell_qty * sell_price) - sell_fee
-
-        # Realized gain/loss = proceeds - cost basis
-        realized = proceeds - cost_basis
         total_realized += realized
 
     return total_realized
 
 
 def get_realized_gains_by_symbol(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
@@ -97,7 +118,7 @@ def get_realized_gains_by_symbol(
     """Get realized gains/losses broken down by symbol.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
@@ -110,57 +131,35 @@ def get_realized_gains_by_symbol(
 
         db = Database()
 
-    transactions = get_transactions_by_account(
-        account_id, start_date=start_date, end_date=end_date, db=db
-    )
-
     gains_by_symbol: Dict[str, float] = {}
 
-    for transaction in transactions:
-        if transaction.type != "SELL":
-            continue
-
-        if not transaction.symbol or transaction.qty is None or transaction.price is None:
-            continue
-
-        symbol = transaction.symbol.upper()
-
-        if symbol not in gains_by_symbol:
-            gains_by_symbol[symbol] = 0.0
-
-        sell_qty = transaction.qty
-        sell_price = transaction.price
-        sell_fee = transaction.fee or 0.0
-
-        from datetime import timedelta
-
-        position_date = transaction.date - timedelta(days=1)
-        positions = get_positions(account_id, position_date, db)
-
-        if symbol in positions:
-            position = positions[symbol]
-            avg_cost = position["avg_price"]
-            cost_basis = sell_qty * avg_cost
-            proceeds = (sell_qty * sell_price) - sell_fee
-            realized = proceeds - cost_basis
-            gains_by_symbol[symbol] += realized
+    for sale in _get_sales(account_id, start_date, end_date, db):
+        symbol = sale.symbol.upper()
+        realized = _realized_gain(sale, db)
+        gains_by_symbol[symbol] = gains_by_symbol.get(symbol, 0.0) + (realized or 0.0)
 
     return gains_by_symbol
 
 
 def get_realized_gains_history(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
+    frequency: str = "daily",
 ) -> Dict[date, float]:
     """Get realized gains history over time.
 
+    Each sale's gain is calculated once and accumulated by date, rather than
+    recalculating every sale for each day of the range.
+
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
+        frequency: Frequency of history points ('daily', 'weekly', 'monthly').
+            Each point includes every sale up to its date.
 
     Returns:
         Dictionary mapping date -> cumulative realized gains up to that date.
@@ -170,17 +169,25 @@ def get_realized_gains_history(
 
         db = Database()
 
-    from datetime import timedelta
+    gains_by_date: Dict[date, float] = {}
+    for sale in _get_sales(account_id, start_date, end_date, db):
+        realized = _realized_gain(sale, db)
+        if realized is not None:
+            gains_by_date[sale.date] = gains_by_date.get(sale.date, 0.0) + realized
 
+    sale_dates = sorted(gains_by_date)
+    next_sale = 0
     history: Dict[date, float] = {}
     cumulative = 0.0
     current_date = start_date
+    delta = get_frequency_delta(frequency)
 
     while current_date <= end_date:
-        # Calculate realized gains up to this date
-        gains = calculate_realized_gains(account_id, start_date, current_date, db)
-        history[current_date] = gains
-        current_date += timedelta(days=1)
+        # Add the sales since the previous point
+        while next_sale < len(sale_dates) and sale_dates[next_sale] <= current_date:
+            cumulative += gains_by_date[sale_dates[next_sale]]
+            next_sale += 1
+        history[current_date] = cumulative
+        current_date += delta
 
     return history
-
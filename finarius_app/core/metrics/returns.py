@@ -4,17 +4,20 @@ This module handles calculation of various return metrics including
 total return, CAGR, IRR, and TWRR.
 """
 
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from datetime import date, timedelta
 import logging
 import math
 
+import numpy as np
+
 from ..database import Database
 from ..prices.downloader import PriceDownloader
 from ..engine.portfolio_value import calculate_portfolio_value
 from ..engine.cash_flows import get_cash_flows
 from .realized_gains import calculate_realized_gains
 from .unrealized_gains import calculate_unrealized_gains
+from .kernels import irr_kernel
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +151,23 @@ def calculate_cagr(
         account_id, end_date, db, price_downloader
     )
 
+    return cagr_from_values(start_date, end_date, start_value, end_value)
+
+
+def cagr_from_values(
+    start_date: date, end_date: date, start_value: float, end_value: float
+) -> float:
+    """Calculate CAGR from already computed start and end portfolio values.
+
+    Args:
+        start_date: Start date.
+        end_date: End date.
+        start_value: Portfolio value at start date.
+        end_value: Portfolio value at end date.
+
+    Returns:
+        CAGR as decimal, as returned by calculate_cagr.
+    """
     if start_value <= 0:
         return 0.0
 
@@ -248,11 +268,40 @@ def calculate_irr(
     # Get cash flows
     cash_flows = get_cash_flows(account_id, start_date, end_date, db)
 
-    # Get portfolio value at end date
+    # Get portfolio values at start and end date
+    start_value = calculate_portfolio_value(
+        account_id, start_date, db, price_downloader
+    )
     end_value = calculate_portfolio_value(
         account_id, end_date, db, price_downloader
     )
 
+    return irr_from_cash_flows(
+        cash_flows, start_date, end_date, start_value, end_value, guess
+    )
+
+
+def irr_from_cash_flows(
+    cash_flows: List[Dict[str, Any]],
+    start_date: date,
+    end_date: date,
+    start_value: float,
+    end_value: float,
+    guess: float = 0.1,
+) -> Optional[float]:
+    """Calculate IRR from already loaded cash flows and portfolio values.
+
+    Args:
+        cash_flows: Cash flows in the period, as returned by get_cash_flows.
+        start_date: Start date.
+        end_date: End date.
+        start_value: Portfolio value at start date.
+        end_value: Portfolio value at end date.
+        guess: Initial guess for IRR (default: 0.1 = 10%).
+
+    Returns:
+        IRR as decimal, or None if calculation fails.
+    """
     # Build cash flow list: negative for outflows (deposits), positive for inflows
     # Include final portfolio value as positive cash flow
     flows: List[float] = []
@@ -268,9 +317,6 @@ def calculate_irr(
         dates.append(cf["date"])
 
     # Add initial portfolio value (if any) as negative
-    start_value = calculate_portfolio_value(
-        account_id, start_date, db, price_downloader
-    )
     if start_value > 0:
         flows.insert(0, -start_value)
         dates.insert(0, start_date)
@@ -283,46 +329,14 @@ def calculate_irr(
     if len(flows) < 2:
         return None
 
-    # Calculate IRR using Newton-Raphson method
-    def npv(rate: float) -> float:
-        """Calculate Net Present Value at given rate."""
-        total = 0.0
-        for i, (flow, flow_date) in enumerate(zip(flows, dates)):
-            days = (flow_date - dates[0]).days
-            years = days / 365.25
-            total += flow / ((1.0 + rate) ** years)
-        return total
-
-    def npv_derivative(rate: float) -> float:
-        """Calculate derivative of NPV at given rate."""
-        total = 0.0
-        for i, (flow, flow_date) in enumerate(zip(flows, dates)):
-            days = (flow_date - dates[0]).days
-            years = days / 365.25
-            total -= (years * flow) / ((1.0 + rate) ** (years + 1))
-        return total
-
-    # Newton-Raphson iteration
-    rate = guess
-    max_iterations = 100
-    tolerance = 1e-6
+    # Newton-Raphson iteration in a compiled kernel; flow times in years
+    first_date = dates[0]
+    years = np.array([(d - first_date).days for d in dates], dtype=np.float64) / 365.25
+    rate = irr_kernel(np.array(flows, dtype=np.float64), years, guess)
 
-    for _ in range(max_iterations):
-        npv_val = npv(rate)
-        if abs(npv_val) < tolerance:
-            return rate
-
-        derivative = npv_derivative(rate)
-        if abs(derivative) < tolerance:
-            break
-
-        rate = rate - npv_val / derivative
-
-        # Prevent negative rates that are too extreme
-        if rate < -0.99:
-            rate = -0.99
-
-    return None
+    if math.isnan(rate):
+        return None
+    return float(rate)
 
 
 def get_irr_history(
@@ -402,6 +416,33 @@ def calculate_twrr(
     # Get cash flows to identify periods
     cash_flows = get_cash_flows(account_id, start_date, end_date, db)
 
+    return twrr_from_cash_flows(
+        cash_flows,
+        start_date,
+        end_date,
+        lambda value_date: calculate_portfolio_value(
+            account_id, value_date, db, price_downloader
+        ),
+    )
+
+
+def twrr_from_cash_flows(
+    cash_flows: List[Dict[str, Any]],
+    start_date: date,
+    end_date: date,
+    value_at: Callable[[date], float],
+) -> float:
+    """Calculate TWRR from already loaded cash flows.
+
+    Args:
+        cash_flows: Cash flows in the period, as returned by get_cash_flows.
+        start_date: Start date.
+        end_date: End date.
+        value_at: Function returning the portfolio value at a date.
+
+    Returns:
+        TWRR as decimal, as returned by calculate_twrr.
+    """
     # Get all dates with cash flows
     cf_dates = sorted(set(cf["date"] for cf in cash_flows))
     cf_dates.append(end_date)
@@ -409,18 +450,14 @@ def calculate_twrr(
     # Calculate period returns
     period_returns: List[float] = []
     prev_date = start_date
-    prev_value = calculate_portfolio_value(
-        account_id, prev_date, db, price_downloader
-    )
+    prev_value = value_at(prev_date)
 
     for cf_date in cf_dates:
         if cf_date <= prev_date:
             continue
 
         # Get value at end of period (before cash flow)
-        period_end_value = calculate_portfolio_value(
-            account_id, cf_date, db, price_downloader
-        )
+        period_end_value = value_at(cf_date)
 
         if prev_value > 0:
             period_return = (period_end_value - prev_value) / prev_value
@@ -9,9 +9,12 @@ from datetime import date, timedelta
 import logging
 import math
 
+import numpy as np
+
 from ..database import Database
 from ..prices.downloader import PriceDownloader
 from ..engine.portfolio_value import calculate_portfolio_value_over_time
+from ..models.price import Price
 from ..models.queries import get_prices
 from .returns import calculate_total_return_percentage
 
@@ -51,8 +54,6 @@ def calculate_sharpe_ratio(
 
         price_downloader = PriceDownloader(db=db)
 
-    from ..metrics.returns import calculate_total_return_percentage
-
     # Calculate portfolio return
     portfolio_return = calculate_total_return_percentage(
         account_id, start_date, end_date, db, price_downloader
@@ -63,6 +64,30 @@ def calculate_sharpe_ratio(
         account_id, start_date, end_date, db, price_downloader
     )
 
+    return sharpe_from_return(
+        portfolio_return, volatility, start_date, end_date, risk_free_rate
+    )
+
+
+def sharpe_from_return(
+    portfolio_return: float,
+    volatility: float,
+    start_date: date,
+    end_date: date,
+    risk_free_rate: float = 0.02,
+) -> Optional[float]:
+    """Calculate Sharpe ratio from an already computed return and volatility.
+
+    Args:
+        portfolio_return: Total return over the period as decimal.
+        volatility: Annualized volatility as decimal.
+        start_date: Start date.
+        end_date: End date.
+        risk_free_rate: Risk-free rate as decimal (default: 0.02 = 2%).
+
+    Returns:
+        Sharpe ratio, as returned by calculate_sharpe_ratio.
+    """
     if volatility == 0:
         return None
 
@@ -116,24 +141,27 @@ def calculate_max_drawdown(
         account_id, start_date, end_date, "daily", db, price_downloader
     )
 
-    if len(values) < 2:
-        return 0.0
+    return max_drawdown_from_values(values)
 
-    # Calculate drawdowns
-    sorted_dates = sorted(values.keys())
-    peak = values[sorted_dates[0]]
-    max_drawdown = 0.0
 
-    for d in sorted_dates:
-        value = values[d]
-        if value > peak:
-            peak = value
-        else:
-            drawdown = (peak - value) / peak if peak > 0 else 0.0
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+def max_drawdown_from_values(values: Dict[date, float]) -> float:
+    """Calculate maximum drawdown from already computed portfolio values.
 
-    return max_drawdown
+    Args:
+        values: Dictionary mapping date -> portfolio value.
+
+    Returns:
+        Maximum drawdown as decimal, as returned by calculate_max_drawdown.
+    """
+    if len(values) < 2:
+        return 0.0
+
+    series = _values_array(values)
+    # Running peak up to each date; no drawdown while the peak is zero
+    peaks = np.maximum.accumulate(series)
+    positive = peaks > 0
+    drawdowns = (peaks - series) / np.where(positive, peaks, 1.0)
+    return float(max(np.where(positive, drawdowns, 0.0).max(), 0.0))
 
 
 def calculate_volatility(
@@ -170,33 +198,32 @@ def calculate_volatility(
         account_id, start_date, end_date, "daily", db, price_downloader
     )
 
-    if len(values) < 2:
-        return 0.0
+    return volatility_from_values(values)
 
-    # Calculate daily returns
-    sorted_dates = sorted(values.keys())
-    returns: List[float] = []
 
-    for i in range(1, len(sorted_dates)):
-        prev_value = values[sorted_dates[i - 1]]
-        curr_value = values[sorted_dates[i]]
+def volatility_from_values(values: Dict[date, float]) -> float:
+    """Calculate annualized volatility from already computed daily portfolio values.
 
-        if prev_value > 0:
-            daily_return = (curr_value - prev_value) / prev_value
-            returns.append(daily_return)
+    Args:
+        values: Dictionary mapping date -> portfolio value.
 
-    if len(returns) < 2:
+    Returns:
+        Volatility as decimal, as returned by calculate_volatility.
+    """
+    if len(values) < 2:
         return 0.0
 
-    # Calculate standard deviation
-    mean_return = sum(returns) / len(returns)
-    variance = sum((r - mean_return) ** 2 for r in returns) / (len(returns) - 1)
-    volatility = math.sqrt(variance)
+    # Daily returns, skipping days that start from a zero value
+    series = _values_array(values)
+    prev_values = series[:-1]
+    valid = prev_values > 0
+    returns = (series[1:][valid] - prev_values[valid]) / prev_values[valid]
 
-    # Annualize (assuming daily returns)
-    volatility = volatility * math.sqrt(252)  # 252 trading days per year
+    if returns.size < 2:
+        return 0.0
 
-    return volatility
+    # Annualize the sample standard deviation (252 trading days per year)
+    return float(returns.std(ddof=1) * math.sqrt(252))
 
 
 def calculate_beta(
@@ -240,53 +267,61 @@ def calculate_beta(
     # Get benchmark prices
     benchmark_prices = get_prices(benchmark_symbol, start_date, end_date, db)
 
-    if len(benchmark_prices) < 2 or len(portfolio_values) < 2:
-        return None
+    return beta_from_values(portfolio_values, benchmark_prices)
 
-    # Build aligned price series
-    portfolio_returns: List[float] = []
-    benchmark_returns: List[float] = []
 
-    sorted_portfolio_dates = sorted(portfolio_values.keys())
-    benchmark_dict = {p.date: p.close for p in benchmark_prices}
-
-    for i in range(1, len(sorted_portfolio_dates)):
-        date_key = sorted_portfolio_dates[i]
-        prev_date = sorted_portfolio_dates[i - 1]
-
-        if date_key not in benchmark_dict or prev_date not in benchmark_dict:
-            continue
+def beta_from_values(
+    portfolio_values: Dict[date, float], benchmark_prices: List[Price]
+) -> Optional[float]:
+    """Calculate beta from already computed portfolio values and benchmark prices.
 
-        portfolio_prev = portfolio_values[prev_date]
-        portfolio_curr = portfolio_values[date_key]
-        benchmark_prev = benchmark_dict[prev_date]
-        benchmark_curr = benchmark_dict[date_key]
+    Only days where both the day and the day before have a benchmark price,
+    and both previous values are positive, are compared.
 
-        if portfolio_prev > 0 and benchmark_prev > 0:
-            portfolio_ret = (portfolio_curr - portfolio_prev) / portfolio_prev
-            benchmark_ret = (benchmark_curr - benchmark_prev) / benchmark_prev
-            portfolio_returns.append(portfolio_ret)
-            benchmark_returns.append(benchmark_ret)
+    Args:
+        portfolio_values: Dictionary mapping date -> portfolio value.
+        benchmark_prices: Benchmark Price instances over the same period.
 
-    if len(portfolio_returns) < 2:
+    Returns:
+        Beta value, as returned by calculate_beta.
+    """
+    if len(benchmark_prices) < 2 or len(portfolio_values) < 2:
         return None
 
-    # Calculate covariance and variance
-    portfolio_mean = sum(portfolio_returns) / len(portfolio_returns)
-    benchmark_mean = sum(benchmark_returns) / len(benchmark_returns)
+    # Build aligned price series, NaN where the benchmark has no price
+    sorted_dates = sorted(portfolio_values)
+    benchmark_dict = {p.date: p.close for p in benchmark_prices}
+    portfolio = np.array([portfolio_values[d] for d in sorted_dates], dtype=np.float64)
+    benchmark = np.array(
+        [benchmark_dict.get(d, np.nan) for d in sorted_dates], dtype=np.float64
+    )
 
-    covariance = sum(
-        (portfolio_returns[i] - portfolio_mean) * (benchmark_returns[i] - benchmark_mean)
-        for i in range(len(portfolio_returns))
-    ) / (len(portfolio_returns) - 1)
+    portfolio_prev = portfolio[:-1]
+    benchmark_prev = benchmark[:-1]
+    # NaN comparisons are False, so days without a benchmark price drop out
+    valid = (portfolio_prev > 0) & (benchmark_prev > 0) & ~np.isnan(benchmark[1:])
+    if np.count_nonzero(valid) < 2:
+        return None
 
-    benchmark_variance = sum(
-        (r - benchmark_mean) ** 2 for r in benchmark_returns
-    ) / (len(benchmark_returns) - 1)
+    portfolio_returns = (portfolio[1:][valid] - portfolio_prev[valid]) / portfolio_prev[valid]
+    benchmark_returns = (benchmark[1:][valid] - benchmark_prev[valid]) / benchmark_prev[valid]
 
+    benchmark_variance = benchmark_returns.var(ddof=1)
     if benchmark_variance == 0:
         return None
 
-    beta = covariance / benchmark_variance
-    return beta
+    covariance = np.cov(portfolio_returns, benchmark_returns)[0, 1]
+    return float(covariance / benchmark_variance)
+
+
+def _values_array(values: Dict[date, float]) -> np.ndarray:
+    """Get portfolio values as a float64 array ordered by date.
+
+    Args:
+        values: Dictionary mapping date -> portfolio value.
+
+    Returns:
+        Array of the values sorted by date.
+    """
+    return np.array([values[d] for d in sorted(values)], dtype=np.float64)
 
@@ -12,12 +12,13 @@ from ..database import Database
 from ..prices.downloader import PriceDownloader
 from ..models.queries import get_price
 from ..engine.positions import get_positions
+from ..engine.portfolio_value import get_frequency_delta
 
 logger = logging.getLogger(__name__)
 
 
 def calculate_unrealized_gains(
-    account_id: int,
+    account_id: Optional[int],
     gains_date: date,
     db: Optional[Database] = None,
     price_downloader: Optional[PriceDownloader] = None,
@@ -28,7 +29,7 @@ def calculate_unrealized_gains(
     of positions to their cost basis.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         gains_date: Date to calculate unrealized gains.
         db: Database instance. If None, creates a new instance.
         price_downloader: PriceDownloader instance. If None, creates a new instance.
@@ -79,7 +80,7 @@ def calculate_unrealized_gains(
 
 
 def get_unrealized_gains_by_symbol(
-    account_id: int,
+    account_id: Optional[int],
     gains_date: date,
     db: Optional[Database] = None,
     price_downloader: Optional[PriceDownloader] = None,
@@ -87,7 +88,7 @@ def get_unrealized_gains_by_symbol(
     """Get unrealized gains/losses broken down by symbol.
 
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         gains_date: Date to calculate unrealized gains.
         db: Database instance. If None, creates a new instance.
         price_downloader: PriceDownloader instance. If None, creates a new instance.
@@ -136,20 +137,25 @@ def get_unrealized_gains_by_symbol(
 
 
 def get_unrealized_gains_history(
-    account_id: int,
+    account_id: Optional[int],
     start_date: date,
     end_date: date,
     db: Optional[Database] = None,
     price_downloader: Optional[PriceDownloader] = None,
+    frequency: str = "daily",
 ) -> Dict[date, float]:
     """Get unrealized gains history over time.
 
+    Only the sampled dates are valued, so a weekly history costs a seventh
+    of a daily one.
+
     Args:
-        account_id: Account ID.
+        account_id: Account ID, or None for all accounts.
         start_date: Start date (inclusive).
         end_date: End date (inclusive).
         db: Database instance. If None, creates a new instance.
         price_downloader: PriceDownloader instance. If None, creates a new instance.
+        frequency: Frequency of history points ('daily', 'weekly', 'monthly').
 
     Returns:
         Dictionary mapping date -> unrealized gains at that date.
@@ -164,17 +170,16 @@ def get_unrealized_gains_history(
 
         price_downloader = PriceDownloader(db=db)
 
-    from datetime import timedelta
-
     history: Dict[date, float] = {}
     current_date = start_date
+    delta = get_frequency_delta(frequency)
 
     while current_date <= end_date:
         unrealized = calculate_unrealized_gains(
             account_id, current_date, db, price_downloader
         )
         history[current_date] = unrealized
-        current_date += timedelta(days=1)
+        current_date += delta
 
     return history
 
@@ -10,12 +10,18 @@ from .price import Price
 from .queries import (
     get_account_by_id,
     get_account_by_name,
+    get_accounts_by_ids,
     get_all_accounts,
     get_transaction_by_id,
     get_transactions_by_account,
+    count_transactions_by_account,
+    get_transactions_by_account_with_account,
     get_transactions_by_symbol,
+    get_transactions_by_type,
     get_price,
     get_prices,
+    get_bracketing_prices,
+    get_closes,
     get_latest_price,
 )
 
@@ -27,12 +33,18 @@ __all__ = [
     # Query helpers
     "get_account_by_id",
     "get_account_by_name",
+    "get_accounts_by_ids",
     "get_all_accounts",
     "get_transaction_by_id",
     "get_transactions_by_account",
+    "count_transactions_by_account",
+    "get_transactions_by_account_with_account",
     "get_transactions_by_symbol",
+    "get_transactions_by_type",
     "get_price",
     "get_prices",
+    "get_bracketing_prices",
+    "get_closes",
     "get_latest_price",
 ]
 
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 class Account:
     """Account model representing a portfolio account."""
 
+    __slots__ = ("id", "name", "currency", "created_at", "updated_at")
+
     def __init__(
         self,
         name: str,
@@ -51,7 +53,7 @@ class Account:
         """Save account to database.
 
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
 
         Returns:
             Self with updated ID and timestamps.
@@ -61,24 +63,20 @@ class Account:
             sqlite3.IntegrityError: If name already exists.
         """
         if db is None:
-            db = Database()
+            db = Database.get()
 
         self.validate()
 
         if self.id is None:
             # Insert new account
-            db.execute(
+            result = db.execute_returning(
                 """
                 INSERT INTO accounts (name, currency)
                 VALUES (?, ?)
+                RETURNING id, created_at, updated_at
                 """,
                 (self.name, self.currency),
             )
-            # Get the inserted ID
-            result = db.fetchone(
-                "SELECT id, created_at, updated_at FROM accounts WHERE name = ?",
-                (self.name,),
-            )
             if result:
                 self.id = result["id"]
                 self.created_at = result["created_at"]
@@ -105,13 +103,13 @@ class Account:
         """Delete account from database.
 
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
 
         Raises:
             ValueError: If account ID is not set.
         """
         if db is None:
-            db = Database()
+            db = Database.get()
 
         if self.id is None:
             raise ValueError("Cannot delete account without ID")
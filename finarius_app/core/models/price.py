@@ -1,17 +1,65 @@
 """Price model for Finarius portfolio tracking application."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Literal, Tuple
 from datetime import date
 import logging
+import sqlite3
+import sys
 
 from ..database import Database
 
 logger = logging.getLogger(__name__)
 
+# Bound here because __init__'s ``date`` parameter shadows the datetime.date class
+_parse_iso_date = date.fromisoformat
+
+# INSERT variants used by Price.save_many and Price.save_rows, keyed by write mode
+_INSERT_VERBS = {
+    "ignore": "INSERT OR IGNORE",
+    "upsert": "INSERT OR REPLACE",
+}
+
+# Normalized (uppercase) symbols keyed by the raw input, so repeated tickers reuse
+# one interned string instead of building a new one on every call
+_SYMBOL_CACHE: Dict[str, str] = {}
+_SYMBOL_CACHE_MAX_SIZE = 4096
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Return the uppercase form of a symbol, reusing cached strings.
+
+    Args:
+        symbol: Stock symbol in any case.
+
+    Returns:
+        Uppercase symbol.
+    """
+    normalized = _SYMBOL_CACHE.get(symbol)
+    if normalized is None:
+        normalized = sys.intern(symbol if symbol.isupper() else symbol.upper())
+        if len(_SYMBOL_CACHE) >= _SYMBOL_CACHE_MAX_SIZE:
+            _SYMBOL_CACHE.clear()
+        _SYMBOL_CACHE[symbol] = normalized
+    return normalized
+
+
+# Raw price row: (symbol, ISO date, close, open, high, low, volume)
+PriceRow = Tuple[str, str, float, Optional[float], Optional[float], Optional[float], Optional[int]]
+
+
+def _check_save_mode(mode: str) -> None:
+    """Raise ValueError if mode is not a Price.save_rows write mode."""
+    if mode not in _INSERT_VERBS:
+        raise ValueError(
+            f"Invalid save mode: {mode}. Must be one of: {', '.join(_INSERT_VERBS)}"
+        )
+
 
 class Price:
     """Price model representing market price data."""
 
+    __slots__ = ("symbol", "date", "close", "open", "high", "low", "volume", "created_at")
+
     def __init__(
         self,
         symbol: str,
@@ -35,12 +83,9 @@ class Price:
             volume: Trading volume.
             created_at: Creation timestamp.
         """
-        self.symbol = symbol.upper()
+        self.symbol = _normalize_symbol(symbol)
         # Handle both date objects and date strings
-        if isinstance(date, str):
-            self.date = date.fromisoformat(date)
-        else:
-            self.date = date
+        self.date = _parse_iso_date(date) if type(date) is str else date
         self.close = close
         self.open = open_price
         self.high = high
@@ -54,6 +99,21 @@ class Price:
         Raises:
             ValueError: If validation fails.
         """
+        # Fast path: a single combined check for the common valid case. The
+        # granular checks below only run to build a precise error message.
+        high, low, volume = self.high, self.low, self.volume
+        if (
+            self.symbol
+            and self.symbol.strip()
+            and self.close > 0
+            and (self.open is None or self.open > 0)
+            and (high is None or high > 0)
+            and (low is None or low > 0)
+            and (high is None or low is None or high >= low)
+            and (volume is None or volume >= 0)
+        ):
+            return
+
         if not self.symbol or not self.symbol.strip():
             raise ValueError("Symbol cannot be empty")
         if self.close <= 0:
@@ -73,7 +133,7 @@ class Price:
         """Save price to database.
 
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
 
         Returns:
             Self with updated timestamp.
@@ -82,15 +142,16 @@ class Price:
             ValueError: If validation fails.
         """
         if db is None:
-            db = Database()
+            db = Database.get()
 
         self.validate()
 
         # Use INSERT OR REPLACE for upsert behavior
-        db.execute(
+        result = db.execute_returning(
             """
             INSERT OR REPLACE INTO prices (symbol, date, close, open, high, low, volume)
             VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING created_at
             """,
             (
                 self.symbol,
@@ -102,24 +163,111 @@ class Price:
                 self.volume,
             ),
         )
-        result = db.fetchone(
-            "SELECT created_at FROM prices WHERE symbol = ? AND date = ?",
-            (self.symbol, self.date.isoformat()),
-        )
         if result:
             self.created_at = result["created_at"]
         logger.debug(f"Saved price: {self.symbol} on {self.date}")
 
         return self
 
+    @classmethod
+    def save_many(
+        cls,
+        prices: Iterable["Price"],
+        db: Optional[Database] = None,
+        mode: Literal["ignore", "upsert"] = "upsert",
+    ) -> List["Price"]:
+        """Save multiple prices to database in a single transaction.
+
+        All prices are validated before anything is written, then written with
+        one ``executemany`` call. Unlike :meth:`save`, ``created_at`` is not
+        re-read from the database.
+
+        Args:
+            prices: Price instances to save.
+            db: Database instance. If None, uses the shared instance.
+            mode: Conflict handling for existing (symbol, date) rows: 'upsert'
+                replaces them like :meth:`save`; 'ignore' keeps them, which
+                skips the delete-and-reinsert for first-time population.
+
+        Returns:
+            List of saved Price instances.
+
+        Raises:
+            ValueError: If validation fails or mode is unknown.
+        """
+        _check_save_mode(mode)
+
+        if db is None:
+            db = Database.get()
+
+        prices = list(prices)
+        if not prices:
+            return prices
+
+        for price in prices:
+            price.validate()
+
+        cls.save_rows(
+            [
+                (p.symbol, p.date.isoformat(), p.close, p.open, p.high, p.low, p.volume)
+                for p in prices
+            ],
+            db,
+            mode,
+        )
+
+        return prices
+
+    @classmethod
+    def save_rows(
+        cls,
+        rows: Iterable[PriceRow],
+        db: Optional[Database] = None,
+        mode: Literal["ignore", "upsert"] = "upsert",
+    ) -> int:
+        """Save raw price rows to database in a single transaction.
+
+        Rows are streamed straight into ``executemany`` without building Price
+        instances, so a generator keeps memory flat on large backfills. Rows are
+        not validated: symbols must already be uppercase and values normalized.
+
+        Args:
+            rows: Tuples of (symbol, ISO date, close, open, high, low, volume).
+            db: Database instance. If None, uses the shared instance.
+            mode: Conflict handling for existing (symbol, date) rows, as for
+                :meth:`save_many`.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: If mode is unknown.
+        """
+        _check_save_mode(mode)
+
+        if db is None:
+            db = Database.get()
+
+        cursor = db.executemany(
+            f"""
+            {_INSERT_VERBS[mode]} INTO prices (symbol, date, close, open, high, low, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        count = max(cursor.rowcount, 0)
+        logger.debug(f"Saved {count} prices (mode: {mode})")
+
+        return count
+
     def delete(self, db: Optional[Database] = None) -> None:
         """Delete price from database.
 
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
         """
         if db is None:
-            db = Database()
+            db = Database.get()
 
         db.execute(
             "DELETE FROM prices WHERE symbol = ? AND date = ?",
@@ -190,3 +338,26 @@ class Price:
             created_at=data.get("created_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Price":
+        """Create Price instance directly from a prices table row.
+
+        Reads the columns straight from the row instead of going through an
+        intermediate dict. The row must contain every column of PRICE_COLS.
+
+        Args:
+            row: Row from the prices table.
+
+        Returns:
+            Price instance.
+        """
+        return cls(
+            symbol=row["symbol"],
+            date=date.fromisoformat(row["date"]),
+            close=row["close"],
+            open_price=row["open"],
+            high=row["high"],
+            low=row["low"],
+            volume=row["volume"],
+            created_at=row["created_at"],
+        )
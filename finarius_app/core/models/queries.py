@@ -1,12 +1,100 @@
 """Query helper functions for Finarius models."""
 
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterable, Tuple
 from datetime import date
 
+import numpy as np
+
 from ..database import Database
 from .account import Account
 from .transaction import Transaction
-from .price import Price
+from .price import Price, _normalize_symbol
+
+# Explicit column projections used instead of SELECT *
+ACCOUNT_COLS = "id, name, currency, created_at, updated_at"
+TRANSACTION_COLS = "id, date, account_id, type, symbol, qty, price, fee, notes, created_at"
+PRICE_COLS = "symbol, date, close, open, high, low, volume, created_at"
+# Reduced projection for callers that only need closing prices
+PRICE_SUMMARY_COLS = "symbol, date, close"
+
+
+def _build_date_range_queries(
+    base: str, date_column: str, order_by: str
+) -> Dict[Tuple[bool, bool], str]:
+    """Precompute the SQL variants of a date-range query.
+
+    Args:
+        base: SELECT ... WHERE ... prefix of the query.
+        date_column: Column the optional start/end bounds apply to.
+        order_by: ORDER BY clause.
+
+    Returns:
+        Dictionary mapping (has_start_date, has_end_date) -> SQL string.
+    """
+    return {
+        (has_start, has_end): base
+        + (f" AND {date_column} >= ?" if has_start else "")
+        + (f" AND {date_column} <= ?" if has_end else "")
+        + f" ORDER BY {order_by}"
+        for has_start in (False, True)
+        for has_end in (False, True)
+    }
+
+
+def _date_range_params(
+    leading: Any, start_date: Optional[date], end_date: Optional[date]
+) -> Tuple[Any, ...]:
+    """Build the parameter tuple matching a precomputed date-range query.
+
+    Args:
+        leading: Value bound to the first placeholder (account ID or symbol).
+        start_date: Start date or None.
+        end_date: End date or None.
+
+    Returns:
+        Tuple of query parameters.
+    """
+    params: List[Any] = [leading]
+    if start_date:
+        params.append(start_date.isoformat() if isinstance(start_date, date) else str(start_date))
+    if end_date:
+        params.append(end_date.isoformat() if isinstance(end_date, date) else str(end_date))
+    return tuple(params)
+
+
+# Date-range queries keyed by (has_start_date, has_end_date), built once at import
+_TRANSACTIONS_BY_ACCOUNT_QUERIES = _build_date_range_queries(
+    f"SELECT {TRANSACTION_COLS} FROM transactions WHERE account_id = ?",
+    "date",
+    "date DESC, id DESC",
+)
+_TRANSACTIONS_WITH_ACCOUNT_QUERIES = _build_date_range_queries(
+    """
+        SELECT t.id, t.date, t.account_id, t.type, t.symbol, t.qty, t.price, t.fee,
+               t.notes, t.created_at, a.name AS a_name, a.currency AS a_currency,
+               a.created_at AS a_created_at, a.updated_at AS a_updated_at
+        FROM transactions t
+        JOIN accounts a ON a.id = t.account_id
+        WHERE t.account_id = ?""",
+    "t.date",
+    "t.date DESC, t.id DESC",
+)
+_TRANSACTIONS_BY_SYMBOL_QUERIES = _build_date_range_queries(
+    f"SELECT {TRANSACTION_COLS} FROM transactions WHERE symbol = ?",
+    "date",
+    "date DESC, id DESC",
+)
+_TRANSACTIONS_BY_TYPE_QUERIES = _build_date_range_queries(
+    f"SELECT {TRANSACTION_COLS} FROM transactions WHERE type = ?",
+    "date",
+    "date DESC, id DESC",
+)
+_PRICES_QUERIES = _build_date_range_queries(
+    f"SELECT {PRICE_COLS} FROM prices WHERE symbol = ?", "date", "date ASC"
+)
+_CLOSES_QUERIES = _build_date_range_queries(
+    "SELECT date, close FROM prices WHERE symbol = ?", "date", "date ASC"
+)
 
 
 def get_account_by_id(account_id: int, db: Optional[Database] = None) -> Optional[Account]:
@@ -14,15 +102,15 @@ def get_account_by_id(account_id: int, db: Optional[Database] = None) -> Optiona
 
     Args:
         account_id: Account ID.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         Account instance or None if not found.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    result = db.fetchone("SELECT * FROM accounts WHERE id = ?", (account_id,))
+    result = db.fetchone(f"SELECT {ACCOUNT_COLS} FROM accounts WHERE id = ?", (account_id,))
     if result:
         return Account(
             name=result["name"],
@@ -39,15 +127,15 @@ def get_account_by_name(name: str, db: Optional[Database] = None) -> Optional[Ac
 
     Args:
         name: Account name.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         Account instance or None if not found.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    result = db.fetchone("SELECT * FROM accounts WHERE name = ?", (name,))
+    result = db.fetchone(f"SELECT {ACCOUNT_COLS} FROM accounts WHERE name = ?", (name,))
     if result:
         return Account(
             name=result["name"],
@@ -59,19 +147,55 @@ def get_account_by_name(name: str, db: Optional[Database] = None) -> Optional[Ac
     return None
 
 
+def get_accounts_by_ids(
+    account_ids: Iterable[int], db: Optional[Database] = None
+) -> Dict[int, Account]:
+    """Get several accounts by ID with a single query.
+
+    Args:
+        account_ids: Account IDs. Duplicates are ignored.
+        db: Database instance. If None, uses the shared instance.
+
+    Returns:
+        Dictionary mapping account ID -> Account instance. IDs that do not
+        exist are omitted.
+    """
+    ids = list(set(account_ids))
+    if not ids:
+        return {}
+
+    if db is None:
+        db = Database.get()
+
+    placeholders = ", ".join("?" * len(ids))
+    results = db.fetchall(
+        f"SELECT {ACCOUNT_COLS} FROM accounts WHERE id IN ({placeholders})", tuple(ids)
+    )
+    return {
+        row["id"]: Account(
+            name=row["name"],
+            currency=row["currency"],
+            account_id=row["id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+        for row in results
+    }
+
+
 def get_all_accounts(db: Optional[Database] = None) -> List[Account]:
     """Get all accounts.
 
     Args:
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         List of Account instances.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    results = db.fetchall("SELECT * FROM accounts ORDER BY name")
+    results = db.fetchall(f"SELECT {ACCOUNT_COLS} FROM accounts ORDER BY name")
     return [
         Account(
             name=row["name"],
@@ -89,17 +213,19 @@ def get_transaction_by_id(transaction_id: int, db: Optional[Database] = None) ->
 
     Args:
         transaction_id: Transaction ID.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         Transaction instance or None if not found.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    result = db.fetchone("SELECT * FROM transactions WHERE id = ?", (transaction_id,))
+    result = db.fetchone(
+        f"SELECT {TRANSACTION_COLS} FROM transactions WHERE id = ?", (transaction_id,)
+    )
     if result:
-        return Transaction.from_dict(dict(result))
+        return Transaction.from_row(result)
     return None
 
 
@@ -115,28 +241,77 @@ def get_transactions_by_account(
         account_id: Account ID.
         start_date: Start date (inclusive). If None, no start limit.
         end_date: End date (inclusive). If None, no end limit.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         List of Transaction instances.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    query = "SELECT * FROM transactions WHERE account_id = ?"
-    params: List[Any] = [account_id]
+    query = _TRANSACTIONS_BY_ACCOUNT_QUERIES[bool(start_date), bool(end_date)]
+    params = _date_range_params(account_id, start_date, end_date)
 
-    if start_date:
-        query += " AND date >= ?"
-        params.append(start_date.isoformat() if isinstance(start_date, date) else str(start_date))
-    if end_date:
-        query += " AND date <= ?"
-        params.append(end_date.isoformat() if isinstance(end_date, date) else str(end_date))
+    results = db.fetchall(query, params)
+    return [Transaction.from_row(row) for row in results]
 
-    query += " ORDER BY date DESC, id DESC"
 
-    results = db.fetchall(query, tuple(params))
-    return [Transaction.from_dict(dict(row)) for row in results]
+def count_transactions_by_account(account_id: int, db: Optional[Database] = None) -> int:
+    """Count an account's transactions without loading them.
+
+    Args:
+        account_id: Account ID.
+        db: Database instance. If None, uses the shared instance.
+
+    Returns:
+        Number of transactions recorded for the account.
+    """
+    if db is None:
+        db = Database.get()
+
+    row = db.fetchone("SELECT COUNT(*) FROM transactions WHERE account_id = ?", (account_id,))
+    return row[0]
+
+
+def get_transactions_by_account_with_account(
+    account_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Optional[Database] = None,
+) -> List[Transaction]:
+    """Get transactions for an account with the account eagerly loaded.
+
+    Same as get_transactions_by_account, but joins the accounts table so that
+    Transaction.get_account() does not issue one query per transaction.
+
+    Args:
+        account_id: Account ID.
+        start_date: Start date (inclusive). If None, no start limit.
+        end_date: End date (inclusive). If None, no end limit.
+        db: Database instance. If None, uses the shared instance.
+
+    Returns:
+        List of Transaction instances with their account attached.
+    """
+    if db is None:
+        db = Database.get()
+
+    query = _TRANSACTIONS_WITH_ACCOUNT_QUERIES[bool(start_date), bool(end_date)]
+    params = _date_range_params(account_id, start_date, end_date)
+
+    results = db.fetchall(query, params)
+    transactions = []
+    for row in results:
+        transaction = Transaction.from_row(row)
+        transaction._cached_account = Account(
+            name=row["a_name"],
+            currency=row["a_currency"],
+            account_id=row["account_id"],
+            created_at=row["a_created_at"],
+            updated_at=row["a_updated_at"],
+        )
+        transactions.append(transaction)
+    return transactions
 
 
 def get_transactions_by_symbol(
@@ -151,28 +326,46 @@ def get_transactions_by_symbol(
         symbol: Stock symbol.
         start_date: Start date (inclusive). If None, no start limit.
         end_date: End date (inclusive). If None, no end limit.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         List of Transaction instances.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    query = "SELECT * FROM transactions WHERE symbol = ?"
-    params: List[Any] = [symbol.upper()]
+    query = _TRANSACTIONS_BY_SYMBOL_QUERIES[bool(start_date), bool(end_date)]
+    params = _date_range_params(_normalize_symbol(symbol), start_date, end_date)
 
-    if start_date:
-        query += " AND date >= ?"
-        params.append(start_date.isoformat() if isinstance(start_date, date) else str(start_date))
-    if end_date:
-        query += " AND date <= ?"
-        params.append(end_date.isoformat() if isinstance(end_date, date) else str(end_date))
+    results = db.fetchall(query, params)
+    return [Transaction.from_row(row) for row in results]
 
-    query += " ORDER BY date DESC, id DESC"
 
-    results = db.fetchall(query, tuple(params))
-    return [Transaction.from_dict(dict(row)) for row in results]
+def get_transactions_by_type(
+    transaction_type: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Optional[Database] = None,
+) -> List[Transaction]:
+    """Get transactions of one type across all accounts, optionally filtered by date range.
+
+    Args:
+        transaction_type: Transaction type (e.g., "DIVIDEND").
+        start_date: Start date (inclusive). If None, no start limit.
+        end_date: End date (inclusive). If None, no end limit.
+        db: Database instance. If None, uses the shared instance.
+
+    Returns:
+        List of Transaction instances.
+    """
+    if db is None:
+        db = Database.get()
+
+    query = _TRANSACTIONS_BY_TYPE_QUERIES[bool(start_date), bool(end_date)]
+    params = _date_range_params(transaction_type.upper(), start_date, end_date)
+
+    results = db.fetchall(query, params)
+    return [Transaction.from_row(row) for row in results]
 
 
 def get_price(symbol: str, price_date: date, db: Optional[Database] = None) -> Optional[Price]:
@@ -181,21 +374,21 @@ def get_price(symbol: str, price_date: date, db: Optional[Database] = None) -> O
     Args:
         symbol: Stock symbol.
         price_date: Price date.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         Price instance or None if not found.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
     date_str = price_date.isoformat() if isinstance(price_date, date) else str(price_date)
     result = db.fetchone(
-        "SELECT * FROM prices WHERE symbol = ? AND date = ?",
-        (symbol.upper(), date_str),
+        f"SELECT {PRICE_COLS} FROM prices WHERE symbol = ? AND date = ?",
+        (_normalize_symbol(symbol), date_str),
     )
     if result:
-        return Price.from_dict(dict(result))
+        return Price.from_row(result)
     return None
 
 
@@ -211,48 +404,132 @@ def get_prices(
         symbol: Stock symbol.
         start_date: Start date (inclusive). If None, no start limit.
         end_date: End date (inclusive). If None, no end limit.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
         List of Price instances, ordered by date ascending.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
-    query = "SELECT * FROM prices WHERE symbol = ?"
-    params: List[Any] = [symbol.upper()]
+    query = _PRICES_QUERIES[bool(start_date), bool(end_date)]
+    params = _date_range_params(_normalize_symbol(symbol), start_date, end_date)
 
-    if start_date:
-        query += " AND date >= ?"
-        params.append(start_date.isoformat() if isinstance(start_date, date) else str(start_date))
-    if end_date:
-        query += " AND date <= ?"
-        params.append(end_date.isoformat() if isinstance(end_date, date) else str(end_date))
-
-    query += " ORDER BY date ASC"
-
-    results = db.fetchall(query, tuple(params))
-    return [Price.from_dict(dict(row)) for row in results]
+    results = db.fetchall(query, params)
+    return [Price.from_row(row) for row in results]
 
 
 def get_latest_price(symbol: str, db: Optional[Database] = None) -> Optional[Price]:
     """Get most recent price for symbol.
 
+    Only symbol, date and close are loaded so the lookup is served entirely
+    from the idx_prices_symbol_date_desc covering index. Use get_price with
+    the returned date when the full OHLCV row is needed.
+
     Args:
         symbol: Stock symbol.
-        db: Database instance. If None, creates a new instance.
+        db: Database instance. If None, uses the shared instance.
 
     Returns:
-        Price instance or None if not found.
+        Price instance (symbol, date and close only) or None if not found.
     """
     if db is None:
-        db = Database()
+        db = Database.get()
 
     result = db.fetchone(
-        "SELECT * FROM prices WHERE symbol = ? ORDER BY date DESC LIMIT 1",
-        (symbol.upper(),),
+        f"SELECT {PRICE_SUMMARY_COLS} FROM prices WHERE symbol = ? ORDER BY date DESC LIMIT 1",
+        (_normalize_symbol(symbol),),
     )
     if result:
-        return Price.from_dict(dict(result))
+        return Price(
+            symbol=result["symbol"],
+            date=date.fromisoformat(result["date"]),
+            close=result["close"],
+        )
     return None
 
+
+# Closest price at or before the start date and at or after the end date in one
+# statement; the side column tells the two branches apart.
+_BRACKETING_PRICES_QUERY = f"""
+    SELECT 0 AS side, * FROM (
+        SELECT {PRICE_COLS} FROM prices WHERE symbol = ? AND date <= ?
+        ORDER BY date DESC LIMIT 1
+    )
+    UNION ALL
+    SELECT 1 AS side, * FROM (
+        SELECT {PRICE_COLS} FROM prices WHERE symbol = ? AND date >= ?
+        ORDER BY date ASC LIMIT 1
+    )
+"""
+
+
+def get_bracketing_prices(
+    symbol: str,
+    start_date: date,
+    end_date: date,
+    db: Optional[Database] = None,
+) -> Tuple[Optional[Price], Optional[Price]]:
+    """Get the prices bracketing a date range with a single query.
+
+    Args:
+        symbol: Stock symbol.
+        start_date: Start date of the range.
+        end_date: End date of the range.
+        db: Database instance. If None, uses the shared instance.
+
+    Returns:
+        Tuple of (latest price at or before start_date, earliest price at or
+        after end_date). Either element is None when no such price exists.
+    """
+    if db is None:
+        db = Database.get()
+
+    symbol = _normalize_symbol(symbol)
+    start_str = start_date.isoformat() if isinstance(start_date, date) else str(start_date)
+    end_str = end_date.isoformat() if isinstance(end_date, date) else str(end_date)
+
+    bracket: List[Optional[Price]] = [None, None]
+    for row in db.fetchall(_BRACKETING_PRICES_QUERY, (symbol, start_str, symbol, end_str)):
+        bracket[row["side"]] = Price.from_row(row)
+    return bracket[0], bracket[1]
+
+
+def get_closes(
+    symbol: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Optional[Database] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get closing prices for symbol as NumPy arrays.
+
+    Columnar counterpart of get_prices for analytics that only read the
+    close: no Price object is built per row, and selecting just date and close
+    lets the range be served entirely from the idx_prices_symbol_date_desc
+    covering index.
+
+    Args:
+        symbol: Stock symbol.
+        start_date: Start date (inclusive). If None, no start limit.
+        end_date: End date (inclusive). If None, no end limit.
+        db: Database instance. If None, uses the shared instance.
+
+    Returns:
+        Tuple of (dates, closes) ordered by date ascending: dates as
+        datetime64[D] and closes as float64 (NaN where the close is missing).
+    """
+    if db is None:
+        db = Database.get()
+
+    query = _CLOSES_QUERIES[bool(start_date), bool(end_date)]
+    params = _date_range_params(_normalize_symbol(symbol), start_date, end_date)
+
+    results = db.fetchall(query, params)
+    n = len(results)
+    dates = np.empty(n, dtype="datetime64[D]")
+    closes = np.empty(n, dtype=np.float64)
+    if n:
+        date_values, close_values = zip(*results)
+        dates[:] = date_values
+        closes[:] = np.array(close_values, dtype=np.float64)
+    return dates, closes
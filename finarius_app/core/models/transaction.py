@@ -3,17 +3,38 @@
 from typing import Optional, Dict, Any
 from datetime import date
 import logging
+import sqlite3
 
 from ..database import Database
 from .account import Account
 
 logger = logging.getLogger(__name__)
 
+# Bound here because __init__'s ``date`` parameter shadows the datetime.date class
+_parse_iso_date = date.fromisoformat
+
+_TRADE_TYPES = frozenset({"BUY", "SELL"})
+
 
 class Transaction:
     """Transaction model representing a portfolio transaction."""
 
-    TRANSACTION_TYPES = {"BUY", "SELL", "DIVIDEND", "DEPOSIT", "WITHDRAW"}
+    __slots__ = (
+        "id",
+        "date",
+        "account_id",
+        "type",
+        "symbol",
+        "qty",
+        "price",
+        "fee",
+        "notes",
+        "created_at",
+        "_cached_account",
+    )
+
+    TRANSACTION_TYPES = frozenset({"BUY", "SELL", "DIVIDEND", "DEPOSIT", "WITHDRAW"})
+    _TYPES_STR = ", ".join(sorted(TRANSACTION_TYPES))
 
     def __init__(
         self,
@@ -44,10 +65,7 @@ class Transaction:
         """
         self.id = transaction_id
         # Handle both date objects and date strings
-        if isinstance(date, str):
-            self.date = date.fromisoformat(date)
-        else:
-            self.date = date
+        self.date = _parse_iso_date(date) if type(date) is str else date
         self.account_id = account_id
         self.type = transaction_type.upper()
         self.symbol = symbol
@@ -56,6 +74,8 @@ class Transaction:
         self.fee = fee
         self.notes = notes
         self.created_at = created_at
+        # Account eagerly loaded by get_transactions_by_account_with_account
+        self._cached_account: Optional[Account] = None
 
     def validate(self) -> None:
         """Validate transaction data.
@@ -63,13 +83,23 @@ class Transaction:
         Raises:
             ValueError: If validation fails.
         """
-        if self.type not in self.TRANSACTION_TYPES:
-            raise ValueError(
-                f"Invalid transaction type: {self.type}. "
-                f"Must be one of: {', '.join(self.TRANSACTION_TYPES)}"
-            )
-
-        if self.type in {"BUY", "SELL"}:
+        t = self.type
+        if t not in self.TRANSACTION_TYPES:
+            raise ValueError(f"Invalid transaction type: {t}. Must be one of: {self._TYPES_STR}")
+
+        # Fast path: a single combined check for the common valid case. The
+        # granular checks below only run to build a precise error message.
+        qty = self.qty
+        price = self.price
+        has_position = bool(self.symbol) and qty is not None and qty > 0
+        if (
+            self.fee >= 0
+            and (t not in _TRADE_TYPES or (has_position and price is not None and price >= 0))
+            and (t != "DIVIDEND" or has_position)
+        ):
+            return
+
+        if t in _TRADE_TYPES:
             if not self.symbol:
                 raise ValueError(f"Symbol is required for {self.type} transactions")
             if self.qty is None or self.qty <= 0:
@@ -90,7 +120,7 @@ class Transaction:
         """Save transaction to database.
 
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
 
         Returns:
             Self with updated ID and timestamp.
@@ -100,16 +130,17 @@ class Transaction:
             sqlite3.IntegrityError: If account_id doesn't exist.
         """
         if db is None:
-            db = Database()
+            db = Database.get()
 
         self.validate()
 
         if self.id is None:
             # Insert new transaction
-            db.execute(
+            result = db.execute_returning(
                 """
                 INSERT INTO transactions (date, account_id, type, symbol, qty, price, fee, notes)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING id, created_at
                 """,
                 (
                     self.date.isoformat(),
@@ -122,15 +153,6 @@ class Transaction:
                     self.notes,
                 ),
             )
-            # Get the inserted ID
-            result = db.fetchone(
-                """
-                SELECT id, created_at FROM transactions
-                WHERE date = ? AND account_id = ? AND type = ?
-                ORDER BY id DESC LIMIT 1
-                """,
-                (self.date.isoformat(), self.account_id, self.type),
-            )
             if result:
                 self.id = result["id"]
                 self.created_at = result["created_at"]
@@ -163,13 +185,13 @@ class Transaction:
         """Delete transaction from database.
 
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
 
         Raises:
             ValueError: If transaction ID is not set.
         """
         if db is None:
-            db = Database()
+            db = Database.get()
 
         if self.id is None:
             raise ValueError("Cannot delete transaction without ID")
@@ -189,11 +211,11 @@ class Transaction:
         """
         if "date" in kwargs:
             date_val = kwargs["date"]
-            if isinstance(date_val, str):
-                self.date = date.fromisoformat(date_val)
-            else:
-                self.date = date_val
+            self.date = _parse_iso_date(date_val) if type(date_val) is str else date_val
         if "account_id" in kwargs:
+            if kwargs["account_id"] != self.account_id:
+                # The eagerly loaded account belongs to the previous account_id
+                self._cached_account = None
             self.account_id = kwargs["account_id"]
         if "type" in kwargs:
             self.type = kwargs["type"].upper()
@@ -255,15 +277,47 @@ class Transaction:
             created_at=data.get("created_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Transaction":
+        """Create Transaction instance directly from a transactions table row.
+
+        Reads the columns straight from the row instead of going through an
+        intermediate dict. The row must contain every column of TRANSACTION_COLS.
+
+        Args:
+            row: Row from the transactions table.
+
+        Returns:
+            Transaction instance.
+        """
+        return cls(
+            date=date.fromisoformat(row["date"]),
+            account_id=row["account_id"],
+            transaction_type=row["type"],
+            symbol=row["symbol"],
+            qty=row["qty"],
+            price=row["price"],
+            fee=row["fee"],
+            notes=row["notes"],
+            transaction_id=row["id"],
+            created_at=row["created_at"],
+        )
+
     def get_account(self, db: Optional[Database] = None) -> Optional[Account]:
         """Get associated account.
 
+        Returns the eagerly loaded account when the transaction was fetched with
+        get_transactions_by_account_with_account, without querying the database.
+
         Args:
-            db: Database instance. If None, creates a new instance.
+            db: Database instance. If None, uses the shared instance.
 
         Returns:
             Account instance or None if not found.
         """
+        if self._cached_account is not None:
+            return self._cached_account
+
         from .queries import get_account_by_id
 
         return get_account_by_id(self.account_id, db)
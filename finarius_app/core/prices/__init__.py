@@ -4,34 +4,65 @@ This module provides functionality to download, cache, validate, and normalize
 market price data from external sources.
 """
 
+import importlib
+from typing import Any, Dict, Tuple
+
 from .exceptions import (
     PriceDownloadError,
     SymbolNotFoundError,
     ValidationError,
     InsufficientDataError,
 )
-from .validation import validate_symbol, symbol_exists
-from .cache import (
-    is_price_cached,
-    get_cached_price,
-    update_price_cache,
-)
-from .normalization import normalize_price_data
-from .downloader import PriceDownloader
-from .scheduler import (
-    get_all_portfolio_symbols,
-    get_last_update_time,
-    update_prices_for_symbol,
-    update_all_prices,
-    schedule_daily_updates,
-)
-from .analytics import (
-    get_price_history,
-    calculate_returns,
-    get_price_statistics,
-    calculate_daily_returns,
-    get_price_range,
-)
+
+# Submodules pull in yfinance, pandas and numpy, so they are imported on first
+# attribute access (PEP 562) rather than when the package is imported.
+_LAZY_ATTRS: Dict[str, Tuple[str, str]] = {
+    # Validation
+    "validate_symbol": ("validation", "validate_symbol"),
+    "symbol_exists": ("validation", "symbol_exists"),
+    "is_crypto_symbol": ("validation", "is_crypto_symbol"),
+    "get_exchange_name": ("validation", "get_exchange_name"),
+    # Caching
+    "is_price_cached": ("cache", "is_price_cached"),
+    "get_cached_price": ("cache", "get_cached_price"),
+    "update_price_cache": ("cache", "update_price_cache"),
+    # Normalization
+    "normalize_price_data": ("normalization", "normalize_price_data"),
+    "normalize_price_frame": ("normalization", "normalize_price_frame"),
+    "normalize_yf_row": ("normalization", "normalize_yf_row"),
+    # Main class
+    "PriceDownloader": ("downloader", "PriceDownloader"),
+    # Scheduler
+    "get_all_portfolio_symbols": ("scheduler", "get_all_portfolio_symbols"),
+    "get_last_update_time": ("scheduler", "get_last_update_time"),
+    "get_last_update_times": ("scheduler", "get_last_update_times"),
+    "update_prices_for_symbol": ("scheduler", "update_prices_for_symbol"),
+    "update_all_prices": ("scheduler", "update_all_prices"),
+    "schedule_daily_updates": ("scheduler", "schedule_daily_updates"),
+    # Analytics
+    "get_price_history": ("analytics", "get_price_history"),
+    "calculate_returns": ("analytics", "calculate_returns"),
+    "get_price_statistics": ("analytics", "get_price_statistics"),
+    "calculate_daily_returns": ("analytics", "calculate_daily_returns"),
+    "get_price_range": ("analytics", "get_price_range"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute's submodule on first access."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List module attributes including not-yet-imported lazy ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Exceptions
@@ -42,17 +73,22 @@ __all__ = [
     # Validation
     "validate_symbol",
     "symbol_exists",
+    "is_crypto_symbol",
+    "get_exchange_name",
     # Caching
     "is_price_cached",
     "get_cached_price",
     "update_price_cache",
     # Normalization
     "normalize_price_data",
+    "normalize_price_frame",
+    "normalize_yf_row",
     # Main class
     "PriceDownloader",
     # Scheduler
     "get_all_portfolio_symbols",
     "get_last_update_time",
+    "get_last_update_times",
     "update_prices_for_symbol",
     "update_all_prices",
     "schedule_daily_updates",
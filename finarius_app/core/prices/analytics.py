@@ -1,15 +1,56 @@
 """Price analytics utilities for calculating returns and statistics."""
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import date, timedelta
-import statistics
+
+import numpy as np
 
 from ..database import Database
-from ..models.queries import get_prices, get_latest_price
+from ..models.queries import (
+    get_bracketing_prices,
+    get_closes,
+    get_prices,
+    get_latest_price,
+)
+from .cache import ConnectionLRUCache
+from .kernels import daily_returns_kernel
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (symbol, start, end) close ranges memoized in-process
+CLOSES_MEMORY_CACHE_SIZE = 256
+
+# (symbol, start ordinal, end ordinal) -> read-only (dates, closes) arrays
+_closes_memory_cache = ConnectionLRUCache(CLOSES_MEMORY_CACHE_SIZE)
+
+
+def _get_closes(
+    symbol: str, start_date: date, end_date: date, db: Database
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get closing prices for a range, memoized until the next database write.
+
+    Rendering a page typically runs several analytics over the same range,
+    so only the first of them reads the rows from SQLite.
+
+    Args:
+        symbol: Stock symbol.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        db: Database instance.
+
+    Returns:
+        Tuple of read-only (dates, closes) arrays, as returned by get_closes.
+    """
+    key = (symbol.upper(), start_date.toordinal(), end_date.toordinal())
+    columns = _closes_memory_cache.get(db, key)
+    if columns is None:
+        columns = get_closes(symbol, start_date, end_date, db)
+        for values in columns:
+            values.flags.writeable = False
+        _closes_memory_cache.put(db, key, columns)
+    return columns
+
 
 def get_price_history(
     symbol: str,
@@ -35,9 +76,10 @@ def get_price_history(
 
     prices = get_prices(symbol, start_date, end_date, db)
 
+    # Price always holds a date: from_row and __init__ parse ISO strings on load
     return [
         {
-            "date": p.date.isoformat() if isinstance(p.date, date) else str(p.date),
+            "date": p.date.isoformat(),
             "close": p.close,
             "open": p.open,
             "high": p.high,
@@ -76,25 +118,34 @@ def calculate_returns(
     if start_date > end_date:
         raise ValueError("start_date must be <= end_date")
 
-    # Get prices at start and end dates
-    prices = get_prices(symbol, start_date, end_date, db)
-
-    if len(prices) < 2:
-        # Try to get closest available prices
-        start_price_obj = get_prices(symbol, None, start_date, db)
-        end_price_obj = get_prices(symbol, end_date, None, db)
+    # One query fetches the closest prices around the range. When they fall
+    # exactly on the range bounds they are also the first and last prices
+    # inside it, so the range itself only has to be read otherwise.
+    start_price_obj, end_price_obj = get_bracketing_prices(symbol, start_date, end_date, db)
+    if (
+        start_date < end_date
+        and start_price_obj is not None
+        and end_price_obj is not None
+        and start_price_obj.date == start_date
+        and end_price_obj.date == end_date
+    ):
+        closes = np.array([start_price_obj.close, end_price_obj.close])
+    else:
+        _, closes = _get_closes(symbol, start_date, end_date, db)
 
-        if not start_price_obj:
+    if closes.size < 2:
+        # Fall back to the closest available prices
+        if start_price_obj is None:
             raise ValueError(f"No price data available for {symbol} at or before {start_date}")
-        if not end_price_obj:
+        if end_price_obj is None:
             raise ValueError(f"No price data available for {symbol} at or after {end_date}")
 
-        start_price = start_price_obj[-1].close if start_price_obj else None
-        end_price = end_price_obj[0].close if end_price_obj else None
+        start_price = start_price_obj.close
+        end_price = end_price_obj.close
     else:
         # Use first and last prices
-        start_price = prices[0].close
-        end_price = prices[-1].close
+        start_price = float(closes[0])
+        end_price = float(closes[-1])
 
     if start_price is None or end_price is None:
         raise ValueError(f"Insufficient price data for {symbol}")
@@ -147,30 +198,30 @@ def get_price_statistics(
     if start_date > end_date:
         raise ValueError("start_date must be <= end_date")
 
-    prices = get_prices(symbol, start_date, end_date, db)
+    _, closes = _get_closes(symbol, start_date, end_date, db)
 
-    if not prices:
+    if not closes.size:
         raise ValueError(f"No price data available for {symbol} between {start_date} and {end_date}")
 
-    close_prices = [p.close for p in prices if p.close is not None]
+    closes = closes[~np.isnan(closes)]
 
-    if not close_prices:
+    if not closes.size:
         raise ValueError(f"No valid price data for {symbol}")
 
     stats = {
         "symbol": symbol.upper(),
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
-        "min": min(close_prices),
-        "max": max(close_prices),
-        "mean": statistics.mean(close_prices),
-        "median": statistics.median(close_prices),
-        "count": len(close_prices),
+        "min": float(closes.min()),
+        "max": float(closes.max()),
+        "mean": float(closes.mean()),
+        "median": float(np.median(closes)),
+        "count": int(closes.size),
     }
 
     # Calculate standard deviation if we have enough data points
-    if len(close_prices) > 1:
-        stats["std_dev"] = statistics.stdev(close_prices)
+    if closes.size > 1:
+        stats["std_dev"] = float(closes.std(ddof=1))
     else:
         stats["std_dev"] = 0.0
 
@@ -204,31 +255,28 @@ def calculate_daily_returns(
     if start_date > end_date:
         raise ValueError("start_date must be <= end_date")
 
-    prices = get_prices(symbol, start_date, end_date, db)
+    dates, closes = _get_closes(symbol, start_date, end_date, db)
 
-    if len(prices) < 2:
+    if len(closes) < 2:
         return []
 
-    daily_returns = []
-    for i in range(1, len(prices)):
-        prev_price = prices[i - 1].close
-        curr_price = prices[i].close
-        price_date = prices[i].date
+    # Days with a missing close or a zero previous close have no meaningful return
+    absolute_changes, daily_return_values, valid = daily_returns_kernel(closes)
 
-        if prev_price is None or curr_price is None or prev_price == 0:
-            continue
-
-        absolute_change = curr_price - prev_price
-        daily_return = (absolute_change / prev_price) * 100.0
-
-        daily_returns.append({
-            "date": price_date.isoformat() if isinstance(price_date, date) else str(price_date),
+    return [
+        {
+            "date": price_date,
             "price": curr_price,
             "daily_return": daily_return,
             "absolute_change": absolute_change,
-        })
-
-    return daily_returns
+        }
+        for price_date, curr_price, daily_return, absolute_change in zip(
+            dates[1:][valid].astype(str).tolist(),
+            closes[1:][valid].tolist(),
+            daily_return_values[valid].tolist(),
+            absolute_changes[valid].tolist(),
+        )
+    ]
 
 
 def get_price_range(
@@ -259,25 +307,26 @@ def get_price_range(
     if start_date > end_date:
         raise ValueError("start_date must be <= end_date")
 
-    prices = get_prices(symbol, start_date, end_date, db)
+    _, closes = _get_closes(symbol, start_date, end_date, db)
 
-    if not prices:
+    if not closes.size:
         raise ValueError(f"No price data available for {symbol} between {start_date} and {end_date}")
 
-    close_prices = [p.close for p in prices if p.close is not None]
+    closes = closes[~np.isnan(closes)]
 
-    if not close_prices:
+    if not closes.size:
         raise ValueError(f"No valid price data for {symbol}")
 
+    low, high = float(closes.min()), float(closes.max())
+
     return {
         "symbol": symbol.upper(),
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
-        "first_price": close_prices[0],
-        "last_price": close_prices[-1],
-        "high": max(close_prices),
-        "low": min(close_prices),
-        "price_range": max(close_prices) - min(close_prices),
-        "count": len(close_prices),
+        "first_price": float(closes[0]),
+        "last_price": float(closes[-1]),
+        "high": high,
+        "low": low,
+        "price_range": high - low,
+        "count": int(closes.size),
     }
-
@@ -1,8 +1,12 @@
 """Price caching utilities for price downloader."""
 
 import logging
-from typing import Optional, Dict, Any
-from datetime import date, datetime, timedelta
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Hashable, Iterable, Iterator, List, Set
+from datetime import date, datetime, timedelta, timezone
 
 from ..database import Database
 from ..models.price import Price
@@ -14,6 +18,92 @@ logger = logging.getLogger(__name__)
 CACHE_EXPIRATION_HISTORICAL = timedelta(days=1)
 CACHE_EXPIRATION_LATEST = timedelta(hours=1)
 
+# Format of SQLite CURRENT_TIMESTAMP values stored in created_at columns (UTC)
+SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Maximum number of prices kept in the in-process LRU in front of get_cached_price
+PRICE_MEMORY_CACHE_SIZE = 65536
+
+# SQLite's default limit on bound parameters per statement
+SQLITE_MAX_VARIABLES = 999
+
+
+class ConnectionLRUCache:
+    """In-process LRU of query results, valid until the database changes.
+
+    Any write through the connection (or a new connection, e.g. after a
+    restore) changes ``total_changes`` or the connection identity, which drops
+    every entry. Cached values are shared between callers and must not be
+    modified. Instances are module-level and Streamlit serves each session on
+    its own thread, so every operation holds the cache's lock.
+    """
+
+    __slots__ = ("maxsize", "_entries", "_conn", "_changes", "_lock")
+
+    def __init__(self, maxsize: int):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept; least recently used go first.
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Connection and its total_changes count when the entries were last known valid
+        self._conn: Optional[sqlite3.Connection] = None
+        self._changes = -1
+        self._lock = threading.Lock()
+
+    def _validate(self, db: Database) -> None:
+        """Drop every entry if the database may have changed since they were stored.
+
+        Must be called with the lock held.
+        """
+        conn = db.get_connection()
+        if conn is not self._conn or conn.total_changes != self._changes:
+            self._entries.clear()
+            self._conn = conn
+            self._changes = conn.total_changes
+
+    def get(self, db: Database, key: Hashable) -> Any:
+        """Get a cached value.
+
+        Args:
+            db: Database instance being read.
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if absent or invalidated.
+        """
+        with self._lock:
+            self._validate(db)
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, db: Database, key: Hashable, value: Any) -> None:
+        """Store a value read from the database.
+
+        Args:
+            db: Database instance the value was read from.
+            key: Cache key.
+            value: Value to cache (must not be None).
+        """
+        with self._lock:
+            self._validate(db)
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# (symbol, date ordinal) -> Price
+_price_memory_cache = ConnectionLRUCache(PRICE_MEMORY_CACHE_SIZE)
+
 
 def is_price_cached(
     symbol: str,
@@ -27,7 +117,7 @@ def is_price_cached(
         symbol: Stock symbol.
         price_date: Price date.
         db: Database instance. If None, creates a new instance.
-        max_age: Maximum age of cached data. If None, uses default expiration.
+        max_age: Maximum age of cached data. If None, cached data never expires.
 
     Returns:
         True if price is cached and not expired, False otherwise.
@@ -35,31 +125,64 @@ def is_price_cached(
     if db is None:
         db = Database()
 
-    cached_price = get_price_from_db(symbol, price_date, db)
+    params: tuple = (symbol.upper(), price_date.isoformat())
+
+    if max_age is None:
+        row = db.fetchone("SELECT 1 FROM prices WHERE symbol = ? AND date = ?", params)
+        return row is not None
+
+    # created_at holds SQLite CURRENT_TIMESTAMP text (UTC), which orders correctly as
+    # a string, so expiry is one comparison against a formatted cutoff in the query
+    cutoff = (datetime.now(timezone.utc) - max_age).strftime(SQLITE_TIMESTAMP_FORMAT)
+    row = db.fetchone(
+        """
+        SELECT 1 FROM prices
+        WHERE symbol = ? AND date = ? AND (created_at IS NULL OR created_at > ?)
+        """,
+        params + (cutoff,),
+    )
+    return row is not None
+
+
+def get_cached_symbols(
+    symbols: Iterable[str],
+    start_date: date,
+    end_date: date,
+    db: Optional[Database] = None,
+) -> Set[str]:
+    """Get the symbols that already have cached prices in a date range.
 
-    if cached_price is None:
-        return False
+    Downloads for the other symbols are first-time population of the range and
+    can be written with ``Price.save_rows(..., mode="ignore")``.
 
-    # Check expiration if max_age is provided
-    if max_age is not None and cached_price.created_at:
-        try:
-            created_at = datetime.fromisoformat(cached_price.created_at.replace("Z", "+00:00"))
-            # Handle timezone-naive datetime
-            if created_at.tzinfo is None:
-                created_at = created_at.replace(tzinfo=None)
+    Args:
+        symbols: Stock symbols.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        db: Database instance. If None, creates a new instance.
 
-            age = datetime.now() - created_at.replace(tzinfo=None)
-            if age > max_age:
-                logger.debug(
-                    f"Cached price for {symbol} on {price_date} is expired (age: {age})"
-                )
-                return False
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Error checking cache expiration: {e}")
-            # If we can't parse the date, assume it's valid
-            return True
+    Returns:
+        Set of uppercase symbols with at least one cached price in the range.
+    """
+    if db is None:
+        db = Database()
 
-    return True
+    unique: List[str] = sorted({symbol.upper() for symbol in symbols})
+    date_params = (start_date.isoformat(), end_date.isoformat())
+    chunk_size = SQLITE_MAX_VARIABLES - len(date_params)
+    cached: Set[str] = set()
+    for i in range(0, len(unique), chunk_size):
+        chunk = unique[i : i + chunk_size]
+        placeholders = ",".join("?" * len(chunk))
+        rows = db.fetchall(
+            f"""
+            SELECT DISTINCT symbol FROM prices
+            WHERE symbol IN ({placeholders}) AND date >= ? AND date <= ?
+            """,
+            tuple(chunk) + date_params,
+        )
+        cached.update(row["symbol"] for row in rows)
+    return cached
 
 
 def get_cached_price(
@@ -69,18 +192,31 @@ def get_cached_price(
 ) -> Optional[Price]:
     """Get cached price from database.
 
+    Found prices are memoized in-process until the next write through the
+    database connection, so repeated lookups skip the SQLite query.
+
     Args:
         symbol: Stock symbol.
         price_date: Price date.
         db: Database instance. If None, creates a new instance.
 
     Returns:
-        Price instance if found, None otherwise.
+        Price instance if found, None otherwise. Memoized instances are shared
+        between callers and must not be modified.
     """
     if db is None:
         db = Database()
 
-    return get_price_from_db(symbol, price_date, db)
+    key = (symbol.upper(), price_date.toordinal())
+
+    price = _price_memory_cache.get(db, key)
+    if price is not None:
+        return price
+
+    price = get_price_from_db(symbol, price_date, db)
+    if price is not None:
+        _price_memory_cache.put(db, key, price)
+    return price
 
 
 def update_price_cache(
@@ -154,3 +290,41 @@ def invalidate_price_cache(
     logger.info(f"Invalidated {count} cached prices for {symbol}")
     return count
 
+
+@contextmanager
+def bulk_write_window(db: Optional[Database] = None) -> Iterator[Database]:
+    """Relax SQLite durability settings for the duration of a bulk price load.
+
+    Disables the rollback journal, fsync and foreign key checks while the
+    window is open and restores the previous settings on exit. A crash inside
+    the window can leave the database inconsistent, so only use it for writes
+    that can be replayed by downloading the prices again.
+
+    Args:
+        db: Database instance. If None, creates a new instance.
+
+    Yields:
+        The database instance.
+    """
+    if db is None:
+        db = Database()
+
+    conn = db.get_connection()
+    # journal_mode can only be changed outside of a transaction
+    conn.commit()
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA foreign_keys = OFF")
+    logger.debug("Entered bulk write window")
+    try:
+        yield db
+    finally:
+        conn.commit()
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {int(synchronous)}")
+        conn.execute(f"PRAGMA foreign_keys = {int(foreign_keys)}")
+        logger.debug("Left bulk write window")
@@ -2,24 +2,27 @@
 
 import time
 import logging
-from typing import Optional, List, Dict, Any, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Callable, Iterator
 from datetime import date, datetime, timedelta
 
 import yfinance as yf
 import pandas as pd
 
 from ..database import Database
-from ..models.price import Price
+from ..models.price import Price, PriceRow
 from .exceptions import PriceDownloadError, SymbolNotFoundError, ValidationError
 from .validation import validate_symbol, symbol_exists
 from .cache import (
+    get_cached_symbols,
     is_price_cached,
     get_cached_price,
     update_price_cache,
     CACHE_EXPIRATION_HISTORICAL,
     CACHE_EXPIRATION_LATEST,
 )
-from .normalization import normalize_price_data
+from .normalization import normalize_price_frame, normalize_yf_row
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,10 @@ DEFAULT_RATE_LIMIT_DELAY = 1.0
 # Default retry settings
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+# Default number of concurrent per-symbol downloads in download_multiple_symbols
+DEFAULT_MAX_WORKERS = 8
+# Maximum number of symbols sent in one batched yfinance request
+BATCH_SIZE = 20
 
 
 class PriceDownloader:
@@ -59,17 +66,25 @@ class PriceDownloader:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.use_cache = use_cache
-        self._last_request_time: Optional[float] = None
+        # time.monotonic() of the last reserved request slot
+        self._last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting to prevent too many requests."""
-        if self._last_request_time is not None:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        """Apply rate limiting to prevent too many requests.
+
+        Thread-safe: each caller reserves the next request slot under a lock and
+        then sleeps until it, so concurrent downloads stay spaced out.
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            request_time = max(now, self._last_request_time + self.rate_limit_delay)
+            self._last_request_time = request_time
+
+        sleep_time = request_time - now
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            time.sleep(sleep_time)
 
     def _retry_with_backoff(
         self,
@@ -158,20 +173,17 @@ class PriceDownloader:
                     logger.warning(f"No data available for {symbol} on {price_date}")
                     return None
 
-                # Find the closest date (prefer exact match, then closest before)
-                date_str = price_date.isoformat()
-                if date_str in hist.index.strftime("%Y-%m-%d").values:
-                    row = hist.loc[hist.index.strftime("%Y-%m-%d") == date_str].iloc[0]
-                else:
-                    # Get closest date before or on the requested date
-                    before_dates = hist[hist.index.date <= price_date]
-                    if before_dates.empty:
-                        logger.warning(f"No data before or on {price_date} for {symbol}")
-                        return None
-                    row = before_dates.iloc[-1]
+                # Binary search for the last row on or before the requested date
+                # (the exact match when it exists); the index is sorted by date
+                cutoff = pd.Timestamp(price_date + timedelta(days=1), tz=hist.index.tz)
+                pos = hist.index.searchsorted(cutoff, side="left") - 1
+                if pos < 0:
+                    logger.warning(f"No data before or on {price_date} for {symbol}")
+                    return None
+                row = dict(zip(hist.columns, hist.to_numpy()[pos].tolist()))
 
                 # Normalize data
-                price_data = normalize_price_data(row.to_dict(), symbol, price_date)
+                price_data = normalize_yf_row(row, symbol, price_date)
                 if price_data is None:
                     return None
 
@@ -223,6 +235,45 @@ class PriceDownloader:
         Returns:
             List of Price instances.
 
+        Raises:
+            ValidationError: If symbol format is invalid.
+            PriceDownloadError: If download fails.
+        """
+        cache_enabled = use_cache if use_cache is not None else self.use_cache
+
+        rows = self.fetch_price_rows(symbol, start_date, end_date, progress_callback)
+        if cache_enabled and rows:
+            Price.save_rows(rows, self.db, mode=self._save_mode(symbol, start_date, end_date))
+        prices = [Price(*row) for row in rows]
+
+        logger.info(
+            f"Downloaded {len(prices)} prices for {symbol.strip().upper()} "
+            f"from {start_date} to {end_date}"
+        )
+        return prices
+
+    def fetch_price_rows(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[PriceRow]:
+        """Download price range for symbol as rows, without touching the database.
+
+        Only the network request and normalization run here, so this is safe to
+        call from worker threads while the caller keeps every database write on
+        its own thread.
+
+        Args:
+            symbol: Stock symbol.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+            progress_callback: Optional callback(current, total) for progress tracking.
+
+        Returns:
+            List of (symbol, ISO date, close, open, high, low, volume) tuples.
+
         Raises:
             ValidationError: If symbol format is invalid.
             PriceDownloadError: If download fails.
@@ -233,9 +284,7 @@ class PriceDownloader:
         if start_date > end_date:
             raise ValidationError("start_date must be <= end_date")
 
-        cache_enabled = use_cache if use_cache is not None else self.use_cache
-
-        def _download() -> List[Price]:
+        def _download() -> List[PriceRow]:
             self._rate_limit()
 
             try:
@@ -248,53 +297,79 @@ class PriceDownloader:
                     )
                     return []
 
-                prices = []
-                total_days = len(hist)
-                current = 0
+                return list(
+                    self._iter_price_rows(hist, symbol, start_date, end_date, progress_callback)
+                )
 
-                for idx, row in hist.iterrows():
-                    current += 1
-                    if progress_callback:
-                        progress_callback(current, total_days)
-
-                    # Get date from index
-                    if isinstance(idx, pd.Timestamp):
-                        price_date = idx.date()
-                    elif isinstance(idx, date):
-                        price_date = idx
-                    else:
-                        continue
-
-                    # Skip if outside range
-                    if price_date < start_date or price_date > end_date:
-                        continue
-
-                    # Normalize data
-                    price_data = normalize_price_data(row.to_dict(), symbol, price_date)
-                    if price_data is None:
-                        continue
-
-                    # Create Price object
-                    price = Price(
-                        symbol=symbol,
-                        date=price_date,
-                        close=price_data["close"],
-                        open_price=price_data.get("open"),
-                        high=price_data.get("high"),
-                        low=price_data.get("low"),
-                        volume=price_data.get("volume"),
-                    )
+            except Exception as e:
+                logger.error(
+                    f"Error downloading prices for {symbol} "
+                    f"from {start_date} to {end_date}: {e}"
+                )
+                raise
+
+        try:
+            return self._retry_with_backoff(_download)
+        except PriceDownloadError:
+            raise
+        except Exception as e:
+            raise PriceDownloadError(
+                f"Failed to download prices for {symbol}: {e}"
+            ) from e
+
+    def download_prices_to_cache(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Download price range for symbol straight into the database cache.
+
+        Rows are streamed from the downloaded history into the database without
+        building Price instances, so memory stays flat on large backfills.
+
+        Args:
+            symbol: Stock symbol.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+            progress_callback: Optional callback(current, total) for progress tracking.
+
+        Returns:
+            Number of prices written.
+
+        Raises:
+            ValidationError: If symbol format is invalid.
+            PriceDownloadError: If download fails.
+        """
+        validate_symbol(symbol)
+        symbol = symbol.strip().upper()
+
+        if start_date > end_date:
+            raise ValidationError("start_date must be <= end_date")
+
+        def _download() -> int:
+            self._rate_limit()
 
-                    if cache_enabled:
-                        price.save(self.db)
+            try:
+                ticker = yf.Ticker(symbol)
+                hist = ticker.history(start=start_date, end=end_date + timedelta(days=1))
 
-                    prices.append(price)
+                if hist.empty:
+                    logger.warning(
+                        f"No data available for {symbol} from {start_date} to {end_date}"
+                    )
+                    return 0
 
+                count = Price.save_rows(
+                    self._iter_price_rows(hist, symbol, start_date, end_date, progress_callback),
+                    self.db,
+                    mode=self._save_mode(symbol, start_date, end_date),
+                )
                 logger.info(
-                    f"Downloaded {len(prices)} prices for {symbol} "
-                    f"from {start_date} to {end_date}"
+                    f"Cached {count} prices for {symbol} from {start_date} to {end_date}"
                 )
-                return prices
+                return count
 
             except Exception as e:
                 logger.error(
@@ -308,9 +383,168 @@ class PriceDownloader:
         except PriceDownloadError:
             raise
         except Exception as e:
-            raise PriceDownloadError(
-                f"Failed to download prices for {symbol}: {e}"
-            ) from e
+            raise PriceDownloadError(f"Failed to download prices for {symbol}: {e}") from e
+
+    def fetch_batch_price_rows(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[str, List[PriceRow]]:
+        """Download price ranges for several symbols in batched requests.
+
+        Symbols are sent BATCH_SIZE at a time, so N symbols take
+        ceil(N / BATCH_SIZE) requests. Like fetch_price_rows, this never
+        touches the database.
+
+        Args:
+            symbols: Uppercase stock symbols.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+
+        Returns:
+            Dictionary mapping symbol -> non-empty list of price rows. Symbols
+            without data, or whose batch failed after retries, are omitted so
+            callers can fall back to per-symbol downloads.
+        """
+        rows: Dict[str, List[PriceRow]] = {}
+        for i in range(0, len(symbols), BATCH_SIZE):
+            chunk = symbols[i : i + BATCH_SIZE]
+            try:
+                frames = self._retry_with_backoff(self._download_batch, chunk, start_date, end_date)
+            except Exception as e:
+                logger.warning(f"Batch download failed for {len(chunk)} symbols: {e}")
+                continue
+
+            for symbol, hist in frames.items():
+                symbol_rows = list(self._iter_price_rows(hist, symbol, start_date, end_date))
+                if symbol_rows:
+                    rows[symbol] = symbol_rows
+        return rows
+
+    def _download_batch(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[str, pd.DataFrame]:
+        """Download price history for several symbols in one yfinance request.
+
+        Args:
+            symbols: Uppercase stock symbols.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+
+        Returns:
+            Dictionary mapping symbol -> non-empty history DataFrame. Symbols
+            without data are omitted.
+        """
+        if not symbols:
+            return {}
+
+        self._rate_limit()
+
+        hist = yf.download(
+            tickers=symbols,
+            start=start_date,
+            end=end_date + timedelta(days=1),
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+        if hist is None or hist.empty:
+            return {}
+
+        if not isinstance(hist.columns, pd.MultiIndex):
+            # Older yfinance versions return flat columns for a single ticker
+            frames = {symbols[0]: hist} if len(symbols) == 1 else {}
+        else:
+            tickers = set(hist.columns.get_level_values(0))
+            frames = {symbol: hist[symbol] for symbol in symbols if symbol in tickers}
+
+        # Batched frames share one date index, so drop dates a symbol did not trade
+        frames = {symbol: frame.dropna(how="all") for symbol, frame in frames.items()}
+        return {symbol: frame for symbol, frame in frames.items() if not frame.empty}
+
+    def _save_mode(self, symbol: str, start_date: date, end_date: date) -> str:
+        """Choose the Price.save_rows mode for a downloaded price range.
+
+        Args:
+            symbol: Stock symbol.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+
+        Returns:
+            'ignore' if the range has no cached prices yet (first-time
+            population), otherwise 'upsert' to refresh the cached prices.
+        """
+        if get_cached_symbols([symbol], start_date, end_date, self.db):
+            return "upsert"
+        return "ignore"
+
+    def _iter_price_rows(
+        self,
+        hist: pd.DataFrame,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[PriceRow]:
+        """Yield normalized price rows from a yfinance history DataFrame.
+
+        Args:
+            hist: History DataFrame indexed by date.
+            symbol: Uppercase stock symbol.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+            progress_callback: Optional callback(current, total) for progress tracking.
+
+        Yields:
+            Tuples of (symbol, ISO date, close, open, high, low, volume).
+        """
+        frame = normalize_price_frame(hist, symbol)
+        if frame.empty:
+            return
+
+        index = frame.index
+        if not isinstance(index, pd.DatetimeIndex):
+            index = pd.to_datetime(index)
+        dates = index.strftime("%Y-%m-%d")
+
+        # ISO dates compare correctly as strings
+        keep = (dates >= start_date.isoformat()) & (dates <= end_date.isoformat())
+
+        # Rows are written unvalidated, so drop any that Price.validate would reject
+        invalid = (
+            (frame["open"] <= 0)
+            | (frame["high"] <= 0)
+            | (frame["low"] <= 0)
+            | (frame["volume"] < 0)
+        ).to_numpy() & keep
+        if invalid.any():
+            logger.warning(f"Skipping {int(invalid.sum())} invalid price rows for {symbol}")
+            keep &= ~invalid
+
+        frame = frame[keep]
+        values = frame.astype(object).where(frame.notna(), None)
+        total = len(frame)
+
+        for current, (price_date, (close, open_price, high, low, volume)) in enumerate(
+            zip(dates[keep], values.itertuples(index=False, name=None)), start=1
+        ):
+            if progress_callback:
+                progress_callback(current, total)
+
+            yield (
+                symbol,
+                price_date,
+                close,
+                open_price,
+                high,
+                low,
+                int(volume) if volume is not None else None,
+            )
 
     def download_latest_price(
         self,
@@ -357,12 +591,16 @@ class PriceDownloader:
                     logger.warning(f"No data available for {symbol}")
                     return None
 
-                # Get the most recent row
-                row = hist.iloc[-1]
-                price_date = hist.index[-1].date() if isinstance(hist.index[-1], pd.Timestamp) else date.today()
+                # Get the most recent row straight from the underlying array,
+                # without building a Series for it
+                last_row = dict(zip(hist.columns, hist.to_numpy()[-1].tolist()))
+                last_index = hist.index[-1]
+                price_date = (
+                    last_index.date() if isinstance(last_index, pd.Timestamp) else date.today()
+                )
 
                 # Normalize data
-                price_data = normalize_price_data(row.to_dict(), symbol, price_date)
+                price_data = normalize_yf_row(last_row, symbol, price_date)
                 if price_data is None:
                     return None
 
@@ -403,6 +641,7 @@ class PriceDownloader:
         end_date: date,
         use_cache: Optional[bool] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> Dict[str, List[Price]]:
         """Download prices for multiple symbols.
 
@@ -412,6 +651,8 @@ class PriceDownloader:
             end_date: End date (inclusive).
             use_cache: Override instance cache setting.
             progress_callback: Optional callback(current, total) for progress tracking.
+            max_workers: Maximum concurrent downloads for symbols missing from the
+                batched request.
 
         Returns:
             Dictionary mapping symbol -> list of Price instances.
@@ -427,24 +668,67 @@ class PriceDownloader:
         if start_date > end_date:
             raise ValidationError("start_date must be <= end_date")
 
+        cache_enabled = use_cache if use_cache is not None else self.use_cache
+        normalized = {symbol: symbol.strip().upper() for symbol in symbols}
+
+        # Fetch the symbols in batched requests; symbols missing from the
+        # batches fall back to per-symbol downloads below
+        batch = self.fetch_batch_price_rows(
+            list(dict.fromkeys(normalized.values())), start_date, end_date
+        )
+
         results: Dict[str, List[Price]] = {}
+        cache_rows: List[PriceRow] = []
+        fallback_symbols: List[str] = []
         total = len(symbols)
         current = 0
 
         for symbol in symbols:
+            rows = batch.get(normalized[symbol])
+            if not rows:
+                fallback_symbols.append(symbol)
+                continue
+
+            cache_rows.extend(rows)
+            results[symbol] = [Price(*row) for row in rows]
             current += 1
             if progress_callback:
                 progress_callback(current, total)
 
-            try:
-                prices = self.download_prices(
-                    symbol, start_date, end_date, use_cache=use_cache
-                )
-                results[symbol] = prices
-            except Exception as e:
-                logger.error(f"Error downloading prices for {symbol}: {e}")
-                results[symbol] = []  # Empty list on error
-
+        # Per-symbol downloads are network-bound, so overlap them in worker threads
+        # (the rate limiter still spaces out requests); cache writes stay on this thread
+        fallback_symbols = list(dict.fromkeys(fallback_symbols))
+        if fallback_symbols:
+            workers = min(max_workers, len(fallback_symbols))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self.fetch_price_rows, symbol, start_date, end_date): symbol
+                    for symbol in fallback_symbols
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        rows = future.result()
+                    except Exception as e:
+                        logger.error(f"Error downloading prices for {symbol}: {e}")
+                        rows = []  # Empty list on error
+
+                    cache_rows.extend(rows)
+                    results[symbol] = [Price(*row) for row in rows]
+                    current += 1
+                    if progress_callback:
+                        progress_callback(current, total)
+
+        if cache_enabled and cache_rows:
+            # First-time symbols are plain inserts; cached ones refresh their prices
+            cached = get_cached_symbols(normalized.values(), start_date, end_date, self.db)
+            first_rows = [row for row in cache_rows if row[0] not in cached]
+            refresh_rows = [row for row in cache_rows if row[0] in cached]
+            for rows, mode in ((first_rows, "ignore"), (refresh_rows, "upsert")):
+                if rows:
+                    Price.save_rows(rows, self.db, mode=mode)
+
+        results = {symbol: results[symbol] for symbol in symbols}
         logger.info(f"Downloaded prices for {len(results)} symbols")
         return results
 
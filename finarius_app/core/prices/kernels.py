@@ -0,0 +1,34 @@
+"""Numeric kernels for price analytics.
+
+Kernels operate on NumPy arrays and are JIT-compiled with Numba when it is
+installed (see :mod:`finarius_app.core.jit`); otherwise they run as plain
+NumPy code.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from ..jit import njit
+
+
+@njit(cache=True, error_model="numpy")
+def daily_returns_kernel(closes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute day-over-day changes between consecutive closing prices.
+
+    Args:
+        closes: Closing prices ordered by date (float64), NaN where missing.
+
+    Returns:
+        Tuple (absolute_changes, daily_returns, valid) of length
+        ``len(closes) - 1``. Daily returns are percentages. ``valid`` is False
+        where either close is NaN or the previous close is zero; the other
+        arrays hold meaningless values at those positions.
+    """
+    prev_closes = closes[:-1]
+    curr_closes = closes[1:]
+    valid = (prev_closes != 0.0) & ~np.isnan(prev_closes) & ~np.isnan(curr_closes)
+    absolute_changes = curr_closes - prev_closes
+    # Divide by 1.0 where invalid so no divide-by-zero warnings are raised
+    daily_returns = absolute_changes / np.where(valid, prev_closes, 1.0) * 100.0
+    return absolute_changes, daily_returns, valid
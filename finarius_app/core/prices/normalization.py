@@ -1,13 +1,20 @@
 """Price data normalization utilities."""
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from datetime import date
 
+import pandas as pd
+
 from .exceptions import InsufficientDataError
 
 logger = logging.getLogger(__name__)
 
+# Normalized price columns, in PriceRow order
+PRICE_COLUMNS = ["close", "open", "high", "low", "volume"]
+# Price fields rescaled by split and dividend adjustments
+ADJUSTED_PRICE_FIELDS = ("close", "open", "high", "low")
+
 
 def normalize_price_data(
     raw_data: Dict[str, Any],
@@ -37,12 +44,11 @@ def normalize_price_data(
         logger.warning(f"No data for {symbol} on {price_date}")
         return None
 
-    # Normalize field names (yfinance uses different case conventions)
-    normalized = {}
-
-    # Close price is required
+    # Close price is required (yfinance capitalizes field names)
     close = raw_data.get("Close") or raw_data.get("close")
-    if close is None or (isinstance(close, float) and close <= 0):
+    if close is not None:
+        close = float(close)
+    if close is None or close <= 0:
         if handle_missing == "raise":
             raise InsufficientDataError(
                 f"Missing or invalid close price for {symbol} on {price_date}"
@@ -53,44 +59,140 @@ def normalize_price_data(
             logger.warning(f"Missing close price for {symbol} on {price_date}")
             return None
 
-    normalized["close"] = float(close)
-
     # Optional fields
     open_price = raw_data.get("Open") or raw_data.get("open")
-    normalized["open"] = float(open_price) if open_price is not None else None
-
+    if open_price is not None:
+        open_price = float(open_price)
     high = raw_data.get("High") or raw_data.get("high")
-    normalized["high"] = float(high) if high is not None else None
-
+    if high is not None:
+        high = float(high)
     low = raw_data.get("Low") or raw_data.get("low")
-    normalized["low"] = float(low) if low is not None else None
-
+    if low is not None:
+        low = float(low)
     volume = raw_data.get("Volume") or raw_data.get("volume")
-    normalized["volume"] = int(volume) if volume is not None else None
+    if volume is not None:
+        volume = int(volume)
 
     # Validate data consistency
-    if normalized["high"] is not None and normalized["low"] is not None:
-        if normalized["high"] < normalized["low"]:
-            logger.warning(
-                f"Invalid price data for {symbol} on {price_date}: "
-                f"high ({normalized['high']}) < low ({normalized['low']})"
-            )
-            # Swap if needed
-            normalized["high"], normalized["low"] = normalized["low"], normalized["high"]
-
-    if normalized["close"] is not None:
-        if normalized["high"] is not None and normalized["close"] > normalized["high"]:
-            logger.warning(
-                f"Close price ({normalized['close']}) > high ({normalized['high']}) "
-                f"for {symbol} on {price_date}"
-            )
-        if normalized["low"] is not None and normalized["close"] < normalized["low"]:
-            logger.warning(
-                f"Close price ({normalized['close']}) < low ({normalized['low']}) "
-                f"for {symbol} on {price_date}"
+    if high is not None and low is not None and high < low:
+        logger.warning(
+            f"Invalid price data for {symbol} on {price_date}: "
+            f"high ({high}) < low ({low})"
+        )
+        # Swap if needed
+        high, low = low, high
+
+    if high is not None and close > high:
+        logger.warning(f"Close price ({close}) > high ({high}) for {symbol} on {price_date}")
+    if low is not None and close < low:
+        logger.warning(f"Close price ({close}) < low ({low}) for {symbol} on {price_date}")
+
+    return {"close": close, "open": open_price, "high": high, "low": low, "volume": volume}
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    """Convert a yfinance OHL value, treating NaN and zero as missing."""
+    if value is None or value != value or value == 0:
+        return None
+    return float(value)
+
+
+def normalize_yf_row(
+    row: Mapping[str, Any],
+    symbol: str,
+    price_date: date,
+) -> Optional[Dict[str, Any]]:
+    """Normalize a single yfinance history row.
+
+    Specialization of :func:`normalize_price_data` (in 'skip' mode) for rows
+    taken straight from ``Ticker.history``, whose columns are always the
+    capitalized Close/Open/High/Low/Volume: each field is read once by that
+    name. NaN handling matches :func:`normalize_price_frame`.
+
+    Args:
+        row: History row mapping yfinance column names to values.
+        symbol: Stock symbol (for logging).
+        price_date: Price date (for logging).
+
+    Returns:
+        Normalized price data dictionary, or None if the close is missing or
+        not positive.
+    """
+    close = row.get("Close")
+    if close is None or not close > 0:
+        logger.warning(f"Missing close price for {symbol} on {price_date}")
+        return None
+
+    high = _optional_float(row.get("High"))
+    low = _optional_float(row.get("Low"))
+    if high is not None and low is not None and high < low:
+        logger.warning(
+            f"Invalid price data for {symbol} on {price_date}: high ({high}) < low ({low})"
+        )
+        high, low = low, high
+
+    volume = row.get("Volume")
+    return {
+        "close": float(close),
+        "open": _optional_float(row.get("Open")),
+        "high": high,
+        "low": low,
+        "volume": int(volume) if volume is not None and volume == volume else None,
+    }
+
+
+def normalize_price_frame(
+    hist: pd.DataFrame,
+    symbol: str,
+    handle_missing: str = "skip",
+) -> pd.DataFrame:
+    """Normalize a whole yfinance history DataFrame in one vectorized pass.
+
+    DataFrame counterpart of :func:`normalize_price_data` for download ranges,
+    so no per-row dict is built.
+
+    Args:
+        hist: History DataFrame indexed by date, with yfinance column names.
+        symbol: Stock symbol (for logging).
+        handle_missing: How to handle rows without a positive close: 'skip',
+            'raise', or 'fill_zero'.
+
+    Returns:
+        DataFrame with the original index and float64 close, open, high, low
+        and volume columns (NaN where missing). Rows without a positive close
+        are dropped (or get a zero close with 'fill_zero'); zero open/high/low
+        values are treated as missing, and swapped high/low values are corrected.
+
+    Raises:
+        InsufficientDataError: If a row has no positive close and handle_missing='raise'.
+    """
+    frame = hist.rename(columns=str.lower).reindex(columns=PRICE_COLUMNS)
+    frame = frame.apply(pd.to_numeric, errors="coerce").astype("float64")
+
+    ohl = ["open", "high", "low"]
+    frame[ohl] = frame[ohl].where(frame[ohl] != 0)
+
+    has_close = frame["close"] > 0
+    if not has_close.all():
+        missing = int((~has_close).sum())
+        if handle_missing == "raise":
+            raise InsufficientDataError(
+                f"Missing or invalid close price for {symbol} on {missing} rows"
             )
+        if handle_missing == "fill_zero":
+            frame.loc[~has_close, "close"] = 0.0
+        else:
+            logger.warning(f"Skipping {missing} rows with missing close price for {symbol}")
+            frame = frame[has_close]
 
-    return normalized
+    swapped = frame["high"] < frame["low"]
+    if swapped.any():
+        logger.warning(
+            f"Invalid price data for {symbol}: high < low on {int(swapped.sum())} rows, swapping"
+        )
+        frame.loc[swapped, ["high", "low"]] = frame.loc[swapped, ["low", "high"]].to_numpy()
+
+    return frame
 
 
 def handle_stock_split(
@@ -112,13 +214,12 @@ def handle_stock_split(
     for price_date, price_data in prices.items():
         if price_date < split_date:
             # Adjust prices before split
-            adjusted_data = price_data.copy()
-            for key in ["close", "open", "high", "low"]:
-                if adjusted_data.get(key) is not None:
-                    adjusted_data[key] = adjusted_data[key] / split_ratio
-            adjusted[price_date] = adjusted_data
-        else:
-            adjusted[price_date] = price_data
+            price_data = price_data.copy()
+            for key in ADJUSTED_PRICE_FIELDS:
+                value = price_data.get(key)
+                if value is not None:
+                    price_data[key] = value / split_ratio
+        adjusted[price_date] = price_data
 
     logger.info(f"Adjusted prices for stock split on {split_date} with ratio {split_ratio}")
     return adjusted
@@ -143,13 +244,12 @@ def handle_dividend_adjustment(
     for price_date, price_data in prices.items():
         if price_date < ex_dividend_date:
             # Adjust prices before ex-dividend date
-            adjusted_data = price_data.copy()
-            for key in ["close", "open", "high", "low"]:
-                if adjusted_data.get(key) is not None:
-                    adjusted_data[key] = adjusted_data[key] - dividend_amount
-            adjusted[price_date] = adjusted_data
-        else:
-            adjusted[price_date] = price_data
+            price_data = price_data.copy()
+            for key in ADJUSTED_PRICE_FIELDS:
+                value = price_data.get(key)
+                if value is not None:
+                    price_data[key] = value - dividend_amount
+        adjusted[price_date] = price_data
 
     logger.debug(
         f"Adjusted prices for dividend of {dividend_amount} on {ex_dividend_date}"
@@ -1,11 +1,14 @@
 """Price update scheduler for managing automatic price updates."""
 
 import logging
-from typing import Optional, List, Set, Dict, Any, Callable
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Set, Dict, Any, Callable, Iterable, Iterator, Tuple
+from datetime import date, datetime, timedelta, timezone
 
 from ..database import Database
-from .downloader import PriceDownloader
+from ..models.price import Price, PriceRow
+from .downloader import DEFAULT_MAX_WORKERS, PriceDownloader
+from .cache import SQLITE_MAX_VARIABLES, bulk_write_window, get_cached_symbols
 from .exceptions import PriceDownloadError
 
 logger = logging.getLogger(__name__)
@@ -27,25 +30,18 @@ def get_all_portfolio_symbols(
     if db is None:
         db = Database()
 
+    # Uppercase and deduplicate in SQLite so each symbol crosses over only once
+    query = """
+        SELECT DISTINCT UPPER(symbol) AS symbol
+        FROM transactions
+        WHERE symbol IS NOT NULL AND symbol != ''
+    """
     if account_id is not None:
-        query = """
-            SELECT DISTINCT symbol
-            FROM transactions
-            WHERE symbol IS NOT NULL
-            AND account_id = ?
-            ORDER BY symbol
-        """
-        results = db.fetchall(query, (account_id,))
+        results = db.fetchall(query + " AND account_id = ?", (account_id,))
     else:
-        query = """
-            SELECT DISTINCT symbol
-            FROM transactions
-            WHERE symbol IS NOT NULL
-            ORDER BY symbol
-        """
         results = db.fetchall(query)
 
-    symbols = {row["symbol"].upper() for row in results if row["symbol"]}
+    symbols = {row["symbol"] for row in results}
     logger.debug(f"Found {len(symbols)} unique symbols in portfolio")
     return symbols
 
@@ -76,27 +72,118 @@ def get_last_update_time(
     )
 
     if result and result["last_update"]:
-        try:
-            # Parse the timestamp
-            timestamp_str = result["last_update"]
-            # Handle both with and without timezone
-            if "T" in timestamp_str:
-                return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            else:
-                return datetime.fromisoformat(timestamp_str)
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Error parsing last update time for {symbol}: {e}")
-            return None
+        return _parse_last_update(symbol, result["last_update"])
 
     return None
 
 
+def get_last_update_times(
+    symbols: Iterable[str],
+    db: Optional[Database] = None,
+) -> Dict[str, datetime]:
+    """Get the last update times of several symbols with one query per chunk.
+
+    Args:
+        symbols: Stock symbols.
+        db: Database instance. If None, creates a new instance.
+
+    Returns:
+        Dictionary mapping uppercase symbols to their last update time. Symbols
+        without prices (or with unparseable timestamps) are omitted.
+    """
+    if db is None:
+        db = Database()
+
+    symbols = sorted({symbol.upper() for symbol in symbols})
+    last_updates: Dict[str, datetime] = {}
+    for i in range(0, len(symbols), SQLITE_MAX_VARIABLES):
+        chunk = symbols[i : i + SQLITE_MAX_VARIABLES]
+        placeholders = ",".join("?" * len(chunk))
+        rows = db.fetchall(
+            f"""
+            SELECT symbol, MAX(created_at) as last_update
+            FROM prices
+            WHERE symbol IN ({placeholders})
+            GROUP BY symbol
+            """,
+            tuple(chunk),
+        )
+        for row in rows:
+            if row["last_update"]:
+                last_update = _parse_last_update(row["symbol"], row["last_update"])
+                if last_update is not None:
+                    last_updates[row["symbol"]] = last_update
+
+    return last_updates
+
+
+def _parse_last_update(symbol: str, value: str) -> Optional[datetime]:
+    """Parse a prices.created_at timestamp.
+
+    Price writers never set created_at themselves, so it always holds SQLite
+    CURRENT_TIMESTAMP text (naive UTC, "YYYY-MM-DD HH:MM:SS").
+
+    Args:
+        symbol: Stock symbol, used in the warning logged on failure.
+        value: Stored timestamp.
+
+    Returns:
+        Parsed naive UTC datetime or None if the value cannot be parsed.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Error parsing last update time for {symbol}: {e}")
+        return None
+
+
+def _update_result(symbol: str) -> Dict[str, Any]:
+    """Build the initial (failed, empty) result of a symbol update.
+
+    Args:
+        symbol: Stock symbol.
+
+    Returns:
+        Result dictionary as returned by update_prices_for_symbol.
+    """
+    return {
+        "success": False,
+        "symbol": symbol.upper(),
+        "prices_downloaded": 0,
+        "error": None,
+    }
+
+
+def _utc_now() -> datetime:
+    """Return the current time as a naive UTC datetime, comparable to created_at."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _updated_recently(symbol: str, last_update: Optional[datetime], now: datetime) -> bool:
+    """Check whether a symbol's prices were updated within the last hour.
+
+    Args:
+        symbol: Stock symbol.
+        last_update: Last update time of the symbol (naive UTC), None if it has
+            no prices.
+        now: Current naive UTC time.
+
+    Returns:
+        True if the symbol should be skipped unless the update is forced.
+    """
+    if last_update and now - last_update.replace(tzinfo=None) < timedelta(hours=1):
+        logger.debug(f"Skipping {symbol}: updated recently")
+        return True
+    return False
+
+
 def update_prices_for_symbol(
     symbol: str,
     downloader: Optional[PriceDownloader] = None,
     db: Optional[Database] = None,
     days_back: int = 365,
     force_update: bool = False,
+    last_update: Optional[datetime] = None,
 ) -> Dict[str, Any]:
     """Update prices for a specific symbol.
 
@@ -106,6 +193,8 @@ def update_prices_for_symbol(
         db: Database instance. If None, creates a new instance.
         days_back: Number of days back to update prices (default: 365).
         force_update: If True, update even if recently updated.
+        last_update: Last update time of the symbol if already known (e.g. from
+            get_last_update_times). If None, it is queried from the database.
 
     Returns:
         Dictionary with update results:
@@ -120,23 +209,16 @@ def update_prices_for_symbol(
     if downloader is None:
         downloader = PriceDownloader(db=db)
 
-    result = {
-        "success": False,
-        "symbol": symbol.upper(),
-        "prices_downloaded": 0,
-        "error": None,
-    }
+    result = _update_result(symbol)
 
     try:
-        # Check last update time if not forcing
+        # Don't update if updated within last hour, unless forcing
         if not force_update:
-            last_update = get_last_update_time(symbol, db)
-            if last_update:
-                # Don't update if updated within last hour
-                if datetime.now() - last_update.replace(tzinfo=None) < timedelta(hours=1):
-                    logger.debug(f"Skipping {symbol}: updated recently")
-                    result["success"] = True
-                    return result
+            if last_update is None:
+                last_update = get_last_update_time(symbol, db)
+            if _updated_recently(symbol, last_update, _utc_now()):
+                result["success"] = True
+                return result
 
         # Calculate date range
         end_date = date.today()
@@ -144,11 +226,11 @@ def update_prices_for_symbol(
 
         # Download prices
         logger.info(f"Updating prices for {symbol} from {start_date} to {end_date}")
-        prices = downloader.download_prices(symbol, start_date, end_date)
+        count = downloader.download_prices_to_cache(symbol, start_date, end_date)
 
         result["success"] = True
-        result["prices_downloaded"] = len(prices)
-        logger.info(f"Updated {len(prices)} prices for {symbol}")
+        result["prices_downloaded"] = count
+        logger.info(f"Updated {count} prices for {symbol}")
 
     except Exception as e:
         logger.error(f"Error updating prices for {symbol}: {e}")
@@ -158,6 +240,57 @@ def update_prices_for_symbol(
     return result
 
 
+def _download_price_rows(
+    downloader: PriceDownloader,
+    symbols: List[str],
+    start_date: date,
+    end_date: date,
+    max_workers: int,
+) -> Iterator[Tuple[str, List[PriceRow], Optional[Exception]]]:
+    """Download price rows for several symbols, yielding each as it completes.
+
+    Symbols are first requested in batches that share one HTTP request each;
+    symbols the batches did not return are then downloaded one by one in
+    worker threads (the downloader's rate limiter still spaces out requests).
+    Results are yielded on the calling thread, which can write them to the
+    database.
+
+    Args:
+        downloader: PriceDownloader instance.
+        symbols: Uppercase stock symbols.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+        max_workers: Maximum number of concurrent per-symbol downloads.
+
+    Yields:
+        Tuples of (symbol, rows, error); error is the exception raised by a
+        failed download, in which case rows is empty.
+    """
+    batch: Dict[str, List[PriceRow]] = {}
+    if len(symbols) > 1:
+        batch = downloader.fetch_batch_price_rows(symbols, start_date, end_date)
+    for symbol in symbols:
+        if symbol in batch:
+            yield symbol, batch[symbol], None
+
+    remaining = [symbol for symbol in symbols if symbol not in batch]
+    if not remaining:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining))) as executor:
+        futures = {
+            executor.submit(downloader.fetch_price_rows, symbol, start_date, end_date): symbol
+            for symbol in remaining
+        }
+        for future in as_completed(futures):
+            try:
+                rows = future.result()
+            except Exception as e:
+                yield futures[future], [], e
+                continue
+            yield futures[future], rows, None
+
+
 def update_all_prices(
     downloader: Optional[PriceDownloader] = None,
     db: Optional[Database] = None,
@@ -165,16 +298,24 @@ def update_all_prices(
     days_back: int = 365,
     force_update: bool = False,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> Dict[str, Any]:
     """Update prices for all symbols in the portfolio.
 
+    Symbols are downloaded in batched requests, with the rest fetched
+    concurrently in worker threads; freshness checks and cache writes stay on
+    the calling thread, which owns the database connection. The downloaded
+    rows are written together once every download has finished.
+
     Args:
         downloader: PriceDownloader instance. If None, creates a new instance.
         db: Database instance. If None, creates a new instance.
         account_id: Optional account ID to filter by. If None, updates all symbols.
         days_back: Number of days back to update prices (default: 365).
         force_update: If True, update even if recently updated.
-        progress_callback: Optional callback(current, total, symbol) for progress.
+        progress_callback: Optional callback(completed, total, symbol) for progress,
+            called on the calling thread as each symbol is checked or downloaded.
+        max_workers: Maximum number of concurrent downloads.
 
     Returns:
         Dictionary with update results:
@@ -182,7 +323,7 @@ def update_all_prices(
         - successful: int
         - failed: int
         - total_prices: int
-        - results: List[Dict] - individual symbol results
+        - results: List[Dict] - individual symbol results, sorted by symbol
     """
     if db is None:
         db = Database()
@@ -205,25 +346,65 @@ def update_all_prices(
 
     logger.info(f"Updating prices for {len(symbols)} symbols")
 
-    results = []
-    successful = 0
-    failed = 0
-    total_prices = 0
-
-    for idx, symbol in enumerate(sorted(symbols), 1):
+    symbols = sorted(symbols)
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days_back)
+
+    results_by_symbol: Dict[str, Dict[str, Any]] = {}
+    pending: List[str] = []
+    completed = 0
+    last_updates = {} if force_update else get_last_update_times(symbols, db)
+    now = _utc_now()
+
+    for symbol in symbols:
+        if not force_update and _updated_recently(symbol, last_updates.get(symbol), now):
+            result = _update_result(symbol)
+            result["success"] = True
+            results_by_symbol[symbol] = result
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, len(symbols), symbol)
+        else:
+            pending.append(symbol)
+
+    # Download everything first: the bulk write window relaxes durability for
+    # the shared connection, so it must not stay open during network requests
+    downloaded = []
+    for symbol, rows, error in _download_price_rows(
+        downloader, pending, start_date, end_date, max_workers
+    ):
+        downloaded.append((symbol, rows, error))
+        completed += 1
         if progress_callback:
-            progress_callback(idx, len(symbols), symbol)
+            progress_callback(completed, len(symbols), symbol)
 
-        result = update_prices_for_symbol(
-            symbol, downloader, db, days_back, force_update
+    if downloaded:
+        # Symbols without cached prices in the range are first-time population:
+        # plain inserts, with OR REPLACE only for refreshing existing prices
+        cached = get_cached_symbols(
+            (symbol for symbol, rows, _ in downloaded if rows), start_date, end_date, db
         )
-
-        results.append(result)
-        if result["success"]:
-            successful += 1
-            total_prices += result["prices_downloaded"]
-        else:
-            failed += 1
+        with bulk_write_window(db):
+            for symbol, rows, error in downloaded:
+                result = _update_result(symbol)
+                try:
+                    if error is not None:
+                        raise error
+                    mode = "upsert" if symbol in cached else "ignore"
+                    count = Price.save_rows(rows, db, mode=mode)
+                    result["success"] = True
+                    result["prices_downloaded"] = count
+                    logger.info(f"Updated {count} prices for {symbol}")
+                except Exception as e:
+                    logger.error(f"Error updating prices for {symbol}: {e}")
+                    result["error"] = str(e)
+
+                results_by_symbol[symbol] = result
+
+    results = [results_by_symbol[symbol] for symbol in symbols]
+    successful = sum(1 for result in results if result["success"])
+    failed = len(results) - successful
+    total_prices = sum(result["prices_downloaded"] for result in results)
 
     summary = {
         "total_symbols": len(symbols),
@@ -2,10 +2,14 @@
 
 import re
 import logging
-from typing import Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import yfinance as yf
 
+from ..utils import SYMBOL_PATTERN
 from .exceptions import SymbolNotFoundError, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -47,6 +51,17 @@ CRYPTO_PATTERNS = [
     r"^[A-Z]{2,10}-EUR$",  # BTC-EUR, etc.
     r"^[A-Z]{2,10}-GBP$",  # BTC-GBP, etc.
 ]
+# Ticker.info responses are reused for this many seconds, so checking that a
+# symbol exists and then fetching its info costs a single request
+SYMBOL_INFO_TTL = 300.0
+SYMBOL_INFO_CACHE_SIZE = 1024
+
+# Symbol -> (time.monotonic() of the request, Ticker.info), oldest first
+_symbol_info_cache: Dict[str, Tuple[float, Any]] = {}
+_symbol_info_lock = threading.Lock()
+
+# All crypto patterns compiled into one alternation, matched in a single call
+_CRYPTO_RE = re.compile("|".join(f"(?:{pattern})" for pattern in CRYPTO_PATTERNS))
 
 
 def validate_symbol(symbol: str) -> bool:
@@ -64,22 +79,37 @@ def validate_symbol(symbol: str) -> bool:
     if not symbol or not isinstance(symbol, str):
         raise ValidationError("Symbol must be a non-empty string")
 
+    return _validate_symbol_format(symbol)
+
+
+@lru_cache(maxsize=4096)
+def _validate_symbol_format(symbol: str) -> bool:
+    """Validate the format of a non-empty symbol string.
+
+    Cached because watchlist refreshes validate the same symbols repeatedly;
+    invalid symbols raise and are therefore never cached.
+
+    Args:
+        symbol: Stock symbol to validate.
+
+    Returns:
+        True if symbol format is valid.
+
+    Raises:
+        ValidationError: If symbol format is invalid.
+    """
     symbol = symbol.strip().upper()
 
     if not symbol:
         raise ValidationError("Symbol cannot be empty or whitespace")
 
     # Basic format validation: alphanumeric, dots, hyphens allowed
-    if not re.match(r"^[A-Z0-9.\-]+$", symbol):
+    if not SYMBOL_PATTERN.match(symbol):
         raise ValidationError(
             f"Symbol '{symbol}' contains invalid characters. "
             "Only letters, numbers, dots, and hyphens are allowed."
         )
 
-    # Check minimum length
-    if len(symbol) < 1:
-        raise ValidationError("Symbol must be at least 1 character long")
-
     # Check maximum length (reasonable limit)
     if len(symbol) > 20:
         raise ValidationError("Symbol cannot exceed 20 characters")
@@ -88,6 +118,60 @@ def validate_symbol(symbol: str) -> bool:
     return True
 
 
+def is_crypto_symbol(symbol: str) -> bool:
+    """Check whether a symbol is a crypto currency pair (e.g. BTC-USD).
+
+    Args:
+        symbol: Stock symbol.
+
+    Returns:
+        True if the symbol matches one of the CRYPTO_PATTERNS.
+    """
+    return _CRYPTO_RE.match(symbol.strip().upper()) is not None
+
+
+def get_exchange_name(symbol: str) -> Optional[str]:
+    """Get the exchange of a symbol from its suffix (e.g. ".PA" for Paris).
+
+    Args:
+        symbol: Stock symbol.
+
+    Returns:
+        Exchange name, or None if the symbol has no known exchange suffix.
+    """
+    base, dot, suffix = symbol.strip().upper().rpartition(".")
+    if not base:
+        return None
+    return EXCHANGE_SUFFIXES.get(dot + suffix)
+
+
+def _get_ticker_info(symbol: str) -> Any:
+    """Fetch yfinance Ticker.info for a symbol, reusing recent responses.
+
+    Failed requests raise and are not cached.
+
+    Args:
+        symbol: Uppercase stock symbol.
+
+    Returns:
+        The Ticker.info value (normally a dict, possibly empty).
+    """
+    now = time.monotonic()
+    with _symbol_info_lock:
+        cached = _symbol_info_cache.get(symbol)
+    if cached is not None and now - cached[0] < SYMBOL_INFO_TTL:
+        return cached[1]
+
+    info = yf.Ticker(symbol).info
+
+    with _symbol_info_lock:
+        _symbol_info_cache.pop(symbol, None)
+        _symbol_info_cache[symbol] = (now, info)
+        if len(_symbol_info_cache) > SYMBOL_INFO_CACHE_SIZE:
+            del _symbol_info_cache[next(iter(_symbol_info_cache))]
+    return info
+
+
 def symbol_exists(symbol: str, timeout: int = 5) -> bool:
     """Check if symbol exists and is valid.
 
@@ -110,9 +194,7 @@ def symbol_exists(symbol: str, timeout: int = 5) -> bool:
     symbol = symbol.strip().upper()
 
     try:
-        ticker = yf.Ticker(symbol)
-        # Try to get basic info (fast operation)
-        info = ticker.info
+        info = _get_ticker_info(symbol)
 
         # Check if we got valid info
         if info and isinstance(info, dict) and len(info) > 0:
@@ -147,8 +229,7 @@ def get_symbol_info(symbol: str) -> Optional[dict]:
     symbol = symbol.strip().upper()
 
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = _get_ticker_info(symbol)
 
         if not info or not isinstance(info, dict) or len(info) == 0:
             raise SymbolNotFoundError(f"Symbol '{symbol}' not found or has no data")
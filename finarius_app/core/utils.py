@@ -4,15 +4,83 @@ This module provides common utility functions for date handling, number formatti
 validation, and data manipulation used throughout the application.
 """
 
+import math
+import re
 from datetime import date, datetime
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Optional, List
 from decimal import Decimal, ROUND_HALF_UP
 
+import numpy as np
+
 from .config import Config
 from .exceptions import ValidationError
+from .jit import njit
+
+
+@lru_cache(maxsize=32)
+def _config_value(key: str, default: Any, config_version: int) -> Any:
+    """Get a configuration value, memoized per configuration version.
+
+    Formatting helpers run once per rendered cell, so they read settings
+    through this instead of looking them up in Config on every call. Passing
+    Config.version makes any config change bypass older entries.
+
+    Args:
+        key: Configuration key in dot notation.
+        default: Default value if key is not found.
+        config_version: Current Config.version.
+
+    Returns:
+        Configuration value or default.
+    """
+    return Config().get(key, default)
 
 
 # Date utilities
+
+# Shapes of the common date layouts parse_date recognizes without a format.
+# Field widths match what strptime accepts for %Y, %m and %d.
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}")
+# Month and day first, separated by slashes or dashes (US, then European order)
+_DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})([/-])(\d{1,2})\2(\d{4})")
+
+
+def _parse_common_date(date_string: str) -> Optional[date]:
+    """Parse one of the common date layouts accepted by parse_date.
+
+    The layout is recognized from the shape of the string, so at most one
+    parse is attempted per layout instead of trying each format in turn.
+
+    Args:
+        date_string: Date string to parse.
+
+    Returns:
+        Parsed date object, or None if the string is not a valid date in one
+        of the common layouts.
+    """
+    try:
+        match = _ISO_DATE_RE.fullmatch(date_string)
+        if match:
+            year, month, day = match.groups()
+            return date(int(year), int(month), int(day))
+
+        match = _DAY_MONTH_YEAR_RE.fullmatch(date_string)
+        if match:
+            first, _, second, year = match.groups()
+            try:
+                return date(int(year), int(first), int(second))
+            except ValueError:
+                return date(int(year), int(second), int(first))
+
+        if _ISO_DATETIME_RE.fullmatch(date_string):
+            return datetime.strptime(date_string, "%Y-%m-%d %H:%M:%S").date()
+    except ValueError:
+        pass
+    return None
+
+
 def parse_date(date_string: str, date_format: Optional[str] = None) -> date:
     """Parse a date string into a date object.
 
@@ -44,26 +112,15 @@ def parse_date(date_string: str, date_format: Optional[str] = None) -> date:
                 {"date_string": date_string, "format": date_format},
             ) from e
 
-    # Try common formats
-    formats = [
-        "%Y-%m-%d",  # ISO format
-        "%m/%d/%Y",  # US format
-        "%d/%m/%Y",  # European format
-        "%Y-%m-%d %H:%M:%S",  # ISO with time
-        "%m-%d-%Y",  # US format with dashes
-        "%d-%m-%Y",  # European format with dashes
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_string, fmt).date()
-        except ValueError:
-            continue
+    # Try common formats: ISO (with or without time), then US and European
+    # order with slashes or dashes
+    parsed = _parse_common_date(date_string)
+    if parsed is not None:
+        return parsed
 
     # Try using config default format
     try:
-        config = Config()
-        default_format = config.get("display.date_format", "%Y-%m-%d")
+        default_format = _config_value("display.date_format", "%Y-%m-%d", Config.version)
         return datetime.strptime(date_string, default_format).date()
     except (ValueError, AttributeError):
         pass
@@ -93,8 +150,7 @@ def format_date(d: date, date_format: Optional[str] = None) -> str:
         '01/15/2024'
     """
     if date_format is None:
-        config = Config()
-        date_format = config.get("display.date_format", "%Y-%m-%d")
+        date_format = _config_value("display.date_format", "%Y-%m-%d", Config.version)
 
     return d.strftime(date_format)
 
@@ -111,31 +167,59 @@ def get_date_range(start: date, end: date, step_days: int = 1) -> List[date]:
         List of date objects from start to end.
 
     Raises:
-        ValidationError: If start date is after end date.
+        ValidationError: If start date is after end date or step_days is not positive.
 
     Example:
         >>> get_date_range(date(2024, 1, 1), date(2024, 1, 5))
         [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)]
     """
+    return get_date_range_array(start, end, step_days).tolist()
+
+
+def get_date_range_array(start: date, end: date, step_days: int = 1) -> np.ndarray:
+    """Generate a datetime64[D] array of dates between start and end (inclusive).
+
+    Args:
+        start: Start date (inclusive).
+        end: End date (inclusive).
+        step_days: Number of days between each date. Default is 1 (daily).
+
+    Returns:
+        Array of datetime64[D] values from start to end.
+
+    Raises:
+        ValidationError: If start date is after end date or step_days is not positive.
+    """
     if start > end:
         raise ValidationError(
             "Start date must be before or equal to end date",
             {"start": str(start), "end": str(end)},
         )
+    if step_days <= 0:
+        raise ValidationError("Step must be a positive number of days", {"step_days": step_days})
 
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current)
-        # Add step_days to current date
-        from datetime import timedelta
+    return np.arange(
+        np.datetime64(start, "D"),
+        np.datetime64(end, "D") + np.timedelta64(1, "D"),
+        np.timedelta64(step_days, "D"),
+    )
 
-        current += timedelta(days=step_days)
 
-    return dates
+# Number utilities
+
+# Currency symbols
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+    "CAD": "C$",
+    "AUD": "A$",
+    "CHF": "CHF",
+    "CNY": "¥",
+}
 
 
-# Number utilities
 def format_currency(amount: float, currency: Optional[str] = None) -> str:
     """Format a number as currency.
 
@@ -155,26 +239,12 @@ def format_currency(amount: float, currency: Optional[str] = None) -> str:
         '€1,234.56'
     """
     if currency is None:
-        config = Config()
-        currency = config.get("display.default_currency", "USD")
-
-    # Currency symbols
-    symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "JPY": "¥",
-        "CAD": "C$",
-        "AUD": "A$",
-        "CHF": "CHF",
-        "CNY": "¥",
-    }
-
-    symbol = symbols.get(currency, currency)
+        currency = _config_value("display.default_currency", "USD", Config.version)
+
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency)
 
     # Get number format from config
-    config = Config()
-    number_format = config.get("display.number_format", "{:,.2f}")
+    number_format = _config_value("display.number_format", "{:,.2f}", Config.version)
 
     formatted = number_format.format(abs(amount))
     if amount < 0:
@@ -182,6 +252,11 @@ def format_currency(amount: float, currency: Optional[str] = None) -> str:
     return f"{symbol}{formatted}"
 
 
+# Bound str.format methods for the usual decimal counts, so format_percentage
+# does not build and parse a nested format spec on every call
+_PERCENT_FORMATS = {decimals: f"{{:.{decimals}f}}%".format for decimals in range(7)}
+
+
 def format_percentage(value: float, decimals: int = 2) -> str:
     """Format a number as a percentage.
 
@@ -199,13 +274,18 @@ def format_percentage(value: float, decimals: int = 2) -> str:
         '15.2%'
     """
     percentage = value * 100
+    fmt = _PERCENT_FORMATS.get(decimals)
+    if fmt is not None:
+        return fmt(percentage)
     return f"{percentage:.{decimals}f}%"
 
 
 def round_decimal(value: float, decimals: int = 2) -> float:
     """Round a decimal number to specified decimal places.
 
-    Uses banker's rounding (round half to even) for consistency.
+    Rounds half away from zero (ROUND_HALF_UP) on the value's shortest decimal
+    representation, so 3.145 rounds to 3.15 even though the nearest float is
+    slightly below it.
 
     Args:
         value: Value to round.
@@ -218,7 +298,7 @@ def round_decimal(value: float, decimals: int = 2) -> float:
         >>> round_decimal(3.14159, 2)
         3.14
         >>> round_decimal(3.145, 2)
-        3.14
+        3.15
     """
     if decimals < 0:
         raise ValidationError(
@@ -226,14 +306,37 @@ def round_decimal(value: float, decimals: int = 2) -> float:
             {"decimals": decimals},
         )
 
-    # Use Decimal for precise rounding
-    d = Decimal(str(value))
+    text = str(value)
+
+    # Fast path for plain positional notation: round the decimal digits as an
+    # integer. Integer true division is correctly rounded, so the result is
+    # the same float the Decimal path below produces.
+    whole, _, fraction = text.lstrip("-").partition(".")
+    if whole.isdigit() and (not fraction or fraction.isdigit()):
+        if len(fraction) <= decimals:
+            return float(value)
+        drop = 10 ** (len(fraction) - decimals)
+        units, remainder = divmod(int(whole + fraction), drop)
+        if remainder * 2 >= drop:
+            units += 1
+        rounded_value = units / 10**decimals
+        return -rounded_value if text.startswith("-") else rounded_value
+
+    # Use Decimal for precise rounding (exponent notation, nan, inf)
+    d = Decimal(text)
     quantizer = Decimal(10) ** -decimals
     rounded = d.quantize(quantizer, rounding=ROUND_HALF_UP)
     return float(rounded)
 
 
 # Validation utilities
+
+# Allowed symbol characters: alphanumeric, dots, hyphens, starting with an
+# alphanumeric. Shared with prices.validation so both validators accept the
+# same characters.
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9][A-Z0-9.\-]*$")
+
+
 def validate_symbol(symbol: str) -> bool:
     """Validate a stock symbol format.
 
@@ -251,7 +354,7 @@ def validate_symbol(symbol: str) -> bool:
         True
         >>> validate_symbol("")
         False
-        >>> validate_symbol("123")
+        >>> validate_symbol("AA PL")
         False
     """
     if not symbol or not isinstance(symbol, str):
@@ -263,7 +366,12 @@ def validate_symbol(symbol: str) -> bool:
         return False
 
     # Allow letters, numbers, dots, and hyphens
-    return symbol.replace(".", "").replace("-", "").isalnum()
+    return SYMBOL_PATTERN.match(symbol) is not None
+
+
+# Reasonable date range (not too far in past or future)
+_MIN_DATE = date(1900, 1, 1)
+_MAX_DATE = date(2100, 12, 31)
 
 
 def validate_date(d: date) -> bool:
@@ -281,14 +389,7 @@ def validate_date(d: date) -> bool:
         >>> validate_date(date(1900, 1, 1))
         True
     """
-    if not isinstance(d, date):
-        return False
-
-    # Check for reasonable date range (not too far in past or future)
-    min_date = date(1900, 1, 1)
-    max_date = date(2100, 12, 31)
-
-    return min_date <= d <= max_date
+    return isinstance(d, date) and _MIN_DATE <= d <= _MAX_DATE
 
 
 def validate_amount(amount: float) -> bool:
@@ -308,18 +409,12 @@ def validate_amount(amount: float) -> bool:
         >>> validate_amount(float('inf'))
         False
     """
-    if not isinstance(amount, (int, float)):
-        return False
-
-    # Check for finite value
-    import math
-
-    if not math.isfinite(amount):
+    # math.isfinite raises TypeError for non-numeric values
+    try:
+        return math.isfinite(amount) and amount >= 0
+    except TypeError:
         return False
 
-    # Check for non-negative
-    return amount >= 0
-
 
 # Data utilities
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
@@ -375,3 +470,41 @@ def calculate_percentage_change(old: float, new: float) -> float:
 
     return (new - old) / old
 
+
+@njit(cache=True, error_model="numpy")
+def safe_divide_array(
+    numerators: np.ndarray, denominators: np.ndarray, default: float = 0.0
+) -> np.ndarray:
+    """Element-wise :func:`safe_divide` for float64 arrays.
+
+    Args:
+        numerators: Numerator values.
+        denominators: Denominator values, same shape as ``numerators``.
+        default: Value used where the denominator is zero. Default is 0.0.
+
+    Returns:
+        Array of division results, with ``default`` where the denominator is zero.
+    """
+    zero = denominators == 0.0
+    # Divide by 1.0 where zero so no divide-by-zero warnings are raised
+    quotients = numerators / np.where(zero, 1.0, denominators)
+    return np.where(zero, default, quotients)
+
+
+@njit(cache=True, error_model="numpy")
+def percentage_change_array(values: np.ndarray) -> np.ndarray:
+    """Element-wise :func:`calculate_percentage_change` between consecutive values.
+
+    Args:
+        values: Float64 values ordered in time.
+
+    Returns:
+        Array of length ``len(values) - 1`` with changes as decimals (e.g., 0.15
+        for a 15% increase). Positions where the previous value is zero hold NaN
+        instead of raising.
+    """
+    old = values[:-1]
+    new = values[1:]
+    zero = old == 0.0
+    changes = (new - old) / np.where(zero, 1.0, old)
+    return np.where(zero, np.nan, changes)
@@ -15,6 +15,8 @@ from .session_state import (
     initialize_session_state,
     get_db,
     set_db,
+    get_price_downloader,
+    get_cached_accounts,
     clear_messages,
     set_error_message,
     set_success_message,
@@ -26,6 +28,7 @@ from .error_handler import (
     handle_error,
     error_handler,
     safe_execute,
+    try_execute,
 )
 from .accounts import render_accounts_page
 from .transactions import render_transactions_page
@@ -48,6 +51,8 @@ __all__ = [
     "initialize_session_state",
     "get_db",
     "set_db",
+    "get_price_downloader",
+    "get_cached_accounts",
     "clear_messages",
     "set_error_message",
     "set_success_message",
@@ -58,6 +63,7 @@ __all__ = [
     "handle_error",
     "error_handler",
     "safe_execute",
+    "try_execute",
     # Accounts UI
     "render_accounts_page",
     # Transactions UI
@@ -0,0 +1,79 @@
+"""Cached account valuations and transaction counts for accounts UI."""
+
+from datetime import date
+from typing import Dict, List
+
+from finarius_app.core.engine import calculate_portfolio_value
+from finarius_app.core.models import Account, count_transactions_by_account
+from finarius_app.core.prices.cache import ConnectionLRUCache
+
+# Maximum number of (account, date) valuations kept between reruns
+ACCOUNT_VALUE_CACHE_SIZE = 256
+
+# (account_id, date ordinal) -> portfolio value; dropped on any database write,
+# so values stay current after transactions or prices change
+_account_value_cache = ConnectionLRUCache(ACCOUNT_VALUE_CACHE_SIZE)
+
+# account_id -> transaction count, for the delete form's warning banner
+_transaction_count_cache = ConnectionLRUCache(ACCOUNT_VALUE_CACHE_SIZE)
+
+
+def get_transaction_count(account_id: int, db) -> int:
+    """Get an account's transaction count, reusing it until the database changes.
+
+    Args:
+        account_id: Account ID.
+        db: Database instance.
+
+    Returns:
+        Number of transactions recorded for the account.
+    """
+    count = _transaction_count_cache.get(db, account_id)
+    if count is None:
+        count = count_transactions_by_account(account_id, db)
+        _transaction_count_cache.put(db, account_id, count)
+    return count
+
+
+def get_account_value(account_id: int, as_of: date, db) -> float:
+    """Get an account's portfolio value, reusing it across Streamlit reruns.
+
+    Args:
+        account_id: Account ID.
+        as_of: Valuation date.
+        db: Database instance.
+
+    Returns:
+        Total portfolio value of the account.
+
+    Raises:
+        Exception: Whatever calculate_portfolio_value raises; failures are not cached.
+    """
+    key = (account_id, as_of.toordinal())
+    value = _account_value_cache.get(db, key)
+    if value is None:
+        value = calculate_portfolio_value(account_id, as_of, db)
+        _account_value_cache.put(db, key, value)
+    return value
+
+
+def get_account_values(accounts: List[Account], as_of: date, db) -> Dict[int, float]:
+    """Value every account once for the whole accounts page.
+
+    Args:
+        accounts: List of Account instances.
+        as_of: Valuation date.
+        db: Database instance.
+
+    Returns:
+        Dictionary of account ID -> portfolio value. Accounts whose valuation
+        fails are left out.
+    """
+    values = {}
+    for account in accounts:
+        try:
+            values[account.id] = get_account_value(account.id, as_of, db)
+        except Exception:
+            # Callers treat a missing value as unavailable
+            pass
+    return values
@@ -3,3 +3,6 @@
 # Supported currencies
 CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY"]
 
+
+# Largest accounts shown as their own pie slices; the rest are grouped as "Other"
+MAX_PIE_SLICES = 10
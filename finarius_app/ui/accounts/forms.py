@@ -3,10 +3,24 @@
 from datetime import date
 import streamlit as st
 
-from finarius_app.core.models import Account, get_all_accounts
-from finarius_app.ui.session_state import set_error_message, set_success_message
+from finarius_app.core.models import Account
+from finarius_app.ui.session_state import (
+    get_cached_accounts,
+    set_error_message,
+    set_success_message,
+)
+from .cache import get_transaction_count
 from .constants import CURRENCIES
 
+# Fragments rerun on their own widget interactions instead of the whole page.
+# st.fragment is stable from Streamlit 1.37 (st.experimental_fragment from 1.33);
+# on older versions the forms simply run as part of the full page.
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda func: func)
+)
+
 
 def render_add_account_form(db) -> None:
     """Render add account form.
@@ -37,8 +51,8 @@ def render_add_account_form(db) -> None:
                 account_name = account_name.strip()
                 
                 # Check if account already exists
-                existing = get_all_accounts(db)
-                if any(acc.name.lower() == account_name.lower() for acc in existing):
+                existing_names = {acc.name.casefold() for acc in get_cached_accounts(db)}
+                if account_name.casefold() in existing_names:
                     set_error_message(f"Account '{account_name}' already exists")
                     st.rerun()
                 
@@ -53,9 +67,13 @@ def render_add_account_form(db) -> None:
                     st.rerun()
 
 
+@_fragment
 def render_edit_account_form(account: Account, db) -> None:
     """Render edit account form.
     
+    Runs as a fragment: submitting only reruns this form. Validation errors are
+    shown in place; the full page reruns only after the account is saved.
+    
     Args:
         account: Account instance to edit.
         db: Database instance.
@@ -78,17 +96,19 @@ def render_edit_account_form(account: Account, db) -> None:
         
         if submit:
             if not new_name or not new_name.strip():
-                set_error_message("Account name is required")
-                st.rerun()
+                st.error("Account name is required")
+                return
             
             new_name = new_name.strip()
             
             # Check if name changed and conflicts with existing account
-            if new_name.lower() != account.name.lower():
-                existing = get_all_accounts(db)
-                if any(acc.id != account.id and acc.name.lower() == new_name.lower() for acc in existing):
-                    set_error_message(f"Account name '{new_name}' already exists")
-                    st.rerun()
+            if new_name.casefold() != account.name.casefold():
+                existing_names = {
+                    acc.name.casefold() for acc in get_cached_accounts(db) if acc.id != account.id
+                }
+                if new_name.casefold() in existing_names:
+                    st.error(f"Account name '{new_name}' already exists")
+                    return
             
             try:
                 account.name = new_name
@@ -97,13 +117,16 @@ def render_edit_account_form(account: Account, db) -> None:
                 set_success_message(f"Account '{new_name}' updated successfully!")
                 st.rerun()
             except Exception as e:
-                set_error_message(f"Error updating account: {str(e)}")
-                st.rerun()
+                st.error(f"Error updating account: {str(e)}")
 
 
+@_fragment
 def render_delete_account_form(account: Account, db) -> None:
     """Render delete account form with confirmation.
     
+    Runs as a fragment: submitting only reruns this form. Validation errors are
+    shown in place; the full page reruns only after the account is deleted.
+    
     Args:
         account: Account instance to delete.
         db: Database instance.
@@ -113,12 +136,10 @@ def render_delete_account_form(account: Account, db) -> None:
     st.warning(f"⚠️ Deleting account '{account.name}' will permanently remove it and all associated data.")
     
     # Check if account has transactions
-    from finarius_app.core.models import get_transactions_by_account
-    transactions = get_transactions_by_account(account.id, None, None, db)
-    has_transactions = len(transactions) > 0
+    transaction_count = get_transaction_count(account.id, db)
     
-    if has_transactions:
-        st.error(f"⚠️ This account has {len(transactions)} transaction(s). Deleting it will also delete all transactions.")
+    if transaction_count > 0:
+        st.error(f"⚠️ This account has {transaction_count} transaction(s). Deleting it will also delete all transactions.")
     
     with st.form(f"delete_account_form_{account.id}"):
         confirm_name = st.text_input(
@@ -134,8 +155,8 @@ def render_delete_account_form(account: Account, db) -> None:
         
         if submit:
             if confirm_name != account.name:
-                set_error_message(f"Confirmation name does not match. Please type '{account.name}' exactly.")
-                st.rerun()
+                st.error(f"Confirmation name does not match. Please type '{account.name}' exactly.")
+                return
             
             try:
                 account_name = account.name
@@ -143,6 +164,5 @@ def render_delete_account_form(account: Account, db) -> None:
                 set_success_message(f"Account '{account_name}' deleted successfully!")
                 st.rerun()
             except Exception as e:
-                set_error_message(f"Error deleting account: {str(e)}")
-                st.rerun()
+                st.error(f"Error deleting account: {str(e)}")
 
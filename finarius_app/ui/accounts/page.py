@@ -1,10 +1,11 @@
 """Main accounts page rendering."""
 
+from datetime import date
 import streamlit as st
 
-from finarius_app.core.models import get_all_accounts
-from finarius_app.ui.session_state import get_db
+from finarius_app.ui.session_state import get_cached_accounts, get_db
 from finarius_app.ui.error_handler import error_handler
+from .cache import get_account_values
 from .statistics import render_account_statistics
 from .forms import render_add_account_form
 from .table import render_accounts_table
@@ -21,10 +22,13 @@ def render_accounts_page() -> None:
         return
     
     # Get all accounts
-    accounts = get_all_accounts(db)
+    accounts = get_cached_accounts(db)
+    
+    # Value each account once for the statistics, chart and table
+    account_values = get_account_values(accounts, date.today(), db)
     
     # Display account statistics
-    render_account_statistics(accounts, db)
+    render_account_statistics(accounts, account_values)
     
     st.markdown("---")
     
@@ -34,5 +38,5 @@ def render_accounts_page() -> None:
     st.markdown("---")
     
     # Display accounts table with actions
-    render_accounts_table(accounts, db)
+    render_accounts_table(accounts, account_values, db)
 
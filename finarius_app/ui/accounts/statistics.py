@@ -1,81 +1,88 @@
 """Account statistics rendering for accounts UI."""
 
-from datetime import date
 import streamlit as st
 import pandas as pd
 
 from finarius_app.core.models import Account
-from finarius_app.core.engine import calculate_portfolio_value
+from finarius_app.ui.plotting import get_plotly_express
+from .constants import MAX_PIE_SLICES
 
 
-def render_account_statistics(accounts: list[Account], db) -> None:
+def render_account_statistics(accounts: list[Account], account_values: dict[int, float]) -> None:
     """Render account statistics section.
     
     Args:
         accounts: List of Account instances.
-        db: Database instance.
+        account_values: Portfolio value by account ID (failed valuations omitted).
     """
     col1, col2, col3, col4 = st.columns(4)
     
+    if not accounts:
+        # Nothing to aggregate or chart; skip the pandas/Plotly paths entirely
+        with col1:
+            st.metric("Total Accounts", 0)
+        with col2:
+            st.metric("Currencies", 0)
+        with col3:
+            st.metric("Total Portfolio Value", "$0.00")
+        with col4:
+            st.metric("Status", "⚠️ No accounts")
+        return
+    
     with col1:
         st.metric("Total Accounts", len(accounts))
     
     with col2:
-        currencies = len(set(acc.currency for acc in accounts)) if accounts else 0
-        st.metric("Currencies", currencies)
+        st.metric("Currencies", len({acc.currency for acc in accounts}))
     
     with col3:
-        # Calculate total portfolio value across all accounts
-        total_value = 0.0
-        today = date.today()
-        for account in accounts:
-            try:
-                value = calculate_portfolio_value(account.id, today, db)
-                total_value += value
-            except Exception:
-                # If calculation fails, skip this account
-                pass
+        # Total portfolio value across all accounts
+        total_value = sum(account_values.values())
         st.metric("Total Portfolio Value", f"${total_value:,.2f}" if total_value > 0 else "$0.00")
     
     with col4:
-        st.metric("Status", "✅ Active" if accounts else "⚠️ No accounts")
+        st.metric("Status", "✅ Active")
     
-    # Account breakdown chart (if accounts exist)
-    if accounts:
-        st.markdown("---")
-        render_account_breakdown_chart(accounts, db)
+    # Account breakdown chart
+    st.markdown("---")
+    render_account_breakdown_chart(accounts, account_values)
 
 
-def render_account_breakdown_chart(accounts: list[Account], db) -> None:
+def render_account_breakdown_chart(
+    accounts: list[Account], account_values: dict[int, float]
+) -> None:
     """Render account breakdown pie chart.
     
     Args:
         accounts: List of Account instances.
-        db: Database instance.
+        account_values: Portfolio value by account ID (failed valuations omitted).
     """
+    px = get_plotly_express()
+    if px is None:
+        # Plotly not available, skip chart
+        return
+    
     try:
-        import plotly.express as px
-        
-        today = date.today()
-        account_values = []
-        account_names = []
-        
-        for account in accounts:
-            try:
-                value = calculate_portfolio_value(account.id, today, db)
-                if value > 0:
-                    account_values.append(value)
-                    account_names.append(account.name)
-            except Exception:
-                # Skip accounts with calculation errors
-                pass
+        # Skip accounts with calculation errors (no value) or nothing invested
+        items = [
+            (account.name, account_values[account.id])
+            for account in accounts
+            if account_values.get(account.id, 0.0) > 0
+        ]
         
-        if account_values:
+        if items:
             st.subheader("Portfolio Value by Account")
-            df = pd.DataFrame({
-                "Account": account_names,
-                "Value": account_values
-            })
+            names, values = zip(*items)
+            df = pd.DataFrame({"Account": names, "Value": values})
+            
+            # Keep the largest slices and fold the tail into a single "Other" slice
+            if len(df) > MAX_PIE_SLICES:
+                df = df.sort_values("Value", ascending=False, kind="stable")
+                other_value = df["Value"].iloc[MAX_PIE_SLICES - 1:].sum()
+                df = pd.concat([
+                    df.iloc[:MAX_PIE_SLICES - 1],
+                    pd.DataFrame({"Account": ["Other"], "Value": [other_value]}),
+                ], ignore_index=True)
             
             fig = px.pie(
                 df,
@@ -83,10 +90,13 @@ def render_account_breakdown_chart(accounts: list[Account], db) -> None:
                 names="Account",
                 title="Account Value Distribution"
             )
-            st.plotly_chart(fig, use_container_width=True)
-    except ImportError:
-        # Plotly not available, skip chart
-        pass
+            # Static distribution: skip the mode bar and Streamlit theme restyling
+            st.plotly_chart(
+                fig,
+                use_container_width=True,
+                theme=None,
+                config={"displayModeBar": False, "responsive": True},
+            )
     except Exception:
         # Chart rendering failed, skip
         pass
@@ -1,19 +1,20 @@
 """Account table rendering for accounts UI."""
 
-from datetime import date
 import streamlit as st
 import pandas as pd
 
 from finarius_app.core.models import Account, get_account_by_id
-from finarius_app.core.engine import calculate_portfolio_value
 from .forms import render_edit_account_form, render_delete_account_form
 
 
-def render_accounts_table(accounts: list[Account], db) -> None:
+def render_accounts_table(
+    accounts: list[Account], account_values: dict[int, float], db
+) -> None:
     """Render accounts table with edit/delete actions.
     
     Args:
         accounts: List of Account instances.
+        account_values: Portfolio value by account ID (failed valuations omitted).
         db: Database instance.
     """
     st.subheader("Account List")
@@ -22,25 +23,20 @@ def render_accounts_table(accounts: list[Account], db) -> None:
         st.info("No accounts yet. Create your first account using the form above.")
         return
     
-    # Create DataFrame for display
-    accounts_data = []
-    for acc in accounts:
-        # Calculate portfolio value
-        portfolio_value = 0.0
-        try:
-            portfolio_value = calculate_portfolio_value(acc.id, date.today(), db)
-        except Exception:
-            pass
-        
-        accounts_data.append({
-            "ID": acc.id,
-            "Name": acc.name,
-            "Currency": acc.currency,
-            "Portfolio Value": f"${portfolio_value:,.2f}" if portfolio_value > 0 else "$0.00",
-            "Created": pd.to_datetime(acc.created_at).strftime("%Y-%m-%d") if acc.created_at else "N/A",
-        })
-    
-    df = pd.DataFrame(accounts_data)
+    # Create DataFrame for display, formatting whole columns at once
+    portfolio_values = pd.Series([account_values.get(acc.id, 0.0) for acc in accounts])
+    created = pd.to_datetime(
+        pd.Series([acc.created_at for acc in accounts], dtype=object),
+        errors="coerce",
+        format="ISO8601",
+    )
+    df = pd.DataFrame({
+        "ID": [acc.id for acc in accounts],
+        "Name": [acc.name for acc in accounts],
+        "Currency": [acc.currency for acc in accounts],
+        "Portfolio Value": portfolio_values.clip(lower=0.0).map("${:,.2f}".format),
+        "Created": created.dt.strftime("%Y-%m-%d").fillna("N/A"),
+    })
     st.dataframe(df, use_container_width=True, hide_index=True)
     
     # Edit/Delete actions
@@ -48,15 +44,16 @@ def render_accounts_table(accounts: list[Account], db) -> None:
     st.subheader("Manage Accounts")
     
     # Account selector for edit/delete
-    account_options = {f"{acc.name} (ID: {acc.id})": acc.id for acc in accounts}
-    selected_account_label = st.selectbox(
+    # Options are account IDs; labels are only formatted for display
+    account_names = {acc.id: acc.name for acc in accounts}
+    selected_account_id = st.selectbox(
         "Select Account",
-        options=list(account_options.keys()),
+        options=list(account_names),
+        format_func=lambda account_id: f"{account_names[account_id]} (ID: {account_id})",
         help="Select an account to edit or delete"
     )
     
-    if selected_account_label:
-        selected_account_id = account_options[selected_account_label]
+    if selected_account_id is not None:
         account = get_account_by_id(selected_account_id, db)
         
         if account:
@@ -0,0 +1,41 @@
+"""Cached metric results for analytics UI."""
+
+from typing import Any, Callable
+
+from finarius_app.core.prices.cache import ConnectionLRUCache
+
+# Maximum number of metric results kept between reruns
+METRIC_CACHE_SIZE = 256
+
+# (metric function, arguments) -> (result,); dropped on any database write,
+# so results stay current after transactions or prices change
+_metric_cache = ConnectionLRUCache(METRIC_CACHE_SIZE)
+
+
+def get_cached_metric(
+    func: Callable[..., Any], db, price_downloader, *args: Any
+) -> Any:
+    """Calculate a metric, reusing the result across Streamlit reruns.
+
+    Sections share results, so a metric shown by both the performance and the
+    returns sections is only calculated once.
+
+    Args:
+        func: Metric function, called as ``func(*args, db, price_downloader)``.
+        db: Database instance.
+        price_downloader: PriceDownloader instance.
+        *args: Hashable leading arguments of the metric (account ID, dates, ...).
+
+    Returns:
+        The metric's result (None results are cached as well).
+
+    Raises:
+        Exception: Whatever the metric function raises; failures are not cached.
+    """
+    key = (func, args)
+    entry = _metric_cache.get(db, key)
+    if entry is None:
+        # Wrapped so that a None result (metric unavailable) is cached too
+        entry = (func(*args, db, price_downloader),)
+        _metric_cache.put(db, key, entry)
+    return entry[0]
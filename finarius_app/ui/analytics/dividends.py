@@ -1,6 +1,6 @@
 """Dividend analytics section for analytics page."""
 
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 import streamlit as st
 import pandas as pd
@@ -12,6 +12,11 @@ from finarius_app.core.metrics import (
     get_dividend_by_symbol,
     calculate_dividend_yield_by_symbol,
 )
+from finarius_app.core.engine import calculate_portfolio_value
+from finarius_app.core.models import Account
+from finarius_app.ui.error_handler import try_execute
+from finarius_app.ui.plotting import get_plotly_express
+from finarius_app.ui.session_state import get_cached_accounts
 
 
 def render_dividend_analytics(
@@ -30,102 +35,127 @@ def render_dividend_analytics(
     """
     st.subheader("💰 Dividend Analytics")
     
-    try:
+    if account_id is None:
+        # Aggregate dividends across all accounts
+        accounts = get_cached_accounts(db)
+        if not accounts:
+            st.info("No accounts available")
+            return
+    
+    # Each metric is calculated on its own, so a failure only hides that metric.
+    # Dividend metrics cover all accounts in a single query each for account_id None.
+    with st.spinner("Calculating dividends..."):
+        income_ok, total_dividends = try_execute(
+            calculate_dividend_income, account_id, start_date, end_date, db
+        )
+        by_symbol_ok, dividend_by_symbol = try_execute(
+            get_dividend_by_symbol, account_id, start_date, end_date, db, default={}
+        )
+        history_ok, dividend_history = try_execute(
+            get_dividend_history, account_id, start_date, end_date, db, default=[]
+        )
         if account_id is None:
-            # Aggregate dividends across all accounts
-            from finarius_app.core.models import get_all_accounts
-            accounts = get_all_accounts(db)
-            if not accounts:
-                st.info("No accounts available")
-                return
-            
-            total_dividends = 0.0
-            total_portfolio_value = 0.0
-            dividend_by_symbol = {}
-            dividend_history = []
-            
-            for acc in accounts:
-                acc_dividends = calculate_dividend_income(acc.id, start_date, end_date, db)
-                total_dividends += acc_dividends
-                
-                # Get portfolio value for yield calculation
-                from finarius_app.core.engine import calculate_portfolio_value
-                acc_value = calculate_portfolio_value(acc.id, end_date, db)
-                total_portfolio_value += acc_value
-                
-                # Aggregate by symbol
-                acc_by_symbol = get_dividend_by_symbol(acc.id, start_date, end_date, db)
-                for symbol, amount in acc_by_symbol.items():
-                    if symbol not in dividend_by_symbol:
-                        dividend_by_symbol[symbol] = 0.0
-                    dividend_by_symbol[symbol] += amount
-                
-                # Aggregate history
-                acc_history = get_dividend_history(acc.id, start_date, end_date, db)
-                dividend_history.extend(acc_history)
-            
-            # Calculate aggregate dividend yield
-            dividend_yield = (total_dividends / total_portfolio_value) if total_portfolio_value > 0 else None
+            # Aggregate dividend yield from the total portfolio value
+            yield_ok, dividend_yield = try_execute(
+                _aggregate_dividend_yield, accounts, total_dividends, end_date, db
+            )
+            yield_ok = yield_ok and income_ok
         else:
-            # Single account
-            total_dividends = calculate_dividend_income(account_id, start_date, end_date, db)
-            dividend_yield = calculate_dividend_yield(account_id, end_date, db)
-            dividend_by_symbol = get_dividend_by_symbol(account_id, start_date, end_date, db)
-            dividend_history = get_dividend_history(account_id, start_date, end_date, db)
-        
-        # Display summary
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Dividend Income", f"${total_dividends:,.2f}")
-        with col2:
-            st.metric("Dividend Yield", f"{dividend_yield*100:.2f}%" if dividend_yield else "N/A")
-        
-        # Dividend income over time
-        st.markdown("#### Dividend Income Over Time")
-        if dividend_history:
-            # Group by date
-            dividend_by_date = {}
-            for div in dividend_history:
-                div_date = div["date"]
-                if div_date not in dividend_by_date:
-                    dividend_by_date[div_date] = 0.0
-                dividend_by_date[div_date] += div["amount"]
-            
-            df = pd.DataFrame([
-                {"Date": d, "Dividend Income": v} for d, v in sorted(dividend_by_date.items())
-            ])
-            
-            try:
-                import plotly.express as px
-                fig = px.bar(
-                    df,
-                    x="Date",
-                    y="Dividend Income",
-                    title="Dividend Income Over Time",
-                    labels={"Dividend Income": "Dividend Income ($)", "Date": "Date"}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            except ImportError:
-                st.bar_chart(df.set_index("Date"))
-        else:
-            st.info("No dividend history data available")
+            yield_ok, dividend_yield = try_execute(
+                calculate_dividend_yield, account_id, end_date, db
+            )
+    
+    # Display summary
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric(
+            "Total Dividend Income", f"${total_dividends:,.2f}" if income_ok else "N/A"
+        )
+    with col2:
+        st.metric(
+            "Dividend Yield",
+            f"{dividend_yield*100:.2f}%" if yield_ok and dividend_yield else "N/A",
+        )
+    if not income_ok:
+        st.caption("⚠️ Dividend income could not be calculated")
+    if not yield_ok:
+        st.caption("⚠️ Dividend yield could not be calculated")
+    
+    if history_ok and by_symbol_ok and not dividend_history and not dividend_by_symbol:
+        # No dividends in the period; skip the DataFrame and chart work
+        st.info("No dividend data available for the selected period")
+        return
+    
+    # Dividend income over time
+    st.markdown("#### Dividend Income Over Time")
+    if not history_ok:
+        st.caption("⚠️ Dividend history could not be calculated")
+    elif dividend_history:
+        # Group by date (groupby sorts the dates)
+        df = (
+            pd.DataFrame(dividend_history, columns=["date", "amount"])
+            .groupby("date", as_index=False)["amount"]
+            .sum()
+            .rename(columns={"date": "Date", "amount": "Dividend Income"})
+        )
         
-        # Dividend by symbol
-        st.markdown("#### Dividends by Symbol")
-        if dividend_by_symbol:
-            dividend_data = [
-                {"Symbol": symbol, "Dividend Income": f"${amount:,.2f}"}
-                for symbol, amount in sorted(dividend_by_symbol.items(), key=lambda x: x[1], reverse=True)
-            ]
-            df_dividends = pd.DataFrame(dividend_data)
-            st.dataframe(df_dividends, use_container_width=True, hide_index=True)
+        px = get_plotly_express()
+        if px is not None:
+            fig = px.bar(
+                df,
+                x="Date",
+                y="Dividend Income",
+                title="Dividend Income Over Time",
+                labels={"Dividend Income": "Dividend Income ($)", "Date": "Date"}
+            )
+            st.plotly_chart(fig, use_container_width=True)
         else:
-            st.info("No dividend data by symbol available")
-        
-        # Dividend yield trends (simplified)
-        st.markdown("#### Dividend Yield Trends")
-        st.info("Dividend yield trends analysis coming soon")
-        
-    except Exception as e:
-        st.warning(f"⚠️ Error calculating dividend analytics: {str(e)}")
+            st.bar_chart(df.set_index("Date"))
+    else:
+        st.info("No dividend history data available")
+    
+    # Dividend by symbol
+    st.markdown("#### Dividends by Symbol")
+    if not by_symbol_ok:
+        st.caption("⚠️ Dividends by symbol could not be calculated")
+    elif dividend_by_symbol:
+        by_symbol = pd.Series(dividend_by_symbol, dtype="float64").sort_values(
+            ascending=False, kind="stable"
+        )
+        df_dividends = pd.DataFrame({
+            "Symbol": by_symbol.index,
+            "Dividend Income": by_symbol.map("${:,.2f}".format).to_numpy(),
+        })
+        st.dataframe(df_dividends, use_container_width=True, hide_index=True)
+    else:
+        st.info("No dividend data by symbol available")
+    
+    # Dividend yield trends (simplified)
+    st.markdown("#### Dividend Yield Trends")
+    st.info("Dividend yield trends analysis coming soon")
+
+
+def _aggregate_dividend_yield(
+    accounts: List[Account],
+    total_dividends: Optional[float],
+    end_date: date,
+    db,
+) -> Optional[float]:
+    """Calculate the dividend yield of several accounts together.
 
+    Args:
+        accounts: Accounts to combine.
+        total_dividends: Dividend income of all accounts in the period.
+        end_date: Date of the portfolio value.
+        db: Database instance.
+
+    Returns:
+        Dividend income divided by the total portfolio value, or None if the
+        income is unknown or the portfolio has no value.
+    """
+    if total_dividends is None:
+        return None
+    total_portfolio_value = sum(
+        calculate_portfolio_value(acc.id, end_date, db) for acc in accounts
+    )
+    return (total_dividends / total_portfolio_value) if total_portfolio_value > 0 else None
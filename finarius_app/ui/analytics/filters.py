@@ -1,10 +1,19 @@
 """Analytics filters (account selector, date range)."""
 
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from datetime import date, timedelta
 import streamlit as st
 
-from finarius_app.core.models import get_all_accounts
+from finarius_app.ui.session_state import get_cached_accounts
+
+# Date range presets: name -> function of today returning (start_date, end_date)
+_DATE_PRESETS: Dict[str, Callable[[date], Tuple[date, date]]] = {
+    "YTD": lambda today: (date(today.year, 1, 1), today),
+    "Last 7 Days": lambda today: (today - timedelta(days=7), today),
+    "Last 30 Days": lambda today: (today - timedelta(days=30), today),
+    "Last 90 Days": lambda today: (today - timedelta(days=90), today),
+    "Last Year": lambda today: (today - timedelta(days=365), today),
+}
 
 
 def render_filters(db) -> Tuple[Optional[int], date, date]:
@@ -17,7 +26,7 @@ def render_filters(db) -> Tuple[Optional[int], date, date]:
         Tuple of (account_id, start_date, end_date).
         account_id is None if "All Accounts" is selected.
     """
-    accounts = get_all_accounts(db)
+    accounts = get_cached_accounts(db)
     
     if not accounts:
         st.warning("⚠️ No accounts found. Please create an account first.")
@@ -31,11 +40,15 @@ def render_filters(db) -> Tuple[Optional[int], date, date]:
             account_id = accounts[0].id
             st.info(f"📊 Analyzing: {accounts[0].name}")
         else:
-            account_options = ["All Accounts"] + [f"{acc.name} (ID: {acc.id})" for acc in accounts]
-            selected_account = st.selectbox("Account", account_options)
-            account_id = None
-            if selected_account != "All Accounts":
-                account_id = int(selected_account.split("(ID: ")[1].split(")")[0])
+            # Options are account IDs (None for all accounts), labelled via format_func
+            account_names = {acc.id: acc.name for acc in accounts}
+            account_id = st.selectbox(
+                "Account",
+                options=[None, *account_names],
+                format_func=lambda option: (
+                    "All Accounts" if option is None else f"{account_names[option]} (ID: {option})"
+                ),
+            )
     
     with col2:
         # Quick date range selector
@@ -45,27 +58,14 @@ def render_filters(db) -> Tuple[Optional[int], date, date]:
         
         date_preset = st.selectbox(
             "Date Range",
-            options=["Custom", "YTD", "Last 7 Days", "Last 30 Days", "Last 90 Days", "Last Year"],
+            options=["Custom", *_DATE_PRESETS],
             key=date_preset_key
         )
         
         # Calculate date range based on preset
-        today = date.today()
-        if date_preset == "YTD":
-            start_date = date(today.year, 1, 1)
-            end_date = today
-        elif date_preset == "Last 7 Days":
-            start_date = today - timedelta(days=7)
-            end_date = today
-        elif date_preset == "Last 30 Days":
-            start_date = today - timedelta(days=30)
-            end_date = today
-        elif date_preset == "Last 90 Days":
-            start_date = today - timedelta(days=90)
-            end_date = today
-        elif date_preset == "Last Year":
-            start_date = today - timedelta(days=365)
-            end_date = today
+        preset = _DATE_PRESETS.get(date_preset)
+        if preset is not None:
+            start_date, end_date = preset(date.today())
         else:  # Custom
             # Date range selector
             date_range = st.date_input(
@@ -0,0 +1,69 @@
+"""Chart frames combining metric histories for analytics page."""
+
+from datetime import date
+from typing import Dict, Optional
+
+import pandas as pd
+
+
+def returns_history_frame(
+    cagr_history: Dict[date, float],
+    irr_history: Dict[date, Optional[float]],
+    twrr_history: Dict[date, float],
+    sample_every: int = 1,
+) -> pd.DataFrame:
+    """Combine CAGR, IRR and TWRR histories into one chart frame.
+
+    The histories are outer-joined on date, so a date missing from one history
+    (or an IRR of None) leaves a gap in that line only.
+
+    Args:
+        cagr_history: Dictionary mapping date -> CAGR.
+        irr_history: Dictionary mapping date -> IRR (None when undefined).
+        twrr_history: Dictionary mapping date -> TWRR.
+        sample_every: Keep every n-th date (e.g. 7 for weekly points).
+
+    Returns:
+        DataFrame with a Date column and CAGR, IRR and TWRR columns in percent,
+        sorted by date.
+    """
+    df = pd.concat(
+        {
+            "CAGR": pd.Series(cagr_history, dtype="float64"),
+            "IRR": pd.Series(irr_history, dtype="float64"),
+            "TWRR": pd.Series(twrr_history, dtype="float64"),
+        },
+        axis=1,
+    ).sort_index()
+    df = df.iloc[::sample_every] * 100
+    df.index.name = "Date"
+    return df.reset_index()
+
+
+def gains_history_frame(
+    realized_history: Dict[date, float],
+    unrealized_history: Dict[date, float],
+    sample_every: int = 1,
+) -> pd.DataFrame:
+    """Combine realized and unrealized gains histories into one chart frame.
+
+    Args:
+        realized_history: Dictionary mapping date -> cumulative realized gains.
+        unrealized_history: Dictionary mapping date -> unrealized gains.
+        sample_every: Keep every n-th date (e.g. 7 for weekly points).
+
+    Returns:
+        DataFrame with Date, Realized, Unrealized and Total P&L columns, sorted
+        by date; a date missing from one history counts as zero there.
+    """
+    df = pd.concat(
+        {
+            "Realized": pd.Series(realized_history, dtype="float64"),
+            "Unrealized": pd.Series(unrealized_history, dtype="float64"),
+        },
+        axis=1,
+    ).sort_index().fillna(0.0)
+    df = df.iloc[::sample_every]
+    df["Total P&L"] = df["Realized"] + df["Unrealized"]
+    df.index.name = "Date"
+    return df.reset_index()
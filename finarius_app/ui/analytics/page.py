@@ -3,9 +3,8 @@
 from datetime import date
 import streamlit as st
 
-from finarius_app.core.models import get_all_accounts
-from finarius_app.ui.session_state import get_db
-from finarius_app.ui.error_handler import error_handler
+from finarius_app.ui.session_state import get_cached_accounts, get_db
+from finarius_app.ui.error_handler import error_handler, try_execute
 from .filters import render_filters
 from .performance import render_performance_analytics
 from .gains import render_gains_analysis
@@ -26,7 +25,7 @@ def render_analytics_page() -> None:
         return
     
     # Get all accounts
-    accounts = get_all_accounts(db)
+    accounts = get_cached_accounts(db)
     
     if not accounts:
         st.warning("⚠️ No accounts found. Please create an account first.")
@@ -36,33 +35,20 @@ def render_analytics_page() -> None:
     # Filters
     account_id, start_date, end_date = render_filters(db)
     
-    st.markdown("---")
-    
-    # Performance analytics
-    render_performance_analytics(account_id, start_date, end_date, db)
-    
-    st.markdown("---")
-    
-    # Gains/losses analysis
-    render_gains_analysis(account_id, start_date, end_date, db)
-    
-    st.markdown("---")
-    
-    # Returns analysis
-    render_returns_analysis(account_id, start_date, end_date, db)
-    
-    st.markdown("---")
-    
-    # Risk metrics
-    render_risk_metrics(account_id, start_date, end_date, db)
-    
-    st.markdown("---")
-    
-    # Dividend analytics
-    render_dividend_analytics(account_id, start_date, end_date, db)
-    
-    st.markdown("---")
-    
-    # Position analytics
-    render_position_analytics(account_id, end_date, db)
-
+    # Each section is guarded on its own, so an error (in its calculations or
+    # its charts) only replaces that section with a warning
+    sections = [
+        ("performance analytics", render_performance_analytics,
+         (account_id, start_date, end_date, db)),
+        ("gains/losses analysis", render_gains_analysis, (account_id, start_date, end_date, db)),
+        ("returns analysis", render_returns_analysis, (account_id, start_date, end_date, db)),
+        ("risk metrics", render_risk_metrics, (account_id, start_date, end_date, db)),
+        ("dividend analytics", render_dividend_analytics,
+         (account_id, start_date, end_date, db)),
+        ("position analytics", render_position_analytics, (account_id, end_date, db)),
+    ]
+    for name, render_section, args in sections:
+        st.markdown("---")
+        ok, _ = try_execute(render_section, *args)
+        if not ok:
+            st.warning(f"⚠️ Error rendering {name}. Please check the logs for details.")
@@ -6,7 +6,8 @@ import streamlit as st
 import pandas as pd
 
 from finarius_app.core.engine import get_portfolio_breakdown
-from finarius_app.core.prices.downloader import PriceDownloader
+from finarius_app.ui.error_handler import try_execute
+from finarius_app.ui.session_state import get_cached_accounts, get_price_downloader
 
 
 def render_position_analytics(
@@ -23,88 +24,65 @@ def render_position_analytics(
     """
     st.subheader("💼 Position Analytics")
     
-    price_downloader = PriceDownloader(db=db)
+    price_downloader = get_price_downloader(db)
     
-    try:
-        if account_id is None:
-            # Aggregate positions across all accounts
-            from finarius_app.core.models import get_all_accounts
-            accounts = get_all_accounts(db)
-            if not accounts:
-                st.info("No accounts available")
-                return
-            
-            aggregated_breakdown = {}
-            for acc in accounts:
-                acc_breakdown = get_portfolio_breakdown(acc.id, end_date, db, price_downloader)
-                for symbol, data in acc_breakdown.items():
-                    if symbol not in aggregated_breakdown:
-                        aggregated_breakdown[symbol] = {
-                            "qty": 0.0,
-                            "cost_basis": 0.0,
-                            "current_value": 0.0,
-                            "unrealized_gain": 0.0,
-                        }
-                    aggregated_breakdown[symbol]["qty"] += data["qty"]
-                    aggregated_breakdown[symbol]["cost_basis"] += data["cost_basis"]
-                    aggregated_breakdown[symbol]["current_value"] += data["current_value"]
-                    aggregated_breakdown[symbol]["unrealized_gain"] += data["unrealized_gain"]
-            breakdown = aggregated_breakdown
-        else:
-            breakdown = get_portfolio_breakdown(account_id, end_date, db, price_downloader)
-        
-        if not breakdown:
-            st.info("No positions found")
+    if account_id is None:
+        # Aggregate positions across all accounts
+        accounts = get_cached_accounts(db)
+        if not accounts:
+            st.info("No accounts available")
             return
+    
+    # account_id None combines all accounts' positions, pricing each symbol once
+    with st.spinner("Calculating positions..."):
+        ok, breakdown = try_execute(
+            get_portfolio_breakdown, account_id, end_date, db, price_downloader
+        )
+    if not ok:
+        st.caption("⚠️ Positions could not be calculated")
+        return
+    
+    if not breakdown:
+        st.info("No positions found")
+        return
+    
+    # Keep values numeric for sorting and totals; format only for display
+    positions = pd.DataFrame.from_dict(breakdown, orient="index")
+    positions = positions[positions["qty"] > 0].sort_values(
+        "current_value", ascending=False, kind="stable"
+    )
+    total_value = positions["current_value"].sum()
+    if total_value > 0:
+        weights = positions["current_value"] / total_value * 100
+    else:
+        weights = pd.Series(0.0, index=positions.index)
+    
+    # Position size analysis
+    st.markdown("#### Position Size Analysis")
+    if not positions.empty:
+        df = pd.DataFrame({
+            "Symbol": positions.index,
+            "Quantity": positions["qty"].map("{:,.2f}".format).to_numpy(),
+            "Current Value": positions["current_value"].map("${:,.2f}".format).to_numpy(),
+            "Weight %": weights.map("{:.2f}%".format).to_numpy(),
+        })
+        st.dataframe(df, use_container_width=True, hide_index=True)
         
-        # Calculate position metrics
-        total_value = sum(data["current_value"] for data in breakdown.values())
-        
-        position_data = []
-        for symbol, data in breakdown.items():
-            if data["qty"] > 0:
-                current_value = data["current_value"]
-                weight = (current_value / total_value * 100) if total_value > 0 else 0.0
-                
-                position_data.append({
-                    "Symbol": symbol,
-                    "Quantity": f"{data['qty']:,.2f}",
-                    "Current Value": f"${current_value:,.2f}",
-                    "Weight %": f"{weight:.2f}%",
-                })
+        # Concentration risk (top 5 positions)
+        top_5_weight = weights.head(5).sum()
+        st.metric("Top 5 Positions Concentration", f"{top_5_weight:.2f}%",
+                 help="Percentage of portfolio in top 5 positions")
         
-        # Sort by value descending
-        position_data.sort(
-            key=lambda x: float(x["Current Value"].replace("$", "").replace(",", "")),
-            reverse=True
-        )
+        # Diversification metrics
+        st.markdown("#### Diversification Metrics")
+        num_positions = len(df)
+        num_symbols = df["Symbol"].nunique()
         
-        # Position size analysis
-        st.markdown("#### Position Size Analysis")
-        if position_data:
-            df = pd.DataFrame(position_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
-            
-            # Concentration risk (top 5 positions)
-            top_5_weight = sum(
-                float(p["Weight %"].replace("%", "")) for p in position_data[:5]
-            )
-            st.metric("Top 5 Positions Concentration", f"{top_5_weight:.2f}%",
-                     help="Percentage of portfolio in top 5 positions")
-            
-            # Diversification metrics
-            st.markdown("#### Diversification Metrics")
-            num_positions = len(position_data)
-            num_symbols = len(set(p["Symbol"] for p in position_data))
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Number of Positions", num_positions)
-            with col2:
-                st.metric("Number of Symbols", num_symbols)
-        else:
-            st.info("No position data available")
-            
-    except Exception as e:
-        st.warning(f"⚠️ Error calculating position analytics: {str(e)}")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Number of Positions", num_positions)
+        with col2:
+            st.metric("Number of Symbols", num_symbols)
+    else:
+        st.info("No position data available")
 
@@ -1,5 +1,6 @@
 """Charts section for dashboard."""
 
+from collections import defaultdict
 from typing import Optional
 from datetime import date, timedelta
 import streamlit as st
@@ -7,7 +8,8 @@ import pandas as pd
 
 from finarius_app.core.engine import calculate_portfolio_value_over_time, get_portfolio_breakdown
 from finarius_app.core.metrics import get_dividend_history
-from finarius_app.core.prices.downloader import PriceDownloader
+from finarius_app.ui.plotting import get_plotly_express
+from finarius_app.ui.session_state import get_price_downloader
 
 
 def render_charts(
@@ -26,7 +28,7 @@ def render_charts(
     """
     st.subheader("📊 Charts")
     
-    price_downloader = PriceDownloader(db=db)
+    price_downloader = get_price_downloader(db)
     
     try:
         # Portfolio value over time
@@ -40,14 +42,12 @@ def render_charts(
                 return
             
             # Aggregate value history from all accounts
-            all_value_histories = {}
+            all_value_histories = defaultdict(float)
             for acc in accounts:
                 acc_history = calculate_portfolio_value_over_time(
                     acc.id, start_date, end_date, "daily", db, price_downloader
                 )
                 for date, value in acc_history.items():
-                    if date not in all_value_histories:
-                        all_value_histories[date] = 0.0
                     all_value_histories[date] += value
             value_history = all_value_histories
         else:
@@ -56,12 +56,11 @@ def render_charts(
             )
         
         if value_history:
-            df = pd.DataFrame([
-                {"Date": d, "Value": v} for d, v in sorted(value_history.items())
-            ])
+            dates, values = zip(*sorted(value_history.items()))
+            df = pd.DataFrame({"Date": dates, "Value": values})
             
-            try:
-                import plotly.express as px
+            px = get_plotly_express()
+            if px is not None:
                 fig = px.line(
                     df,
                     x="Date",
@@ -71,35 +70,15 @@ def render_charts(
                 )
                 fig.update_traces(line=dict(width=2))
                 st.plotly_chart(fig, use_container_width=True)
-            except ImportError:
+            else:
                 st.line_chart(df.set_index("Date"))
         else:
             st.info("No portfolio value data available")
         
         # Portfolio allocation pie chart
         st.markdown("#### Portfolio Allocation")
-        if account_id is None:
-            # Aggregate breakdown across all accounts
-            from finarius_app.core.models import get_all_accounts
-            accounts = get_all_accounts(db)
-            aggregated_breakdown = {}
-            for acc in accounts:
-                acc_breakdown = get_portfolio_breakdown(acc.id, end_date, db, price_downloader)
-                for symbol, data in acc_breakdown.items():
-                    if symbol not in aggregated_breakdown:
-                        aggregated_breakdown[symbol] = {
-                            "qty": 0.0,
-                            "cost_basis": 0.0,
-                            "current_value": 0.0,
-                            "unrealized_gain": 0.0,
-                        }
-                    aggregated_breakdown[symbol]["qty"] += data["qty"]
-                    aggregated_breakdown[symbol]["cost_basis"] += data["cost_basis"]
-                    aggregated_breakdown[symbol]["current_value"] += data["current_value"]
-                    aggregated_breakdown[symbol]["unrealized_gain"] += data["unrealized_gain"]
-            breakdown = aggregated_breakdown
-        else:
-            breakdown = get_portfolio_breakdown(account_id, end_date, db, price_downloader)
+        # account_id None combines all accounts' positions, pricing each symbol once
+        breakdown = get_portfolio_breakdown(account_id, end_date, db, price_downloader)
         
         if breakdown:
             allocation_data = []
@@ -112,8 +91,8 @@ def render_charts(
             
             if allocation_data:
                 df = pd.DataFrame(allocation_data)
-                try:
-                    import plotly.express as px
+                px = get_plotly_express()
+                if px is not None:
                     fig = px.pie(
                         df,
                         values="Value",
@@ -121,7 +100,7 @@ def render_charts(
                         title="Portfolio Allocation by Symbol"
                     )
                     st.plotly_chart(fig, use_container_width=True)
-                except ImportError:
+                else:
                     st.bar_chart(df.set_index("Symbol"))
             else:
                 st.info("No allocation data available")
@@ -144,19 +123,15 @@ def render_charts(
         
         if dividend_history:
             # Group by date
-            dividend_by_date = {}
+            dividend_by_date = defaultdict(float)
             for div in dividend_history:
-                div_date = div["date"]
-                if div_date not in dividend_by_date:
-                    dividend_by_date[div_date] = 0.0
-                dividend_by_date[div_date] += div["amount"]
+                dividend_by_date[div["date"]] += div["amount"]
             
-            df = pd.DataFrame([
-                {"Date": d, "Dividend Income": v} for d, v in sorted(dividend_by_date.items())
-            ])
+            dates, values = zip(*sorted(dividend_by_date.items()))
+            df = pd.DataFrame({"Date": dates, "Dividend Income": values})
             
-            try:
-                import plotly.express as px
+            px = get_plotly_express()
+            if px is not None:
                 fig = px.bar(
                     df,
                     x="Date",
@@ -165,7 +140,7 @@ def render_charts(
                     labels={"Dividend Income": "Dividend Income ($)", "Date": "Date"}
                 )
                 st.plotly_chart(fig, use_container_width=True)
-            except ImportError:
+            else:
                 st.bar_chart(df.set_index("Date"))
         else:
             st.info("No dividend data available")
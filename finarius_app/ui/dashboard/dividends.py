@@ -1,5 +1,6 @@
 """Dividend summary section for dashboard."""
 
+from collections import defaultdict
 from typing import Optional
 from datetime import date
 import streamlit as st
@@ -39,7 +40,7 @@ def render_dividend_summary(
             
             total_dividends = 0.0
             total_portfolio_value = 0.0
-            dividend_by_symbol = {}
+            dividend_by_symbol = defaultdict(float)
             
             for acc in accounts:
                 acc_dividends = calculate_dividend_income(acc.id, start_date, end_date, db)
@@ -53,8 +54,6 @@ def render_dividend_summary(
                 # Aggregate by symbol
                 acc_by_symbol = get_dividend_by_symbol(acc.id, start_date, end_date, db)
                 for symbol, amount in acc_by_symbol.items():
-                    if symbol not in dividend_by_symbol:
-                        dividend_by_symbol[symbol] = 0.0
                     dividend_by_symbol[symbol] += amount
             
             # Calculate aggregate dividend yield
@@ -78,20 +77,13 @@ def render_dividend_summary(
         if dividend_by_symbol:
             st.markdown("#### Top Dividend Payers")
             
-            dividend_data = []
-            for symbol, amount in dividend_by_symbol.items():
-                dividend_data.append({
-                    "Symbol": symbol,
-                    "Dividend Income": f"${amount:,.2f}"
-                })
-            
-            # Sort by amount descending
-            dividend_data.sort(
-                key=lambda x: float(x["Dividend Income"].replace("$", "").replace(",", "")),
-                reverse=True
-            )
-            
-            df = pd.DataFrame(dividend_data[:10])  # Top 10
+            # Top 10 by amount, sorted on the numbers before formatting
+            top_payers = sorted(dividend_by_symbol.items(), key=lambda x: x[1], reverse=True)[:10]
+            symbols, amounts = zip(*top_payers)
+            df = pd.DataFrame({
+                "Symbol": symbols,
+                "Dividend Income": [f"${amount:,.2f}" for amount in amounts],
+            })
             st.dataframe(df, use_container_width=True, hide_index=True)
         else:
             st.info("No dividend data available for this period")
@@ -1,5 +1,6 @@
 """Performance metrics section for dashboard."""
 
+from collections import defaultdict
 from typing import Optional
 from datetime import date
 import streamlit as st
@@ -11,7 +12,7 @@ from finarius_app.core.metrics import (
     calculate_sharpe_ratio,
     calculate_max_drawdown,
 )
-from finarius_app.core.prices.downloader import PriceDownloader
+from finarius_app.ui.session_state import get_price_downloader
 
 
 def render_performance_metrics(
@@ -30,7 +31,7 @@ def render_performance_metrics(
     """
     st.subheader("📈 Performance Metrics")
     
-    price_downloader = PriceDownloader(db=db)
+    price_downloader = get_price_downloader(db)
     
     try:
         if account_id is None:
@@ -48,14 +49,12 @@ def render_performance_metrics(
             
             # Get combined portfolio value over time for metrics
             from finarius_app.core.engine import calculate_portfolio_value_over_time
-            combined_values = {}
+            combined_values = defaultdict(float)
             for acc in accounts:
                 acc_values = calculate_portfolio_value_over_time(
                     acc.id, start_date, end_date, "daily", db, price_downloader
                 )
                 for date, value in acc_values.items():
-                    if date not in combined_values:
-                        combined_values[date] = 0.0
                     combined_values[date] += value
             
             # For aggregate, we'll show a note that metrics are calculated per-account
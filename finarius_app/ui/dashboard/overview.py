@@ -1,5 +1,6 @@
 """Portfolio overview metrics for dashboard."""
 
+from collections import defaultdict
 from typing import Optional
 from datetime import date
 import streamlit as st
@@ -12,7 +13,7 @@ from finarius_app.core.metrics import (
     calculate_total_return,
     calculate_total_return_percentage,
 )
-from finarius_app.core.prices.downloader import PriceDownloader
+from finarius_app.ui.session_state import get_price_downloader
 
 
 def render_portfolio_overview(
@@ -31,7 +32,7 @@ def render_portfolio_overview(
     """
     st.subheader("📊 Portfolio Overview")
     
-    price_downloader = PriceDownloader(db=db)
+    price_downloader = get_price_downloader(db)
     
     if account_id is None:
         # Aggregate across all accounts
@@ -44,7 +45,7 @@ def render_portfolio_overview(
         total_realized = 0.0
         total_return = 0.0
         total_return_pct = 0.0
-        all_positions = {}
+        all_positions = defaultdict(lambda: {"qty": 0.0, "cost_basis": 0.0})
         num_symbols = set()
         
         for acc in accounts:
@@ -58,10 +59,9 @@ def render_portfolio_overview(
                     if pos["qty"] > 0:
                         total_cost_basis += pos["cost_basis"]
                         num_symbols.add(symbol)
-                        if symbol not in all_positions:
-                            all_positions[symbol] = {"qty": 0.0, "cost_basis": 0.0}
-                        all_positions[symbol]["qty"] += pos["qty"]
-                        all_positions[symbol]["cost_basis"] += pos["cost_basis"]
+                        symbol_totals = all_positions[symbol]
+                        symbol_totals["qty"] += pos["qty"]
+                        symbol_totals["cost_basis"] += pos["cost_basis"]
                 
                 unrealized = calculate_unrealized_gains(acc.id, end_date, db, price_downloader)
                 total_unrealized += unrealized
@@ -6,7 +6,7 @@ import streamlit as st
 import pandas as pd
 
 from finarius_app.core.engine import get_portfolio_breakdown
-from finarius_app.core.prices.downloader import PriceDownloader
+from finarius_app.ui.session_state import get_price_downloader
 
 
 def render_top_positions(
@@ -25,7 +25,7 @@ def render_top_positions(
     """
     st.subheader("💼 Top Positions")
     
-    price_downloader = PriceDownloader(db=db)
+    price_downloader = get_price_downloader(db)
     
     try:
         if account_id is None:
@@ -35,55 +35,36 @@ def render_top_positions(
             if not accounts:
                 st.info("No accounts available")
                 return
-            
-            aggregated_breakdown = {}
-            for acc in accounts:
-                acc_breakdown = get_portfolio_breakdown(acc.id, end_date, db, price_downloader)
-                for symbol, data in acc_breakdown.items():
-                    if symbol not in aggregated_breakdown:
-                        aggregated_breakdown[symbol] = {
-                            "qty": 0.0,
-                            "cost_basis": 0.0,
-                            "current_value": 0.0,
-                            "unrealized_gain": 0.0,
-                        }
-                    aggregated_breakdown[symbol]["qty"] += data["qty"]
-                    aggregated_breakdown[symbol]["cost_basis"] += data["cost_basis"]
-                    aggregated_breakdown[symbol]["current_value"] += data["current_value"]
-                    aggregated_breakdown[symbol]["unrealized_gain"] += data["unrealized_gain"]
-            breakdown = aggregated_breakdown
-        else:
-            breakdown = get_portfolio_breakdown(account_id, end_date, db, price_downloader)
+        
+        # account_id None combines all accounts' positions, pricing each symbol once
+        breakdown = get_portfolio_breakdown(account_id, end_date, db, price_downloader)
         
         if not breakdown:
             st.info("No positions found")
             return
         
+        # Largest positions by current value, sorted on the numbers before formatting
+        held = [(symbol, data) for symbol, data in breakdown.items() if data["qty"] > 0]
+        held.sort(key=lambda item: item[1]["current_value"], reverse=True)
+        
         # Prepare data for table
         positions_data = []
-        for symbol, data in breakdown.items():
-            if data["qty"] > 0:
-                current_value = data["current_value"]
-                cost_basis = data.get("cost_basis", 0.0)
-                unrealized_gain = data.get("unrealized_gain", current_value - cost_basis)
-                return_pct = (unrealized_gain / cost_basis * 100) if cost_basis > 0 else 0.0
-                current_price = current_value / data["qty"] if data["qty"] > 0 else 0.0
-                
-                positions_data.append({
-                    "Symbol": symbol,
-                    "Quantity": f"{data['qty']:,.2f}",
-                    "Current Price": f"${current_price:,.2f}",
-                    "Cost Basis": f"${cost_basis:,.2f}",
-                    "Current Value": f"${current_value:,.2f}",
-                    "Unrealized G/L": f"${unrealized_gain:,.2f}",
-                    "Return %": f"{return_pct:.2f}%",
-                })
-        
-        # Sort by current value descending
-        positions_data.sort(key=lambda x: float(x["Current Value"].replace("$", "").replace(",", "")), reverse=True)
-        
-        # Limit to top N
-        positions_data = positions_data[:limit]
+        for symbol, data in held[:limit]:
+            current_value = data["current_value"]
+            cost_basis = data.get("cost_basis", 0.0)
+            unrealized_gain = data.get("unrealized_gain", current_value - cost_basis)
+            return_pct = (unrealized_gain / cost_basis * 100) if cost_basis > 0 else 0.0
+            current_price = current_value / data["qty"]
+            
+            positions_data.append({
+                "Symbol": symbol,
+                "Quantity": f"{data['qty']:,.2f}",
+                "Current Price": f"${current_price:,.2f}",
+                "Cost Basis": f"${cost_basis:,.2f}",
+                "Current Value": f"${current_value:,.2f}",
+                "Unrealized G/L": f"${unrealized_gain:,.2f}",
+                "Return %": f"{return_pct:.2f}%",
+            })
         
         if positions_data:
             df = pd.DataFrame(positions_data)
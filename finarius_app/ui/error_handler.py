@@ -2,7 +2,7 @@
 
 import logging
 import traceback
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Tuple
 import streamlit as st
 
 from finarius_app.ui.session_state import set_error_message
@@ -83,9 +83,30 @@ def safe_execute(
     Returns:
         Function result or default value on error.
     """
+    return try_execute(func, *args, default=default, **kwargs)[1]
+
+
+def try_execute(
+    func: Callable, *args: Any, default: Any = None, **kwargs: Any
+) -> Tuple[bool, Any]:
+    """Execute a function, reporting whether it succeeded.
+
+    Unlike safe_execute, callers can tell a failure from a result that equals
+    the default, e.g. to show which metrics could not be calculated.
+
+    Args:
+        func: Function to execute.
+        *args: Positional arguments for function.
+        default: Value to return on error.
+        **kwargs: Keyword arguments for function.
+
+    Returns:
+        Tuple (True, result) on success, or (False, default) on error.
+    """
     try:
-        return func(*args, **kwargs)
+        return True, func(*args, **kwargs)
     except Exception as e:
-        logger.error(f"Error in safe_execute: {e}", exc_info=True)
-        return default
+        name = getattr(func, "__name__", repr(func))
+        logger.error(f"Error in {name}: {e}", exc_info=True)
+        return False, default
 
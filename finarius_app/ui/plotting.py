@@ -0,0 +1,23 @@
+"""Optional plotly support for UI charts."""
+
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def get_plotly_express() -> Optional[ModuleType]:
+    """Import plotly.express once per process.
+
+    A failed import is remembered too, so pages rendered without plotly do not
+    search for it again on every Streamlit rerun.
+
+    Returns:
+        The plotly.express module, or None if plotly is not installed (callers
+        fall back to Streamlit's built-in charts).
+    """
+    try:
+        import plotly.express as px
+    except ImportError:
+        return None
+    return px
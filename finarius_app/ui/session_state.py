@@ -1,9 +1,18 @@
 """Session state management for Finarius Streamlit app."""
 
-from typing import Optional, Any
+from typing import TYPE_CHECKING, List, Optional, Any
 import streamlit as st
 
 from finarius_app.core.database import Database
+from finarius_app.core.models import Account, get_all_accounts
+from finarius_app.core.prices.cache import ConnectionLRUCache
+
+if TYPE_CHECKING:
+    from finarius_app.core.prices.downloader import PriceDownloader
+
+# Single entry holding the account list; dropped on any database write, so
+# account changes show up on the next rerun
+_accounts_cache = ConnectionLRUCache(1)
 
 
 def initialize_session_state() -> None:
@@ -64,6 +73,47 @@ def set_db(db: Database) -> None:
     st.session_state.db = db
 
 
+def get_price_downloader(db: Database) -> "PriceDownloader":
+    """Get the session's price downloader for a database.
+
+    Every page section shares one instance, so the downloader's rate limiter
+    spaces out all of the session's requests. A new instance is created when
+    the database changes (e.g. after a restore).
+
+    Args:
+        db: Database instance the downloader caches prices in.
+
+    Returns:
+        PriceDownloader instance.
+    """
+    downloader = st.session_state.get("price_downloader")
+    if downloader is None or downloader.db is not db:
+        from finarius_app.core.prices.downloader import PriceDownloader
+
+        downloader = PriceDownloader(db=db)
+        st.session_state.price_downloader = downloader
+    return downloader
+
+
+def get_cached_accounts(db: Database) -> List[Account]:
+    """Get all accounts, reusing the list until the database changes.
+
+    Pages read the account list from several sections on every rerun; only
+    the first read after a write queries the database.
+
+    Args:
+        db: Database instance.
+
+    Returns:
+        New list of the (shared) Account instances, ordered by name.
+    """
+    accounts = _accounts_cache.get(db, "accounts")
+    if accounts is None:
+        accounts = get_all_accounts(db)
+        _accounts_cache.put(db, "accounts", accounts)
+    return list(accounts)
+
+
 def clear_messages() -> None:
     """Clear error and success messages from session state."""
     st.session_state.error_message = None
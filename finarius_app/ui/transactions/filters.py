@@ -24,11 +24,15 @@ def render_filters(accounts: List[Account], db) -> dict:
     
     with col1:
         # Account filter
-        account_options = ["All Accounts"] + [f"{acc.name} (ID: {acc.id})" for acc in accounts]
-        selected_account = st.selectbox("Account", account_options)
-        account_id = None
-        if selected_account != "All Accounts":
-            account_id = int(selected_account.split("(ID: ")[1].split(")")[0])
+        # Options are account IDs (None for all accounts), labelled via format_func
+        account_names = {acc.id: acc.name for acc in accounts}
+        account_id = st.selectbox(
+            "Account",
+            options=[None, *account_names],
+            format_func=lambda option: (
+                "All Accounts" if option is None else f"{account_names[option]} (ID: {option})"
+            ),
+        )
     
     with col2:
         # Quick date range selector
@@ -65,6 +65,19 @@ class TestDatabase:
         Database._instance = None
         Database._connection = None
 
+    def test_get_shared_instance(self, temp_db_path):
+        """Test that Database.get returns the shared instance."""
+        Database._instance = None
+        Database._connection = None
+
+        db = Database(temp_db_path)
+        assert Database.get() is db
+        assert Database.get().db_path == temp_db_path
+
+        close_db(db)
+        Database._instance = None
+        Database._connection = None
+
     def test_connection_creation(self, temp_db_path):
         """Test database connection creation."""
         Database._instance = None
@@ -106,6 +119,50 @@ class TestDatabase:
         assert results[1]["name"] == "name2"
         assert results[2]["name"] == "name3"
 
+    def test_execute_returning(self, db):
+        """Test executing an INSERT with a RETURNING clause."""
+        db.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, name TEXT)")
+
+        row = db.execute_returning(
+            "INSERT INTO test (name) VALUES (?) RETURNING id, name", ("returned",)
+        )
+        assert row["id"] == 1
+        assert row["name"] == "returned"
+        assert db.fetchone("SELECT name FROM test WHERE id = 1")["name"] == "returned"
+
+    def test_execute_returning_without_returning_support(self, db, monkeypatch):
+        """Test INSERT ... RETURNING falls back to a rowid lookup on SQLite < 3.35."""
+        from datetime import date
+        from finarius_app.core.database import connection
+        from finarius_app.core.models import Account, Transaction, Price
+
+        monkeypatch.setattr(connection, "SUPPORTS_RETURNING", False)
+        init_db(db.db_path)
+        db.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO test (name) VALUES (?)", ("first",))
+
+        row = db.execute_returning(
+            "INSERT INTO test (name) VALUES (?) RETURNING id, name", ("returned",)
+        )
+        assert (row["id"], row["name"]) == (2, "returned")
+        assert db.execute_returning(
+            "INSERT OR IGNORE INTO test (id, name) VALUES (1, ?) RETURNING id", ("dup",)
+        ) is None
+        with pytest.raises(sqlite3.NotSupportedError):
+            db.execute_returning("UPDATE test SET name = 'x' RETURNING id")
+
+        account = Account(name="Fallback").save(db)
+        assert account.id is not None and account.created_at is not None
+        transaction = Transaction(
+            date=date(2024, 1, 1),
+            account_id=account.id,
+            transaction_type="DEPOSIT",
+            price=100.0,
+        ).save(db)
+        assert transaction.id is not None and transaction.created_at is not None
+        price = Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+        assert price.created_at is not None
+
     def test_fetchone(self, db):
         """Test fetching one row."""
         db.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY, name TEXT)")
@@ -337,6 +394,19 @@ class TestTransactionsTable:
         assert "idx_transactions_symbol" in index_names
         assert "idx_transactions_type" in index_names
         assert "idx_transactions_account_date" in index_names
+        assert "idx_transactions_symbol_date" in index_names
+
+    def test_transaction_history_queries_avoid_sort(self, db):
+        """Test that per-account and per-symbol history is read in index order."""
+        for column in ("account_id", "symbol"):
+            plan = db.fetchall(
+                f"EXPLAIN QUERY PLAN SELECT * FROM transactions WHERE {column} = ? "
+                "ORDER BY date DESC, id DESC",
+                (1,),
+            )
+            details = " ".join(row["detail"] for row in plan)
+            assert "USING INDEX" in details
+            assert "TEMP B-TREE" not in details
 
     def test_transactions_default_fee(self, db):
         """Test transactions table default fee."""
@@ -400,7 +470,17 @@ class TestPricesTable:
 
         assert "idx_prices_symbol" in index_names
         assert "idx_prices_date" in index_names
-        assert "idx_prices_symbol_date" in index_names
+        assert "idx_prices_symbol_date" not in index_names
+        assert "idx_prices_symbol_date_desc" in index_names
+
+    def test_latest_price_uses_covering_index(self, db):
+        """Test that the latest-close lookup is served from the covering index."""
+        plan = db.fetchall(
+            "EXPLAIN QUERY PLAN SELECT symbol, date, close FROM prices "
+            "WHERE symbol = ? ORDER BY date DESC LIMIT 1",
+            ("AAPL",),
+        )
+        assert "COVERING INDEX idx_prices_symbol_date_desc" in plan[0]["detail"]
 
 
 class TestMigrationSystem:
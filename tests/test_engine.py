@@ -227,6 +227,38 @@ class TestPositions:
         assert "AAPL" in all_positions[account1.id]
         assert "MSFT" in all_positions[account2.id]
 
+    def test_get_positions_all_accounts(self, db, sample_account):
+        """Test combining positions across all accounts with account_id=None."""
+        other = Account(name="Other Account", currency="USD")
+        other.save(db)
+        for account_id, qty, price in [(sample_account.id, 10.0, 100.0), (other.id, 5.0, 130.0)]:
+            Transaction(
+                date=date(2024, 1, 1),
+                account_id=account_id,
+                transaction_type="BUY",
+                symbol="AAPL",
+                qty=qty,
+                price=price,
+            ).save(db)
+        # Selling out the other account leaves only this account's position
+        Transaction(
+            date=date(2024, 1, 2),
+            account_id=other.id,
+            transaction_type="SELL",
+            symbol="AAPL",
+            qty=5.0,
+            price=140.0,
+        ).save(db)
+
+        assert get_positions(None, date(2024, 1, 1), db)["AAPL"] == {
+            "qty": 15.0,
+            "cost_basis": pytest.approx(1650.0),
+            "avg_price": pytest.approx(110.0),
+        }
+        assert get_positions(None, date(2024, 1, 2), db) == get_positions(
+            sample_account.id, date(2024, 1, 2), db
+        )
+
     def test_get_current_positions(self, db, sample_account):
         """Test getting current positions."""
         transaction = Transaction(
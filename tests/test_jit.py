@@ -0,0 +1,63 @@
+"""Tests for optional JIT support module."""
+
+import numpy as np
+from unittest.mock import patch
+
+from finarius_app.core import jit
+from finarius_app.core.metrics.kernels import irr_kernel
+from finarius_app.core.prices.kernels import daily_returns_kernel
+
+
+class TestNjit:
+    """Test the optional njit decorator."""
+
+    def test_njit_without_numba_bare(self):
+        """Test that @njit is a no-op without numba."""
+        with patch.object(jit, "numba", None):
+
+            def func(x):
+                return x
+
+            assert jit.njit(func) is func
+
+    def test_njit_without_numba_with_options(self):
+        """Test that @njit(...) is a no-op without numba."""
+        with patch.object(jit, "numba", None):
+
+            def func(x):
+                return x
+
+            assert jit.njit(cache=True)(func) is func
+
+
+class TestKernels:
+    """Test numeric price and metric kernels."""
+
+    def test_daily_returns_kernel(self):
+        """Test daily changes and percentage returns."""
+        changes, returns, valid = daily_returns_kernel(np.array([100.0, 110.0, 99.0]))
+        assert changes.tolist() == [10.0, -11.0]
+        assert np.allclose(returns, [10.0, -10.0])
+        assert valid.tolist() == [True, True]
+
+    def test_daily_returns_kernel_invalid_closes(self):
+        """Test that zero previous closes and missing closes are masked without warnings."""
+        closes = np.array([0.0, 10.0, np.nan, 12.0, 15.0])
+        with np.errstate(all="raise"):
+            changes, returns, valid = daily_returns_kernel(closes)
+        assert valid.tolist() == [False, False, False, True]
+        assert changes[3] == 3.0
+        assert returns[3] == 25.0
+
+    def test_irr_kernel(self):
+        """Test the IRR root-finding kernel."""
+        flows = np.array([-1000.0, 1100.0])
+        assert abs(irr_kernel(flows, np.array([0.0, 1.0])) - 0.1) < 1e-6
+        # Two equal yearly returns of 10%
+        flows = np.array([-1000.0, 0.0, 1210.0])
+        assert abs(irr_kernel(flows, np.array([0.0, 1.0, 2.0])) - 0.1) < 1e-6
+
+    def test_irr_kernel_no_root(self):
+        """Test that a cash flow sign pattern without a root gives NaN."""
+        flows = np.array([1000.0, 1100.0])
+        assert np.isnan(irr_kernel(flows, np.array([0.0, 1.0])))
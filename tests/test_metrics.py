@@ -13,6 +13,7 @@ from finarius_app.core.metrics import (
     MetricsCalculator,
     calculate_realized_gains,
     get_realized_gains_by_symbol,
+    get_realized_gains_history,
     calculate_unrealized_gains,
     get_unrealized_gains_by_symbol,
     calculate_total_return,
@@ -23,9 +24,16 @@ from finarius_app.core.metrics import (
     get_dividend_history,
     calculate_dividend_yield,
     calculate_dividend_income,
+    get_dividend_by_symbol,
     calculate_sharpe_ratio,
     calculate_max_drawdown,
     calculate_volatility,
+    calculate_beta,
+    get_cagr_history,
+    get_irr_history,
+    get_twrr_history,
+    compute_performance_bundle,
+    compute_risk_bundle,
 )
 
 
@@ -159,6 +167,54 @@ class TestRealizedGains:
         assert "AAPL" in gains_by_symbol
         assert "MSFT" in gains_by_symbol
 
+    def test_realized_gains_all_accounts(self, db, sample_account):
+        """Test realized gains across all accounts keep each account's cost basis."""
+        other = Account(name="Other Account", currency="USD")
+        other.save(db)
+        # Same symbol bought at different prices in the two accounts
+        for account_id, buy_price, sell_date in [
+            (sample_account.id, 100.0, date(2024, 1, 10)),
+            (other.id, 150.0, date(2024, 1, 20)),
+        ]:
+            Transaction(
+                date=date(2024, 1, 1),
+                account_id=account_id,
+                transaction_type="BUY",
+                symbol="AAPL",
+                qty=10.0,
+                price=buy_price,
+            ).save(db)
+            Transaction(
+                date=sell_date,
+                account_id=account_id,
+                transaction_type="SELL",
+                symbol="AAPL",
+                qty=5.0,
+                price=160.0,
+            ).save(db)
+
+        start, end = date(2024, 1, 1), date(2024, 1, 31)
+        # 5 * (160 - 100) + 5 * (160 - 150)
+        assert calculate_realized_gains(None, start, end, db) == pytest.approx(350.0)
+        assert calculate_realized_gains(None, start, end, db) == pytest.approx(
+            calculate_realized_gains(sample_account.id, start, end, db)
+            + calculate_realized_gains(other.id, start, end, db)
+        )
+        assert get_realized_gains_by_symbol(None, start, end, db) == {
+            "AAPL": pytest.approx(350.0)
+        }
+
+        history = get_realized_gains_history(None, start, end, db)
+        assert history[date(2024, 1, 9)] == 0.0
+        assert history[date(2024, 1, 10)] == pytest.approx(300.0)
+        assert history[end] == pytest.approx(350.0)
+
+        # Weekly points still count the sales between them
+        weekly = get_realized_gains_history(None, start, end, db, frequency="weekly")
+        assert list(weekly) == [date(2024, 1, day) for day in (1, 8, 15, 22, 29)]
+        assert weekly == {day: history[day] for day in weekly}
+        assert weekly[date(2024, 1, 15)] == pytest.approx(300.0)
+
 
 class TestUnrealizedGains:
     """Test unrealized gains calculation."""
@@ -258,6 +314,95 @@ class TestReturns:
         )
         assert cagr == 0.0
 
+    def test_compute_performance_bundle_matches_separate_metrics(self, db, sample_account):
+        """Test the combined bundle gives the same results as each metric function."""
+        for transaction_date, transaction_type, symbol, qty, price in [
+            (date(2024, 1, 1), "DEPOSIT", None, None, 2000.0),
+            (date(2024, 1, 1), "BUY", "AAPL", 10.0, 150.0),
+            (date(2024, 1, 4), "DEPOSIT", None, None, 500.0),
+            (date(2024, 1, 5), "BUY", "AAPL", 2.0, 155.0),
+            (date(2024, 1, 7), "SELL", "AAPL", 3.0, 158.0),
+            (date(2024, 1, 8), "DIVIDEND", "AAPL", 9.0, 0.5),
+        ]:
+            Transaction(
+                date=transaction_date,
+                account_id=sample_account.id,
+                transaction_type=transaction_type,
+                symbol=symbol,
+                qty=qty,
+                price=price,
+            ).save(db)
+        closes = [150.0, 152.0, 149.0, 153.0, 155.0, 157.0, 158.0, 160.0, 159.0, 161.0]
+        for day, close in enumerate(closes):
+            Price(symbol="AAPL", date=date(2024, 1, 1 + day), close=close).save(db)
+
+        price_downloader = Mock()
+        price_downloader.download_price.return_value = None
+        period = (sample_account.id, date(2024, 1, 1), date(2024, 1, 10), db, price_downloader)
+
+        bundle = compute_performance_bundle(*period)
+
+        assert bundle.total_return == pytest.approx(calculate_total_return(*period))
+        assert bundle.total_return_percentage == pytest.approx(
+            calculate_total_return_percentage(*period)
+        )
+        assert bundle.cagr == pytest.approx(calculate_cagr(*period))
+        assert bundle.twrr == pytest.approx(calculate_twrr(*period))
+        assert bundle.volatility == pytest.approx(calculate_volatility(*period))
+        assert bundle.cagr_history == pytest.approx(get_cagr_history(*period))
+        assert bundle.twrr_history == pytest.approx(get_twrr_history(*period))
+        separate_irr = get_irr_history(*period)
+        assert bundle.irr_history.keys() == separate_irr.keys()
+        for day, irr in separate_irr.items():
+            if irr is None:
+                assert bundle.irr_history[day] is None
+            else:
+                assert bundle.irr_history[day] == pytest.approx(irr)
+        assert bundle.irr == bundle.irr_history[date(2024, 1, 10)]
+
+    def test_compute_performance_bundle_reuses_daily_values(self, db, sample_account):
+        """Test overlapping periods share valuations until the database changes."""
+        from finarius_app.core.metrics import performance
+
+        Transaction(
+            date=date(2024, 1, 1),
+            account_id=sample_account.id,
+            transaction_type="BUY",
+            symbol="AAPL",
+            qty=10.0,
+            price=150.0,
+        ).save(db)
+        for day in range(10):
+            Price(symbol="AAPL", date=date(2024, 1, 1 + day), close=150.0 + day).save(db)
+
+        price_downloader = Mock()
+        price_downloader.download_price.return_value = None
+        with patch.object(
+            performance,
+            "calculate_portfolio_value",
+            wraps=performance.calculate_portfolio_value,
+        ) as value_mock:
+            compute_performance_bundle(
+                sample_account.id, date(2024, 1, 1), date(2024, 1, 5), db, price_downloader
+            )
+            assert value_mock.call_count == 5
+
+            # Only the five new days are valued
+            bundle = compute_performance_bundle(
+                sample_account.id, date(2024, 1, 1), date(2024, 1, 10), db, price_downloader
+            )
+            assert value_mock.call_count == 10
+            assert bundle.cagr == pytest.approx(
+                calculate_cagr(sample_account.id, date(2024, 1, 1), date(2024, 1, 10), db)
+            )
+
+            # A write invalidates every cached value
+            Price(symbol="AAPL", date=date(2024, 1, 10), close=200.0).save(db)
+            compute_performance_bundle(
+                sample_account.id, date(2024, 1, 6), date(2024, 1, 10), db, price_downloader
+            )
+            assert value_mock.call_count == 15
+
 
 class TestDividends:
     """Test dividend analytics."""
@@ -311,6 +456,36 @@ class TestDividends:
 
         assert income == pytest.approx(50.0)
 
+    def test_dividends_all_accounts(self, db, sample_account):
+        """Test dividend metrics across all accounts with account_id=None."""
+        other = Account(name="Other Account", currency="USD")
+        other.save(db)
+        for account_id, symbol in [(sample_account.id, "AAPL"), (other.id, "MSFT")]:
+            Transaction(
+                date=date(2024, 1, 15),
+                account_id=account_id,
+                transaction_type="DIVIDEND",
+                symbol=symbol,
+                qty=10.0,
+                price=2.5,
+            ).save(db)
+        Transaction(
+            date=date(2024, 1, 10),
+            account_id=other.id,
+            transaction_type="DEPOSIT",
+            qty=1000.0,
+        ).save(db)
+
+        history = get_dividend_history(None, date(2024, 1, 1), date(2024, 1, 31), db)
+        assert sorted(d["symbol"] for d in history) == ["AAPL", "MSFT"]
+        assert all(d["type"] == "DIVIDEND" for d in history)
+        income = calculate_dividend_income(None, date(2024, 1, 1), date(2024, 1, 31), db)
+        assert income == pytest.approx(50.0)
+        assert get_dividend_by_symbol(None, date(2024, 1, 1), date(2024, 1, 31), db) == {
+            "AAPL": pytest.approx(25.0),
+            "MSFT": pytest.approx(25.0),
+        }
+
 
 class TestRiskMetrics:
     """Test risk metrics calculations."""
@@ -348,6 +523,48 @@ class TestRiskMetrics:
         assert drawdown > 0
         assert drawdown <= 1.0  # Should be between 0 and 1
 
+    def test_compute_risk_bundle_matches_separate_metrics(self, db, sample_account):
+        """Test the combined risk bundle gives the same results as each metric function."""
+        Transaction(
+            date=date(2024, 1, 1),
+            account_id=sample_account.id,
+            transaction_type="BUY",
+            symbol="AAPL",
+            qty=10.0,
+            price=150.0,
+        ).save(db)
+        closes = [150.0, 160.0, 140.0, 155.0, 158.0, 151.0, 162.0]
+        benchmark = [400.0, 404.0, 396.0, 402.0, None, 401.0, 408.0]
+        for day, (close, spy_close) in enumerate(zip(closes, benchmark)):
+            Price(symbol="AAPL", date=date(2024, 1, 1 + day), close=close).save(db)
+            if spy_close is not None:
+                Price(symbol="SPY", date=date(2024, 1, 1 + day), close=spy_close).save(db)
+
+        price_downloader = Mock()
+        price_downloader.download_price.return_value = None
+        start, end = date(2024, 1, 1), date(2024, 1, 7)
+
+        bundle = compute_risk_bundle(
+            sample_account.id, start, end, 0.02, "SPY", db, price_downloader
+        )
+
+        period = (sample_account.id, start, end)
+        assert bundle.sharpe_ratio == pytest.approx(
+            calculate_sharpe_ratio(*period, 0.02, db, price_downloader)
+        )
+        assert bundle.max_drawdown == pytest.approx(
+            calculate_max_drawdown(*period, db, price_downloader)
+        )
+        # 160 -> 140
+        assert bundle.max_drawdown == pytest.approx(0.125)
+        assert bundle.volatility == pytest.approx(
+            calculate_volatility(*period, db, price_downloader)
+        )
+        assert bundle.beta is not None
+        assert bundle.beta == pytest.approx(
+            calculate_beta(sample_account.id, "SPY", start, end, db, price_downloader)
+        )
+
 
 class TestMetricsCalculator:
     """Test MetricsCalculator class."""
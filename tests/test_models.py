@@ -5,6 +5,7 @@ import sqlite3
 import tempfile
 import os
 from datetime import date, timedelta
+from unittest.mock import Mock
 from finarius_app.core.database import init_db, Database
 from finarius_app.core.models import (
     Account,
@@ -12,12 +13,17 @@ from finarius_app.core.models import (
     Price,
     get_account_by_id,
     get_account_by_name,
+    get_accounts_by_ids,
     get_all_accounts,
     get_transaction_by_id,
     get_transactions_by_account,
+    count_transactions_by_account,
+    get_transactions_by_account_with_account,
     get_transactions_by_symbol,
     get_price,
     get_prices,
+    get_bracketing_prices,
+    get_closes,
     get_latest_price,
 )
 
@@ -142,6 +148,17 @@ class TestAccount:
         with pytest.raises(ValueError, match="Currency must be a 3-letter code"):
             account.validate()
 
+    def test_models_use_slots(self, sample_account):
+        """Test that model instances carry no per-instance __dict__."""
+        price = Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0)
+        txn = Transaction(
+            date=date(2024, 1, 1), account_id=sample_account.id, transaction_type="DEPOSIT"
+        )
+        for instance in (sample_account, price, txn):
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.unknown_field = 1
+
     def test_account_unique_constraint(self, db):
         """Test account unique name constraint."""
         account1 = Account(name="Unique Account", currency="USD")
@@ -172,6 +189,15 @@ class TestTransaction:
         assert txn.qty == 10
         assert txn.price == 150.0
 
+    def test_transaction_creation_from_date_string(self, sample_account):
+        """Test creating a transaction with an ISO date string."""
+        txn = Transaction(
+            date="2024-01-01",
+            account_id=sample_account.id,
+            transaction_type="DEPOSIT",
+        )
+        assert txn.date == date(2024, 1, 1)
+
     def test_transaction_save_new(self, db, sample_account):
         """Test saving a new transaction."""
         txn = Transaction(
@@ -186,6 +212,23 @@ class TestTransaction:
         assert txn.id is not None
         assert txn.created_at is not None
 
+    def test_transaction_save_same_day_ids(self, db, sample_account):
+        """Test that same-day transactions each get their own inserted ID."""
+        txns = [
+            Transaction(
+                date=date(2024, 1, 1),
+                account_id=sample_account.id,
+                transaction_type="BUY",
+                symbol=symbol,
+                qty=10,
+                price=150.0,
+            ).save(db)
+            for symbol in ("AAPL", "MSFT")
+        ]
+        assert txns[0].id != txns[1].id
+        assert get_transaction_by_id(txns[0].id, db).symbol == "AAPL"
+        assert get_transaction_by_id(txns[1].id, db).symbol == "MSFT"
+
     def test_transaction_save_existing(self, db, sample_account):
         """Test updating an existing transaction."""
         txn = Transaction(
@@ -287,6 +330,24 @@ class TestTransaction:
         assert txn.date == date(2024, 1, 1)
         assert txn.type == "BUY"
 
+    def test_transaction_from_row(self, db, sample_account):
+        """Test creating transaction directly from a database row."""
+        txn = Transaction(
+            date=date(2024, 1, 1),
+            account_id=sample_account.id,
+            transaction_type="BUY",
+            symbol="AAPL",
+            qty=10,
+            price=150.0,
+        ).save(db)
+        row = db.fetchone("SELECT * FROM transactions WHERE id = ?", (txn.id,))
+
+        loaded = Transaction.from_row(row)
+        assert loaded.id == txn.id
+        assert loaded.date == date(2024, 1, 1)
+        assert loaded.type == "BUY"
+        assert loaded.fee == 0.0
+
     def test_transaction_validation_invalid_type(self, sample_account):
         """Test transaction validation with invalid type."""
         txn = Transaction(
@@ -297,8 +358,9 @@ class TestTransaction:
             qty=10,
             price=150.0,
         )
-        with pytest.raises(ValueError, match="Invalid transaction type"):
+        with pytest.raises(ValueError, match="Invalid transaction type") as exc_info:
             txn.validate()
+        assert "BUY, DEPOSIT, DIVIDEND, SELL, WITHDRAW" in str(exc_info.value)
 
     def test_transaction_validation_missing_symbol_buy(self, sample_account):
         """Test transaction validation for BUY without symbol."""
@@ -338,6 +400,32 @@ class TestTransaction:
         with pytest.raises(ValueError, match="Price must be non-negative"):
             txn.validate()
 
+    def test_transaction_validation_dividend_and_fee(self, sample_account):
+        """Test DIVIDEND and fee rules on the combined validation check."""
+        dividend = Transaction(
+            date=date(2024, 1, 1),
+            account_id=sample_account.id,
+            transaction_type="DIVIDEND",
+            symbol="AAPL",
+            qty=0,
+            price=1.5,
+        )
+        with pytest.raises(ValueError, match="Quantity must be positive for DIVIDEND"):
+            dividend.validate()
+
+        deposit = Transaction(
+            date=date(2024, 1, 1),
+            account_id=sample_account.id,
+            transaction_type="DEPOSIT",
+            price=1000.0,
+            fee=-1.0,
+        )
+        with pytest.raises(ValueError, match="Fee cannot be negative"):
+            deposit.validate()
+
+        deposit.fee = 0.0
+        deposit.validate()
+
     def test_transaction_foreign_key_constraint(self, db):
         """Test transaction foreign key constraint."""
         txn = Transaction(
@@ -417,6 +505,11 @@ class TestPrice:
         assert price.close == 150.0
         assert price.open == 149.0
 
+    def test_price_creation_from_date_string(self):
+        """Test creating a price with an ISO date string."""
+        price = Price(symbol="AAPL", date="2024-01-01", close=150.0)
+        assert price.date == date(2024, 1, 1)
+
     def test_price_save(self, db):
         """Test saving a price."""
         price = Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0)
@@ -447,6 +540,68 @@ class TestPrice:
         assert len(result) == 1
         assert result[0]["close"] == 155.0
 
+    def test_price_save_many(self, db):
+        """Test saving multiple prices in one batch."""
+        prices = [
+            Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0),
+            Price(symbol="AAPL", date=date(2024, 1, 2), close=152.0),
+            Price(symbol="MSFT", date=date(2024, 1, 1), close=370.0),
+        ]
+        saved = Price.save_many(prices, db)
+        assert len(saved) == 3
+
+        result = db.fetchall("SELECT * FROM prices ORDER BY symbol, date")
+        assert len(result) == 3
+        assert result[1]["close"] == 152.0
+
+    def test_price_save_many_validates_before_write(self, db):
+        """Test that an invalid price aborts the whole batch."""
+        prices = [
+            Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0),
+            Price(symbol="AAPL", date=date(2024, 1, 2), close=-1.0),
+        ]
+        with pytest.raises(ValueError, match="Close price must be positive"):
+            Price.save_many(prices, db)
+
+        assert db.fetchall("SELECT * FROM prices") == []
+
+    def test_price_save_many_modes(self, db):
+        """Test conflict handling of the save_many write modes."""
+        Price.save_many([Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0)], db)
+
+        # Default upsert replaces existing (symbol, date) rows like save
+        Price.save_many([Price(symbol="AAPL", date=date(2024, 1, 1), close=153.0)], db)
+        assert get_price("AAPL", date(2024, 1, 1), db).close == 153.0
+
+        Price.save_many(
+            [Price(symbol="AAPL", date=date(2024, 1, 1), close=152.0)], db, mode="ignore"
+        )
+        assert get_price("AAPL", date(2024, 1, 1), db).close == 153.0
+        assert len(db.fetchall("SELECT * FROM prices")) == 1
+
+        with pytest.raises(ValueError, match="Invalid save mode"):
+            Price.save_many([], db, mode="insert")
+
+    def test_price_symbol_normalization_reuses_strings(self):
+        """Test that equal symbols share one uppercase string object."""
+        first = Price(symbol="aapl", date=date(2024, 1, 1), close=150.0)
+        second = Price(symbol="".join(["a", "apl"]), date=date(2024, 1, 2), close=151.0)
+        third = Price(symbol="".join(["AA", "PL"]), date=date(2024, 1, 3), close=152.0)
+        assert first.symbol == "AAPL"
+        assert first.symbol is second.symbol is third.symbol
+
+    def test_price_save_rows_from_generator(self, db):
+        """Test streaming raw price rows from a generator."""
+        rows = (
+            ("AAPL", f"2024-01-0{day}", 150.0 + day, None, None, None, 1000)
+            for day in range(1, 4)
+        )
+        assert Price.save_rows(rows, db) == 3
+
+        prices = get_prices("AAPL", db=db)
+        assert [p.close for p in prices] == [151.0, 152.0, 153.0]
+        assert prices[0].volume == 1000
+
     def test_price_delete(self, db):
         """Test deleting a price."""
         price = Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0)
@@ -491,6 +646,17 @@ class TestPrice:
         assert price.date == date(2024, 1, 1)
         assert price.close == 150.0
 
+    def test_price_from_row(self, db):
+        """Test creating price directly from a database row."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0, volume=100).save(db)
+        row = db.fetchone("SELECT * FROM prices WHERE symbol = ?", ("AAPL",))
+
+        price = Price.from_row(row)
+        assert price.date == date(2024, 1, 1)
+        assert price.close == 150.0
+        assert price.volume == 100
+        assert price.created_at is not None
+
     def test_price_validation_empty_symbol(self):
         """Test price validation with empty symbol."""
         price = Price(symbol="", date=date(2024, 1, 1), close=150.0)
@@ -542,6 +708,15 @@ class TestQueryHelpers:
         account = get_account_by_name("Non-existent", db)
         assert account is None
 
+    def test_get_accounts_by_ids(self, db, sample_account):
+        """Test getting several accounts by ID in one query."""
+        other = Account(name="Other Account", currency="EUR").save(db)
+
+        accounts = get_accounts_by_ids([sample_account.id, other.id, sample_account.id, 999], db)
+        assert set(accounts) == {sample_account.id, other.id}
+        assert accounts[other.id].currency == "EUR"
+        assert get_accounts_by_ids([], db) == {}
+
     def test_get_all_accounts(self, db):
         """Test getting all accounts."""
         # Create multiple accounts
@@ -589,6 +764,48 @@ class TestQueryHelpers:
         transactions = get_transactions_by_account(sample_account.id, db=db)
         assert len(transactions) >= 3
 
+    def test_count_transactions_by_account(self, db, sample_account):
+        """Test counting transactions by account."""
+        assert count_transactions_by_account(sample_account.id, db) == 0
+        for i in range(3):
+            Transaction(
+                date=date(2024, 1, i + 1),
+                account_id=sample_account.id,
+                transaction_type="BUY",
+                symbol="AAPL",
+                qty=10,
+                price=150.0,
+            ).save(db)
+
+        assert count_transactions_by_account(sample_account.id, db) == 3
+        assert count_transactions_by_account(sample_account.id + 1, db) == 0
+
+    def test_get_transactions_by_account_with_account(self, db, sample_account):
+        """Test getting transactions with their account eagerly loaded."""
+        for i in range(2):
+            Transaction(
+                date=date(2024, 1, i + 1),
+                account_id=sample_account.id,
+                transaction_type="BUY",
+                symbol="AAPL",
+                qty=10,
+                price=150.0,
+            ).save(db)
+
+        transactions = get_transactions_by_account_with_account(sample_account.id, db=db)
+        assert len(transactions) == 2
+        assert transactions[0].date == date(2024, 1, 2)
+
+        # Account is served from the eager load, even without a database
+        account = transactions[0].get_account(db=Mock())
+        assert account.id == sample_account.id
+        assert account.name == sample_account.name
+
+        # Moving the transaction to another account drops the eager load
+        other = Account(name="Other Account", currency="USD").save(db)
+        transactions[0].update(account_id=other.id)
+        assert transactions[0].get_account(db).id == other.id
+
     def test_get_transactions_by_account_date_range(self, db, sample_account):
         """Test getting transactions by account with date range."""
         # Create transactions on different dates
@@ -613,6 +830,25 @@ class TestQueryHelpers:
         )
         assert len(transactions) == 2
 
+    def test_get_transactions_by_account_open_ended_ranges(self, db, sample_account):
+        """Test each precomputed start/end date query variant."""
+        for day in (1, 15, 31):
+            Transaction(
+                date=date(2024, 1, day),
+                account_id=sample_account.id,
+                transaction_type="DEPOSIT",
+                price=100.0,
+            ).save(db)
+
+        def days(start, end):
+            transactions = get_transactions_by_account(sample_account.id, start, end, db)
+            return [t.date.day for t in transactions]
+
+        assert days(None, None) == [31, 15, 1]
+        assert days(date(2024, 1, 10), None) == [31, 15]
+        assert days(None, date(2024, 1, 20)) == [15, 1]
+        assert days(date(2024, 1, 10), date(2024, 1, 20)) == [15]
+
     def test_get_transactions_by_symbol(self, db, sample_account):
         """Test getting transactions by symbol."""
         # Create transactions for different symbols
@@ -678,6 +914,44 @@ class TestQueryHelpers:
         )
         assert len(prices) == 2
 
+    def test_get_bracketing_prices(self, db):
+        """Test getting the closest prices around a date range."""
+        for d, close in [
+            (date(2024, 1, 1), 150.0),
+            (date(2024, 1, 15), 155.0),
+            (date(2024, 2, 1), 160.0),
+        ]:
+            Price(symbol="AAPL", date=d, close=close).save(db)
+
+        before, after = get_bracketing_prices("aapl", date(2024, 1, 10), date(2024, 1, 20), db)
+        assert before.date == date(2024, 1, 1)
+        assert after.date == date(2024, 2, 1)
+
+        before, after = get_bracketing_prices("AAPL", date(2024, 1, 15), date(2024, 1, 15), db)
+        assert before.close == after.close == 155.0
+
+        before, after = get_bracketing_prices("AAPL", date(2023, 12, 1), date(2024, 3, 1), db)
+        assert before is None and after is None
+
+    def test_get_closes(self, db):
+        """Test getting closing prices as NumPy arrays."""
+        Price(symbol="AAPL", date=date(2024, 1, 2), close=152.0).save(db)
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+        Price(symbol="AAPL", date=date(2024, 1, 3), close=153.0).save(db)
+
+        dates, closes = get_closes("aapl", start_date=date(2024, 1, 2), db=db)
+        assert dates.astype(str).tolist() == ["2024-01-02", "2024-01-03"]
+        assert closes.tolist() == [152.0, 153.0]
+
+        plan = db.fetchall(
+            "EXPLAIN QUERY PLAN SELECT date, close FROM prices WHERE symbol = ? ORDER BY date ASC",
+            ("AAPL",),
+        )
+        assert any("COVERING INDEX" in row["detail"] for row in plan)
+
+        dates, closes = get_closes("NONEXISTENT", db=db)
+        assert dates.size == closes.size == 0
+
     def test_get_latest_price(self, db):
         """Test getting latest price."""
         # Create prices for different dates
@@ -693,6 +967,7 @@ class TestQueryHelpers:
         latest = get_latest_price("AAPL", db)
         assert latest is not None
         assert latest.date == date(2024, 2, 1)
+        assert latest.close == 150.0
 
     def test_get_latest_price_not_found(self, db):
         """Test getting latest price when none exists."""
@@ -1,17 +1,20 @@
 """Tests for price management utilities (scheduler and analytics)."""
 
 import pytest
+import statistics
 import tempfile
 import os
-from datetime import date, timedelta, datetime
+from datetime import date, timedelta, datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 
 from finarius_app.core.database import init_db, Database
 from finarius_app.core.models import Account, Transaction, Price
+from finarius_app.core.prices import analytics
 from finarius_app.core.prices import (
     PriceDownloader,
     get_all_portfolio_symbols,
     get_last_update_time,
+    get_last_update_times,
     update_prices_for_symbol,
     update_all_prices,
     schedule_daily_updates,
@@ -20,6 +23,7 @@ from finarius_app.core.prices import (
     get_price_statistics,
     calculate_daily_returns,
     get_price_range,
+    PriceDownloadError,
 )
 
 
@@ -167,13 +171,36 @@ class TestPriceScheduler:
         assert last_update is not None
         assert isinstance(last_update, datetime)
 
+    def test_get_last_update_time_formats(self, db):
+        """Test parsing stored update timestamps."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+        query = "UPDATE prices SET created_at = ? WHERE symbol = ?"
+        db.execute(query, ("2024-01-02 03:04:05", "AAPL"))
+        assert get_last_update_time("AAPL", db) == datetime(2024, 1, 2, 3, 4, 5)
+
+        db.execute(query, ("not a timestamp", "AAPL"))
+        assert get_last_update_time("AAPL", db) is None
+
+    def test_get_last_update_times(self, db):
+        """Test fetching the last update times of several symbols at once."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+        Price(symbol="MSFT", date=date(2024, 1, 1), close=300.0).save(db)
+        db.execute("UPDATE prices SET created_at = ?", ("2024-01-02 03:04:05",))
+
+        with patch("finarius_app.core.prices.scheduler.SQLITE_MAX_VARIABLES", 1):
+            last_updates = get_last_update_times(["aapl", "MSFT", "GOOGL"], db)
+
+        assert last_updates == {
+            "AAPL": datetime(2024, 1, 2, 3, 4, 5),
+            "MSFT": datetime(2024, 1, 2, 3, 4, 5),
+        }
+
     @patch("finarius_app.core.prices.scheduler.PriceDownloader")
     def test_update_prices_for_symbol(self, mock_downloader_class, db):
         """Test updating prices for a symbol."""
         # Mock downloader
         mock_downloader = Mock(spec=PriceDownloader)
-        mock_price = Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0)
-        mock_downloader.download_prices.return_value = [mock_price]
+        mock_downloader.download_prices_to_cache.return_value = 1
         mock_downloader_class.return_value = mock_downloader
 
         result = update_prices_for_symbol("AAPL", mock_downloader, db, days_back=30)
@@ -187,7 +214,7 @@ class TestPriceScheduler:
     def test_update_prices_for_symbol_error(self, mock_downloader_class, db):
         """Test updating prices when error occurs."""
         mock_downloader = Mock(spec=PriceDownloader)
-        mock_downloader.download_prices.side_effect = Exception("Network error")
+        mock_downloader.download_prices_to_cache.side_effect = Exception("Network error")
         mock_downloader_class.return_value = mock_downloader
 
         result = update_prices_for_symbol("AAPL", mock_downloader, db)
@@ -195,23 +222,81 @@ class TestPriceScheduler:
         assert result["success"] is False
         assert result["error"] is not None
 
-    @patch("finarius_app.core.prices.scheduler.update_prices_for_symbol")
-    def test_update_all_prices(self, mock_update, db, sample_transactions):
+    def test_update_all_prices(self, db, sample_transactions):
         """Test updating all prices."""
-        # Mock individual updates
-        mock_update.return_value = {
-            "success": True,
-            "symbol": "AAPL",
-            "prices_downloaded": 10,
-            "error": None,
-        }
+        def rows(symbol):
+            return [
+                (symbol, f"2024-01-{day:02d}", 150.0, None, None, None, None)
+                for day in range(1, 11)
+            ]
+
+        def fetch_price_rows(symbol, start, end):
+            # Downloads run before the bulk write window relaxes the pragmas
+            conn = db.get_connection()
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            return rows(symbol)
+
+        # The batched request only returns AAPL; MSFT falls back to its own download
+        mock_downloader = Mock(spec=PriceDownloader)
+        mock_downloader.fetch_batch_price_rows.return_value = {"AAPL": rows("AAPL")}
+        mock_downloader.fetch_price_rows.side_effect = fetch_price_rows
 
-        result = update_all_prices(db=db)
+        result = update_all_prices(mock_downloader, db=db)
 
+        mock_downloader.fetch_batch_price_rows.assert_called_once()
+        assert mock_downloader.fetch_batch_price_rows.call_args[0][0] == ["AAPL", "MSFT"]
+        mock_downloader.fetch_price_rows.assert_called_once()
+        assert mock_downloader.fetch_price_rows.call_args[0][0] == "MSFT"
         assert result["total_symbols"] == 2
         assert result["successful"] == 2
         assert result["failed"] == 0
         assert result["total_prices"] == 20
+        assert [r["symbol"] for r in result["results"]] == ["AAPL", "MSFT"]
+        assert len(db.fetchall("SELECT 1 FROM prices")) == 20
+
+    def test_update_all_prices_save_modes(self, db, sample_transactions):
+        """Test first downloads of a range are inserted and cached ranges refreshed."""
+        yesterday = date.today() - timedelta(days=1)
+        Price(symbol="AAPL", date=yesterday, close=100.0).save(db)
+        db.execute("UPDATE prices SET created_at = '2000-01-01 00:00:00'")
+
+        def rows(symbol):
+            return [(symbol, yesterday.isoformat(), 150.0, None, None, None, None)]
+
+        mock_downloader = Mock(spec=PriceDownloader)
+        mock_downloader.fetch_batch_price_rows.return_value = {
+            "AAPL": rows("AAPL"), "MSFT": rows("MSFT")
+        }
+
+        with patch.object(Price, "save_rows", wraps=Price.save_rows) as save_rows:
+            update_all_prices(mock_downloader, db=db)
+
+        modes = {call[0][0][0][0]: call[1]["mode"] for call in save_rows.call_args_list}
+        assert modes == {"AAPL": "upsert", "MSFT": "ignore"}
+        assert db.fetchone("SELECT close FROM prices WHERE symbol = 'AAPL'")["close"] == 150.0
+
+    def test_update_all_prices_skips_and_failures(self, db, sample_transactions):
+        """Test that fresh symbols are skipped and failed downloads are reported."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+        db.execute(
+            "UPDATE prices SET created_at = ?",
+            (datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),),
+        )
+        mock_downloader = Mock(spec=PriceDownloader)
+        mock_downloader.fetch_price_rows.side_effect = PriceDownloadError("Network error")
+        progress = []
+
+        result = update_all_prices(
+            mock_downloader,
+            db=db,
+            progress_callback=lambda current, total, symbol: progress.append((current, symbol)),
+        )
+
+        mock_downloader.fetch_price_rows.assert_called_once()
+        assert result["successful"] == 1
+        assert result["failed"] == 1
+        assert result["results"][1]["error"] == "Network error"
+        assert progress == [(1, "AAPL"), (2, "MSFT")]
 
     def test_schedule_daily_updates(self, db):
         """Test scheduling daily updates (placeholder)."""
@@ -264,6 +349,26 @@ class TestPriceAnalytics:
         assert returns["percentage_return"] == pytest.approx(12.0, rel=0.1)
         assert returns["days"] == 9
 
+    def test_calculate_returns_closest_prices(self, db):
+        """Test calculating returns from the prices bracketing a sparse range."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=100.0).save(db)
+        Price(symbol="AAPL", date=date(2024, 1, 20), close=110.0).save(db)
+
+        returns = calculate_returns("AAPL", date(2024, 1, 5), date(2024, 1, 15), db)
+
+        assert returns["start_price"] == 100.0
+        assert returns["end_price"] == 110.0
+
+    def test_calculate_returns_inside_range(self, db):
+        """Test that prices inside the range win over the bracketing ones."""
+        for day, close in [(1, 100.0), (6, 102.0), (14, 108.0), (20, 110.0)]:
+            Price(symbol="AAPL", date=date(2024, 1, day), close=close).save(db)
+
+        returns = calculate_returns("AAPL", date(2024, 1, 5), date(2024, 1, 15), db)
+
+        assert returns["start_price"] == 102.0
+        assert returns["end_price"] == 108.0
+
     def test_calculate_returns_invalid_dates(self, db):
         """Test calculating returns with invalid date range."""
         start = date(2024, 1, 10)
@@ -296,6 +401,21 @@ class TestPriceAnalytics:
         assert stats["count"] == 10
         assert "std_dev" in stats
 
+    def test_get_price_statistics_values(self, db, sample_prices):
+        """Test that statistics match the standard library definitions."""
+        closes = [p.close for p in sample_prices]
+
+        stats = get_price_statistics("AAPL", sample_prices[0].date, sample_prices[-1].date, db)
+
+        assert stats["mean"] == pytest.approx(statistics.mean(closes))
+        assert stats["median"] == pytest.approx(statistics.median(closes))
+        assert stats["std_dev"] == pytest.approx(statistics.stdev(closes))
+        assert isinstance(stats["count"], int)
+
+        single = get_price_statistics("AAPL", sample_prices[0].date, sample_prices[0].date, db)
+        assert single["count"] == 1
+        assert single["std_dev"] == 0.0
+
     def test_get_price_statistics_invalid_dates(self, db):
         """Test getting statistics with invalid date range."""
         start = date(2024, 1, 10)
@@ -357,6 +477,38 @@ class TestPriceAnalytics:
         assert price_range["price_range"] == 18.0
         assert price_range["count"] == 10
 
+    def test_get_price_range_unordered_prices(self, db):
+        """Test price range when the high and low fall mid-range."""
+        closes = [100.0, 120.0, 90.0, 110.0]
+        for day, close in enumerate(closes, start=1):
+            Price(symbol="MSFT", date=date(2024, 1, day), close=close).save(db)
+
+        price_range = get_price_range("MSFT", date(2024, 1, 1), date(2024, 1, 4), db)
+
+        assert price_range["first_price"] == 100.0
+        assert price_range["last_price"] == 110.0
+        assert price_range["high"] == 120.0
+        assert price_range["low"] == 90.0
+        assert price_range["price_range"] == 30.0
+        assert type(price_range["high"]) is float
+
+    def test_range_closes_memoized_until_write(self, db, sample_prices):
+        """Test that analytics over one range read the closes once per database state."""
+        start = sample_prices[0].date
+        end = sample_prices[-1].date
+
+        with patch(
+            "finarius_app.core.prices.analytics.get_closes", wraps=analytics.get_closes
+        ) as mock_get_closes:
+            get_price_statistics("AAPL", start, end, db)
+            get_price_range("AAPL", start, end, db)
+            calculate_daily_returns("AAPL", start, end, db)
+            assert mock_get_closes.call_count == 1
+
+            Price(symbol="AAPL", date=end, close=200.0).save(db)
+            assert get_price_range("AAPL", start, end, db)["last_price"] == 200.0
+            assert mock_get_closes.call_count == 2
+
     def test_get_price_range_invalid_dates(self, db):
         """Test getting price range with invalid date range."""
         start = date(2024, 1, 10)
@@ -12,16 +12,30 @@ from finarius_app.core.prices import (
     PriceDownloader,
     validate_symbol,
     symbol_exists,
+    is_crypto_symbol,
+    get_exchange_name,
     is_price_cached,
     get_cached_price,
     update_price_cache,
     normalize_price_data,
+    normalize_price_frame,
+    normalize_yf_row,
     PriceDownloadError,
     SymbolNotFoundError,
     ValidationError,
     InsufficientDataError,
 )
 from finarius_app.core.models.price import Price
+from finarius_app.core.prices.cache import (
+    ConnectionLRUCache,
+    bulk_write_window,
+    get_cached_symbols,
+    invalidate_price_cache,
+)
+from finarius_app.core.prices.normalization import (
+    handle_dividend_adjustment,
+    handle_stock_split,
+)
 
 
 @pytest.fixture
@@ -59,6 +73,15 @@ def downloader(db):
 class TestSymbolValidation:
     """Test symbol validation functions."""
 
+    @pytest.fixture(autouse=True)
+    def clear_symbol_info_cache(self):
+        """Start each test without cached Ticker.info responses."""
+        from finarius_app.core.prices.validation import _symbol_info_cache
+
+        _symbol_info_cache.clear()
+        yield
+        _symbol_info_cache.clear()
+
     def test_validate_symbol_valid(self):
         """Test validating valid symbols."""
         assert validate_symbol("AAPL") is True
@@ -91,6 +114,23 @@ class TestSymbolValidation:
         with pytest.raises(ValidationError):
             validate_symbol(123)
 
+    def test_validate_symbol_cached(self):
+        """Test that valid symbols are cached and unhashable input still fails cleanly."""
+        from finarius_app.core.prices.validation import _validate_symbol_format
+
+        _validate_symbol_format.cache_clear()
+        assert validate_symbol("AAPL") is True
+        assert validate_symbol("AAPL") is True
+        assert _validate_symbol_format.cache_info().hits == 1
+
+        # Invalid symbols raise every time rather than being cached
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="invalid characters"):
+                validate_symbol("AA PL")
+
+        with pytest.raises(ValidationError):
+            validate_symbol(["AAPL"])
+
     @patch("finarius_app.core.prices.validation.yf.Ticker")
     def test_symbol_exists_valid(self, mock_ticker):
         """Test checking if valid symbol exists."""
@@ -114,6 +154,37 @@ class TestSymbolValidation:
 
         assert symbol_exists("AAPL") is False
 
+    @patch("finarius_app.core.prices.validation.yf.Ticker")
+    def test_symbol_info_cached(self, mock_ticker):
+        """Test that checking a symbol then fetching its info makes one request."""
+        from finarius_app.core.prices.validation import get_symbol_info
+
+        mock_ticker.return_value.info = {"symbol": "AAPL", "shortName": "Apple Inc."}
+
+        assert symbol_exists("AAPL") is True
+        assert get_symbol_info("aapl")["short_name"] == "Apple Inc."
+        mock_ticker.assert_called_once_with("AAPL")
+
+        with patch("finarius_app.core.prices.validation.SYMBOL_INFO_TTL", 0.0):
+            symbol_exists("AAPL")
+        assert mock_ticker.call_count == 2
+
+    def test_is_crypto_symbol(self):
+        """Test crypto pair detection."""
+        assert is_crypto_symbol("BTC-USD") is True
+        assert is_crypto_symbol("eth-eur") is True
+        assert is_crypto_symbol("AAPL") is False
+        assert is_crypto_symbol("BTC-JPY") is False
+
+    def test_get_exchange_name(self):
+        """Test exchange detection from symbol suffixes."""
+        assert get_exchange_name("MC.PA") == "Paris Stock Exchange"
+        assert get_exchange_name("SHOP.TO") == "Toronto Stock Exchange"
+        assert get_exchange_name("7203.T") == "Tokyo Stock Exchange"
+        assert get_exchange_name("AAPL") is None
+        assert get_exchange_name("BRK.B") is None
+        assert get_exchange_name(".PA") is None
+
 
 class TestPriceCaching:
     """Test price caching functions."""
@@ -140,6 +211,31 @@ class TestPriceCaching:
             is False
         )
 
+    def test_is_price_cached_max_age(self, db):
+        """Test cache expiry against the stored UTC created_at timestamp."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+        assert is_price_cached("AAPL", date(2024, 1, 1), db, max_age=timedelta(hours=1)) is True
+
+        db.execute(
+            "UPDATE prices SET created_at = datetime('now', '-2 hours') WHERE symbol = 'AAPL'"
+        )
+        assert is_price_cached("AAPL", date(2024, 1, 1), db, max_age=timedelta(hours=1)) is False
+        assert is_price_cached("AAPL", date(2024, 1, 1), db, max_age=timedelta(hours=3)) is True
+        assert is_price_cached("AAPL", date(2024, 1, 1), db) is True
+
+    def test_get_cached_price_memoized_until_write(self, db):
+        """Test that cached prices are memoized and dropped after any write."""
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=150.0).save(db)
+
+        first = get_cached_price("AAPL", date(2024, 1, 1), db)
+        assert get_cached_price("aapl", date(2024, 1, 1), db) is first
+
+        Price(symbol="AAPL", date=date(2024, 1, 1), close=155.0).save(db)
+        assert get_cached_price("AAPL", date(2024, 1, 1), db).close == 155.0
+
+        invalidate_price_cache("AAPL", db=db)
+        assert get_cached_price("AAPL", date(2024, 1, 1), db) is None
+
     def test_get_cached_price_not_found(self, db):
         """Test getting non-cached price."""
         assert get_cached_price("AAPL", date(2024, 1, 1), db) is None
@@ -175,6 +271,57 @@ class TestPriceCaching:
         assert cached is not None
         assert cached.close == 150.0
 
+    def test_bulk_write_window(self, db):
+        """Test that the bulk write window relaxes and restores pragmas."""
+        conn = db.get_connection()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        with bulk_write_window(db):
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "off"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+            update_price_cache("AAPL", date(2024, 1, 1), {"close": 150.0}, db)
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == journal_mode
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert get_cached_price("AAPL", date(2024, 1, 1), db) is not None
+
+    def test_get_cached_symbols(self, db):
+        """Test finding the symbols that already have prices in a range."""
+        Price(symbol="AAPL", date=date(2024, 1, 10), close=150.0).save(db)
+        Price(symbol="MSFT", date=date(2023, 12, 1), close=370.0).save(db)
+
+        cached = get_cached_symbols(
+            ["aapl", "MSFT", "GOOG"], date(2024, 1, 1), date(2024, 1, 31), db
+        )
+        assert cached == {"AAPL"}
+        assert get_cached_symbols([], date(2024, 1, 1), date(2024, 1, 31), db) == set()
+
+    def test_connection_lru_cache_threads(self):
+        """Test concurrent reads, writes and invalidations keep the cache consistent."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = ConnectionLRUCache(8)
+        mock_db = MagicMock()
+        conn = mock_db.get_connection.return_value
+        conn.total_changes = 0
+
+        def worker(offset):
+            for i in range(2000):
+                key = (offset + i) % 16
+                cache.put(mock_db, key, (key,))
+                cached = cache.get(mock_db, key)
+                assert cached is None or cached == (key,)
+                if i % 100 == 0:
+                    conn.total_changes += 1  # Simulated write drops every entry
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+        assert len(cache._entries) <= 8
+
 
 class TestPriceNormalization:
     """Test price data normalization."""
@@ -213,6 +360,82 @@ class TestPriceNormalization:
         assert normalized is not None
         assert normalized["close"] == 150.0
 
+    def test_normalize_price_data_swaps_high_low(self):
+        """Test that reversed high/low are swapped and non-positive closes are skipped."""
+        raw_data = {"Close": 150, "High": 148.0, "Low": 151.0}
+        normalized = normalize_price_data(raw_data, "AAPL", date(2024, 1, 1))
+        assert normalized == {
+            "close": 150.0,
+            "open": None,
+            "high": 151.0,
+            "low": 148.0,
+            "volume": None,
+        }
+
+        assert normalize_price_data({"Close": -1}, "AAPL", date(2024, 1, 1)) is None
+
+    def test_handle_split_and_dividend_adjustment(self):
+        """Test that only prices before the event date are adjusted."""
+        prices = {
+            date(2024, 1, 1): {"close": 200.0, "open": None, "volume": 100},
+            date(2024, 1, 2): {"close": 100.0, "open": 99.0, "volume": 200},
+        }
+
+        split = handle_stock_split(prices, 2.0, date(2024, 1, 2))
+        assert split[date(2024, 1, 1)] == {"close": 100.0, "open": None, "volume": 100}
+        assert split[date(2024, 1, 2)] is prices[date(2024, 1, 2)]
+        assert prices[date(2024, 1, 1)]["close"] == 200.0
+
+        dividend = handle_dividend_adjustment(prices, 1.5, date(2024, 1, 2))
+        assert dividend[date(2024, 1, 1)]["close"] == 198.5
+        assert dividend[date(2024, 1, 2)]["close"] == 100.0
+
+    def test_normalize_yf_row(self):
+        """Test normalizing a single yfinance history row."""
+        row = {"Close": 150.0, "Open": 0.0, "High": 148.0, "Low": 151.0, "Volume": float("nan")}
+        normalized = normalize_yf_row(row, "AAPL", date(2024, 1, 1))
+        assert normalized == {
+            "close": 150.0,
+            "open": None,
+            "high": 151.0,
+            "low": 148.0,
+            "volume": None,
+        }
+
+        assert normalize_yf_row({"Close": 152.0}, "AAPL", date(2024, 1, 1))["open"] is None
+        assert normalize_yf_row({"Close": float("nan")}, "AAPL", date(2024, 1, 1)) is None
+        assert normalize_yf_row({"Close": 0.0}, "AAPL", date(2024, 1, 1)) is None
+
+    def test_normalize_price_frame(self):
+        """Test vectorized normalization of a history DataFrame."""
+        dates = pd.date_range(start="2024-01-01", periods=4, freq="D")
+        hist = pd.DataFrame(
+            {
+                "Close": [150.0, float("nan"), 0.0, 153.0],
+                "Open": [149.0, 150.0, 151.0, 0.0],
+                "High": [148.0, 152.0, 153.0, 154.0],
+                "Low": [151.0, 149.0, 150.0, 152.0],
+                "Volume": [1000000, 1000000, 1000000, 1000000],
+                "Dividends": [0.0] * 4,
+            },
+            index=dates,
+        )
+
+        frame = normalize_price_frame(hist, "AAPL")
+
+        # Rows without a positive close are dropped
+        assert list(frame.columns) == ["close", "open", "high", "low", "volume"]
+        assert list(frame.index) == [dates[0], dates[3]]
+        # Swapped high/low is corrected and a zero open is treated as missing
+        assert frame.iloc[0]["high"] == 151.0
+        assert frame.iloc[0]["low"] == 148.0
+        assert pd.isna(frame.iloc[1]["open"])
+
+        filled = normalize_price_frame(hist, "AAPL", handle_missing="fill_zero")
+        assert filled["close"].tolist() == [150.0, 0.0, 0.0, 153.0]
+        with pytest.raises(InsufficientDataError):
+            normalize_price_frame(hist, "AAPL", handle_missing="raise")
+
     def test_normalize_price_data_missing_close(self):
         """Test normalizing price data with missing close."""
         raw_data = {"Open": 149.0}
@@ -279,6 +502,22 @@ class TestPriceDownloader:
         assert price.symbol == "AAPL"
         assert price.close == 150.0
 
+    @patch("finarius_app.core.prices.downloader.yf.Ticker")
+    def test_download_price_closest_before(self, mock_ticker, downloader):
+        """Test that a non-trading day uses the last close on or before it."""
+        dates = pd.date_range(start="2024-01-03", end="2024-01-05", freq="D", tz="America/New_York")
+        mock_ticker.return_value.history.return_value = pd.DataFrame(
+            {"Close": [150.0, 151.0, 152.0]}, index=dates
+        )
+
+        price = downloader.download_price("AAPL", date(2024, 1, 6), use_cache=False)
+        assert price.close == 152.0
+
+        price = downloader.download_price("AAPL", date(2024, 1, 4), use_cache=False)
+        assert price.close == 151.0
+
+        assert downloader.download_price("AAPL", date(2024, 1, 2), use_cache=False) is None
+
     @patch("finarius_app.core.prices.downloader.yf.Ticker")
     def test_download_price_from_cache(self, mock_ticker, downloader):
         """Test downloading price from cache."""
@@ -329,6 +568,29 @@ class TestPriceDownloader:
         assert prices[0].close == 150.0
         assert prices[-1].close == 154.0
 
+    @patch("finarius_app.core.prices.downloader.yf.Ticker")
+    def test_download_prices_to_cache(self, mock_ticker, downloader):
+        """Test streaming a downloaded price range into the cache."""
+        dates = pd.date_range(start="2024-01-01", end="2024-01-05", freq="D")
+        mock_hist = pd.DataFrame(
+            {
+                "Close": [150.0, 151.0, 152.0, 153.0, 154.0],
+                "Open": [149.0, 150.0, -1.0, 152.0, 153.0],
+                "Volume": [1000000] * 5,
+            },
+            index=dates,
+        )
+        mock_ticker.return_value.history.return_value = mock_hist
+
+        count = downloader.download_prices_to_cache("aapl", date(2024, 1, 1), date(2024, 1, 5))
+
+        # The row with a negative open price is skipped
+        assert count == 4
+        cached = downloader.db.fetchall(
+            "SELECT close FROM prices WHERE symbol = 'AAPL' ORDER BY date"
+        )
+        assert [row["close"] for row in cached] == [150.0, 151.0, 153.0, 154.0]
+
     @patch("finarius_app.core.prices.downloader.yf.Ticker")
     def test_download_latest_price(self, mock_ticker, downloader):
         """Test downloading latest price."""
@@ -351,9 +613,13 @@ class TestPriceDownloader:
         assert price.symbol == "AAPL"
         assert price.close == 154.0  # Latest price
 
+    @patch("finarius_app.core.prices.downloader.yf.download")
     @patch("finarius_app.core.prices.downloader.yf.Ticker")
-    def test_download_multiple_symbols(self, mock_ticker, downloader):
+    def test_download_multiple_symbols(self, mock_ticker, mock_download, downloader):
         """Test downloading prices for multiple symbols."""
+        # Empty batch response falls back to per-symbol downloads
+        mock_download.return_value = pd.DataFrame()
+
         # Mock responses for different symbols
         def mock_history(start=None, end=None, period=None):
             if period == "5d":
@@ -381,6 +647,60 @@ class TestPriceDownloader:
         assert "MSFT" in results
         assert len(results["AAPL"]) > 0
         assert len(results["MSFT"]) > 0
+        # Per-symbol fallback downloads are cached from the calling thread
+        cached = downloader.db.fetchone("SELECT COUNT(DISTINCT symbol) AS n FROM prices")
+        assert cached["n"] == 2
+
+    @patch("finarius_app.core.prices.downloader.yf.download")
+    @patch("finarius_app.core.prices.downloader.yf.Ticker")
+    def test_download_multiple_symbols_batch(self, mock_ticker, mock_download, downloader):
+        """Test that multiple symbols are fetched in one batched request."""
+        dates = pd.date_range(start="2024-01-01", end="2024-01-03", freq="D")
+        mock_download.return_value = pd.concat(
+            {
+                "AAPL": pd.DataFrame({"Close": [150.0, 151.0, 152.0]}, index=dates),
+                # MSFT did not trade on the first day
+                "MSFT": pd.DataFrame({"Close": [float("nan"), 371.0, 372.0]}, index=dates),
+            },
+            axis=1,
+        )
+
+        results = downloader.download_multiple_symbols(
+            ["AAPL", "msft"], date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        mock_download.assert_called_once()
+        mock_ticker.assert_not_called()
+        assert [p.close for p in results["AAPL"]] == [150.0, 151.0, 152.0]
+        assert [p.close for p in results["msft"]] == [371.0, 372.0]
+        cached = downloader.db.fetchone("SELECT COUNT(*) AS n FROM prices")
+        assert cached["n"] == 5
+
+    @patch("finarius_app.core.prices.downloader.BATCH_SIZE", 2)
+    @patch("finarius_app.core.prices.downloader.yf.download")
+    def test_fetch_batch_price_rows_chunks(self, mock_download, downloader):
+        """Test that symbols are requested in chunks of BATCH_SIZE."""
+        dates = pd.date_range(start="2024-01-01", end="2024-01-02", freq="D")
+
+        def batch(tickers, **kwargs):
+            return pd.concat(
+                {t: pd.DataFrame({"Close": [100.0, 101.0]}, index=dates) for t in tickers},
+                axis=1,
+            )
+
+        mock_download.side_effect = batch
+
+        rows = downloader.fetch_batch_price_rows(
+            ["AAPL", "MSFT", "GOOG"], date(2024, 1, 1), date(2024, 1, 2)
+        )
+
+        assert [c.kwargs["tickers"] for c in mock_download.call_args_list] == [
+            ["AAPL", "MSFT"],
+            ["GOOG"],
+        ]
+        assert sorted(rows) == ["AAPL", "GOOG", "MSFT"]
+        assert rows["GOOG"][1] == ("GOOG", "2024-01-02", 101.0, None, None, None, None)
+        assert downloader.db.fetchone("SELECT COUNT(*) AS n FROM prices")["n"] == 0
 
     def test_download_price_invalid_symbol(self, downloader):
         """Test downloading price with invalid symbol."""
@@ -444,3 +764,18 @@ class TestPriceDownloader:
         # Should have waited at least the rate limit delay
         assert elapsed >= 0.2
 
+    def test_rate_limiting_across_threads(self, db):
+        """Test that concurrent callers are spaced out by the rate limit."""
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+
+        downloader = PriceDownloader(db=db, rate_limit_delay=0.1)
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: downloader._rate_limit(), range(4)))
+        elapsed = time.time() - start
+
+        # The first call is immediate, the next three wait one slot each
+        assert elapsed >= 0.3
+
@@ -36,7 +36,7 @@ class TestAccountsUI:
         mock_st.error.assert_called_once_with("Database not initialized")
         mock_st.title.assert_called_once_with("🏦 Accounts")
 
-    @patch("finarius_app.ui.accounts.page.get_all_accounts")
+    @patch("finarius_app.ui.accounts.page.get_cached_accounts")
     @patch("finarius_app.ui.accounts.page.get_db")
     @patch("finarius_app.ui.accounts.page.st")
     def test_render_accounts_page_empty(self, mock_st, mock_get_db, mock_get_all_accounts):
@@ -57,8 +57,8 @@ class TestAccountsUI:
         # get_all_accounts is called multiple times (in render and form validation)
         assert mock_get_all_accounts.called
 
-    @patch("finarius_app.ui.accounts.page.get_all_accounts")
-    @patch("finarius_app.ui.accounts.statistics.calculate_portfolio_value")
+    @patch("finarius_app.ui.accounts.page.get_cached_accounts")
+    @patch("finarius_app.ui.accounts.cache.calculate_portfolio_value")
     @patch("finarius_app.ui.accounts.page.get_db")
     @patch("finarius_app.ui.accounts.page.st")
     def test_render_accounts_page_with_accounts(self, mock_st, mock_get_db, mock_calc_value, mock_get_all_accounts):
@@ -80,7 +80,7 @@ class TestAccountsUI:
         mock_st.expander = MagicMock(return_value=MagicMock())
         mock_st.subheader = MagicMock()
         mock_st.dataframe = MagicMock()
-        mock_st.selectbox = MagicMock(return_value="Test Account 1 (ID: 1)")
+        mock_st.selectbox = MagicMock(return_value=1)
         # Fix columns return for edit/delete section
         mock_st.columns.side_effect = [
             [MagicMock(), MagicMock(), MagicMock(), MagicMock()],  # For statistics
@@ -93,9 +93,11 @@ class TestAccountsUI:
 
         assert mock_get_all_accounts.called
         assert mock_st.title.called
+        # Each account is valued once for the statistics, chart and table
+        assert mock_calc_value.call_count == 2
 
     @patch("finarius_app.ui.accounts.forms.st")
-    @patch("finarius_app.ui.accounts.page.get_all_accounts")
+    @patch("finarius_app.ui.accounts.page.get_cached_accounts")
     @patch("finarius_app.ui.accounts.page.get_db")
     @patch("finarius_app.ui.accounts.page.st")
     @patch("finarius_app.ui.accounts.forms.set_error_message")
@@ -134,10 +136,10 @@ class TestAccountsUI:
         # This test verifies the form rendering structure
         assert mock_st_forms.expander.called
 
-    @patch("finarius_app.ui.accounts.page.get_all_accounts")
+    @patch("finarius_app.ui.accounts.page.get_cached_accounts")
     @patch("finarius_app.ui.accounts.table.get_account_by_id")
-    @patch("finarius_app.core.models.get_transactions_by_account")
-    @patch("finarius_app.ui.accounts.statistics.calculate_portfolio_value")
+    @patch("finarius_app.ui.accounts.forms.get_transaction_count")
+    @patch("finarius_app.ui.accounts.cache.calculate_portfolio_value")
     @patch("finarius_app.ui.accounts.page.get_db")
     @patch("finarius_app.ui.accounts.page.st")
     @patch("finarius_app.ui.accounts.forms.set_success_message")
@@ -152,7 +154,7 @@ class TestAccountsUI:
         account = Account(name="Test Account", currency="USD", account_id=1)
         mock_get_all_accounts.return_value = [account]
         mock_get_account_by_id.return_value = account
-        mock_get_transactions.return_value = []
+        mock_get_transactions.return_value = 0
         mock_calc_value.return_value = 0.0
         
         mock_st.title = MagicMock()
@@ -165,7 +167,7 @@ class TestAccountsUI:
         mock_st.expander = MagicMock(return_value=MagicMock())
         mock_st.subheader = MagicMock()
         mock_st.dataframe = MagicMock()
-        mock_st.selectbox = MagicMock(return_value="Test Account (ID: 1)")
+        mock_st.selectbox = MagicMock(return_value=1)
         mock_st.warning = MagicMock()
         mock_st.error = MagicMock()
         mock_st.text_input = MagicMock(return_value="Test Account")
@@ -183,3 +185,100 @@ class TestAccountsUI:
         # Verify account was processed
         assert mock_get_all_accounts.called
 
+    @patch("finarius_app.ui.accounts.cache.calculate_portfolio_value")
+    def test_get_account_value_cached_until_db_changes(self, mock_calc_value):
+        """Test that account values are reused until the database is written to."""
+        from finarius_app.ui.accounts.cache import get_account_value
+
+        mock_db = MagicMock()
+        mock_db.get_connection.return_value.total_changes = 0
+        mock_calc_value.return_value = 1000.0
+
+        assert get_account_value(1, date(2024, 1, 1), mock_db) == 1000.0
+        assert get_account_value(1, date(2024, 1, 1), mock_db) == 1000.0
+        assert mock_calc_value.call_count == 1
+
+        mock_db.get_connection.return_value.total_changes = 1
+        get_account_value(1, date(2024, 1, 1), mock_db)
+        assert mock_calc_value.call_count == 2
+
+    @patch("finarius_app.ui.accounts.table.st")
+    def test_render_accounts_table_columns(self, mock_st):
+        """Test formatting of the accounts table columns."""
+        from finarius_app.ui.accounts.table import render_accounts_table
+
+        accounts = [
+            Account(name="A", currency="USD", account_id=1, created_at="2024-01-02 03:04:05"),
+            Account(name="B", currency="EUR", account_id=2),
+        ]
+        mock_st.selectbox.return_value = None
+
+        render_accounts_table(accounts, {1: 1234.5}, MagicMock())
+
+        df = mock_st.dataframe.call_args[0][0]
+        assert df["Portfolio Value"].tolist() == ["$1,234.50", "$0.00"]
+        assert df["Created"].tolist() == ["2024-01-02", "N/A"]
+
+        # The selector offers account IDs, labelled with the account name
+        selectbox_kwargs = mock_st.selectbox.call_args[1]
+        assert selectbox_kwargs["options"] == [1, 2]
+        assert selectbox_kwargs["format_func"](2) == "B (ID: 2)"
+
+    @patch("finarius_app.ui.accounts.statistics.render_account_breakdown_chart")
+    @patch("finarius_app.ui.accounts.statistics.st")
+    def test_render_account_statistics_empty(self, mock_st, mock_chart):
+        """Test that statistics for no accounts render zero cards and no chart."""
+        from finarius_app.ui.accounts.statistics import render_account_statistics
+
+        mock_st.columns.return_value = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
+
+        render_account_statistics([], {})
+
+        mock_st.metric.assert_any_call("Total Accounts", 0)
+        mock_st.metric.assert_any_call("Status", "⚠️ No accounts")
+        mock_chart.assert_not_called()
+        mock_st.markdown.assert_not_called()
+
+    @patch("finarius_app.ui.accounts.forms.get_cached_accounts")
+    @patch("finarius_app.ui.accounts.forms.st")
+    def test_edit_account_form_duplicate_name(self, mock_st, mock_get_cached_accounts):
+        """Test that a duplicate name is reported in place without a page rerun."""
+        from finarius_app.ui.accounts.forms import render_edit_account_form
+
+        account = MagicMock(id=1, currency="USD")
+        account.name = "Mine"
+        mock_get_cached_accounts.return_value = [
+            account, Account(name="Other", currency="USD", account_id=2)
+        ]
+        mock_st.text_input.return_value = "other"
+        mock_st.selectbox.return_value = "USD"
+        mock_st.form_submit_button.return_value = True
+
+        # Fragments only run inside a script run; call the undecorated function
+        render_form = getattr(render_edit_account_form, "__wrapped__", render_edit_account_form)
+        render_form(account, MagicMock())
+
+        mock_st.error.assert_called_once_with("Account name 'other' already exists")
+        mock_st.rerun.assert_not_called()
+        account.save.assert_not_called()
+
+    @patch("finarius_app.ui.accounts.statistics.get_plotly_express")
+    @patch("finarius_app.ui.accounts.statistics.st")
+    def test_render_account_breakdown_chart_groups_tail(self, mock_st, mock_get_px):
+        """Test that accounts beyond the slice limit are grouped as "Other"."""
+        from finarius_app.ui.accounts.constants import MAX_PIE_SLICES
+        from finarius_app.ui.accounts.statistics import render_account_breakdown_chart
+
+        accounts = [
+            Account(name=f"A{i}", currency="USD", account_id=i) for i in range(1, 13)
+        ]
+        account_values = {i: float(i) for i in range(1, 13)}
+
+        render_account_breakdown_chart(accounts, account_values)
+
+        df = mock_get_px.return_value.pie.call_args[0][0]
+        assert len(df) == MAX_PIE_SLICES
+        assert df["Account"].iloc[0] == "A12"
+        assert df["Account"].iloc[-1] == "Other"
+        assert df["Value"].sum() == sum(account_values.values())
+        assert mock_st.plotly_chart.call_args[1]["config"]["displayModeBar"] is False
@@ -1,7 +1,7 @@
 """Tests for UI analytics module."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 from datetime import date, timedelta
 
 from finarius_app.core.models import Account
@@ -24,7 +24,7 @@ class TestAnalyticsUI:
         mock_st.error.assert_called_once_with("Database not initialized")
         mock_st.title.assert_called_once_with("📈 Analytics")
 
-    @patch("finarius_app.ui.analytics.page.get_all_accounts")
+    @patch("finarius_app.ui.analytics.page.get_cached_accounts")
     @patch("finarius_app.ui.analytics.page.get_db")
     @patch("finarius_app.ui.analytics.page.st")
     def test_render_analytics_page_no_accounts(self, mock_st, mock_get_db, mock_get_all_accounts):
@@ -48,7 +48,7 @@ class TestAnalyticsUI:
     @patch("finarius_app.ui.analytics.page.render_gains_analysis")
     @patch("finarius_app.ui.analytics.page.render_performance_analytics")
     @patch("finarius_app.ui.analytics.page.render_filters")
-    @patch("finarius_app.ui.analytics.page.get_all_accounts")
+    @patch("finarius_app.ui.analytics.page.get_cached_accounts")
     @patch("finarius_app.ui.analytics.page.get_db")
     @patch("finarius_app.ui.analytics.page.st")
     def test_render_analytics_page_with_accounts(
@@ -88,3 +88,269 @@ class TestAnalyticsUI:
         mock_render_dividends.assert_called_once()
         mock_render_positions.assert_called_once()
 
+    @patch("finarius_app.ui.analytics.dividends.calculate_dividend_yield")
+    @patch("finarius_app.ui.analytics.dividends.get_dividend_by_symbol")
+    @patch("finarius_app.ui.analytics.dividends.calculate_dividend_income")
+    @patch("finarius_app.ui.analytics.dividends.get_dividend_history")
+    @patch("finarius_app.ui.analytics.dividends.st")
+    def test_render_dividend_analytics_aggregation(
+        self, mock_st, mock_history, mock_income, mock_by_symbol, mock_yield
+    ):
+        """Test dividends are summed per date and sorted by symbol income."""
+        from finarius_app.ui.analytics.dividends import render_dividend_analytics
+
+        mock_history.return_value = [
+            {"date": date(2024, 2, 1), "amount": 5.0, "symbol": "A"},
+            {"date": date(2024, 1, 1), "amount": 2.0, "symbol": "B"},
+            {"date": date(2024, 2, 1), "amount": 1.0, "symbol": "B"},
+        ]
+        mock_income.return_value = 8.0
+        mock_by_symbol.return_value = {"A": 5.0, "B": 3.0}
+        mock_yield.return_value = 0.02
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+
+        with patch(
+            "finarius_app.ui.analytics.dividends.get_plotly_express", return_value=None
+        ):
+            render_dividend_analytics(1, date(2024, 1, 1), date(2024, 12, 31), MagicMock())
+
+        mock_st.caption.assert_not_called()
+        by_date = mock_st.bar_chart.call_args[0][0]
+        assert by_date["Dividend Income"].tolist() == [2.0, 6.0]
+        by_symbol = mock_st.dataframe.call_args[0][0]
+        assert by_symbol["Symbol"].tolist() == ["A", "B"]
+        assert by_symbol["Dividend Income"].tolist() == ["$5.00", "$3.00"]
+
+    def test_get_cached_metric(self):
+        """Test metric results (including None) are reused until the database changes."""
+        from finarius_app.ui.analytics.cache import get_cached_metric
+
+        mock_db = MagicMock()
+        mock_db.get_connection.return_value.total_changes = 0
+        downloader = MagicMock()
+        metric = MagicMock(return_value=None)
+        period = (1, date(2024, 1, 1), date(2024, 12, 31))
+
+        assert get_cached_metric(metric, mock_db, downloader, *period) is None
+        assert get_cached_metric(metric, mock_db, downloader, *period) is None
+        metric.assert_called_once_with(*period, mock_db, downloader)
+
+        # A different period is a separate entry
+        get_cached_metric(metric, mock_db, downloader, 1, date(2024, 6, 1), date(2024, 12, 31))
+        assert metric.call_count == 2
+
+        mock_db.get_connection.return_value.total_changes = 1
+        get_cached_metric(metric, mock_db, downloader, *period)
+        assert metric.call_count == 3
+
+    def test_history_frames(self):
+        """Test histories are outer-joined on date, scaled and sampled."""
+        import math
+        from finarius_app.ui.analytics.history import gains_history_frame, returns_history_frame
+
+        d1, d2, d3 = date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)
+        df = returns_history_frame({d2: 0.1, d1: 0.05}, {d1: None, d2: 0.2}, {d3: 0.01})
+        assert df["Date"].tolist() == [d1, d2, d3]
+        assert df["CAGR"].tolist()[:2] == pytest.approx([5.0, 10.0])
+        assert math.isnan(df["IRR"].iloc[0])
+        assert df["TWRR"].iloc[2] == pytest.approx(1.0)
+
+        df = gains_history_frame({d1: 1.0, d3: 3.0}, {d2: 2.0, d3: 1.0}, sample_every=2)
+        assert df["Date"].tolist() == [d1, d3]
+        assert df["Total P&L"].tolist() == [1.0, 4.0]
+
+    @patch("finarius_app.ui.analytics.positions.get_portfolio_breakdown")
+    @patch("finarius_app.ui.analytics.positions.get_price_downloader")
+    @patch("finarius_app.ui.analytics.positions.st")
+    def test_render_position_analytics_sorting(self, mock_st, mock_downloader, mock_breakdown):
+        """Test positions are sorted by numeric value and weighted without string parsing."""
+        from finarius_app.ui.analytics.positions import render_position_analytics
+
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+        mock_breakdown.return_value = {
+            "AAA": {"qty": 1.0, "cost_basis": 0.0, "current_value": 900.0, "unrealized_gain": 0.0},
+            "BBB": {"qty": 2.0, "cost_basis": 0.0, "current_value": 1100.0, "unrealized_gain": 0.0},
+        }
+
+        render_position_analytics(1, date(2024, 1, 31), MagicMock())
+
+        mock_st.caption.assert_not_called()
+        df = mock_st.dataframe.call_args[0][0]
+        assert df["Symbol"].tolist() == ["BBB", "AAA"]
+        assert df["Current Value"].tolist() == ["$1,100.00", "$900.00"]
+        assert df["Weight %"].tolist() == ["55.00%", "45.00%"]
+        mock_st.metric.assert_any_call(
+            "Top 5 Positions Concentration", "100.00%",
+            help="Percentage of portfolio in top 5 positions",
+        )
+
+    @patch("finarius_app.ui.analytics.filters.get_cached_accounts")
+    @patch("finarius_app.ui.analytics.filters.st")
+    def test_render_filters_date_presets(self, mock_st, mock_get_all_accounts):
+        """Test date presets map to their ranges without showing the custom date input."""
+        from finarius_app.ui.analytics.filters import render_filters
+
+        mock_get_all_accounts.return_value = [Account(name="Only", account_id=1)]
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+        mock_st.session_state = {}
+        today = date.today()
+
+        mock_st.selectbox.return_value = "YTD"
+        assert render_filters(MagicMock()) == (1, date(today.year, 1, 1), today)
+
+        mock_st.selectbox.return_value = "Last 30 Days"
+        assert render_filters(MagicMock()) == (1, today - timedelta(days=30), today)
+        mock_st.date_input.assert_not_called()
+
+        options = mock_st.selectbox.call_args[1]["options"]
+        assert options == [
+            "Custom", "YTD", "Last 7 Days", "Last 30 Days", "Last 90 Days", "Last Year"
+        ]
+
+        mock_st.selectbox.return_value = "Custom"
+        mock_st.date_input.return_value = (date(2024, 1, 1), date(2024, 3, 1))
+        assert render_filters(MagicMock()) == (1, date(2024, 1, 1), date(2024, 3, 1))
+
+    @patch("finarius_app.ui.analytics.filters.get_cached_accounts")
+    @patch("finarius_app.ui.analytics.filters.st")
+    def test_render_filters_account_selector(self, mock_st, mock_get_all_accounts):
+        """Test the account selector returns account IDs and labels them via format_func."""
+        from finarius_app.ui.analytics.filters import render_filters
+
+        mock_get_all_accounts.return_value = [
+            Account(name="Broker (1)", account_id=1),
+            Account(name="Savings", account_id=2),
+        ]
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+        mock_st.session_state = {}
+        mock_st.selectbox.side_effect = [1, "YTD"]
+
+        account_id, _, _ = render_filters(MagicMock())
+
+        assert account_id == 1
+        account_kwargs = mock_st.selectbox.call_args_list[0][1]
+        assert account_kwargs["options"] == [None, 1, 2]
+        format_func = account_kwargs["format_func"]
+        assert format_func(None) == "All Accounts"
+        assert format_func(1) == "Broker (1) (ID: 1)"
+
+    @patch("finarius_app.ui.analytics.gains.get_unrealized_gains_history")
+    @patch("finarius_app.ui.analytics.gains.get_realized_gains_history")
+    @patch("finarius_app.ui.analytics.gains.get_unrealized_gains_by_symbol")
+    @patch("finarius_app.ui.analytics.gains.get_realized_gains_by_symbol")
+    @patch("finarius_app.ui.analytics.gains.calculate_unrealized_gains")
+    @patch("finarius_app.ui.analytics.gains.calculate_realized_gains")
+    @patch("finarius_app.ui.analytics.gains.get_price_downloader")
+    @patch("finarius_app.ui.analytics.gains.st")
+    def test_render_gains_analysis_tables(
+        self, mock_st, mock_downloader, mock_realized, mock_unrealized,
+        mock_realized_by_symbol, mock_unrealized_by_symbol,
+        mock_realized_history, mock_unrealized_history,
+    ):
+        """Test gains by symbol tables are sorted by amount and formatted."""
+        from finarius_app.ui.analytics.gains import render_gains_analysis
+
+        mock_st.columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
+        mock_realized.return_value = 0.0
+        mock_unrealized.return_value = 0.0
+        mock_realized_by_symbol.return_value = {"AAA": -50.0, "BBB": 1200.0}
+        mock_unrealized_by_symbol.return_value = {"CCC": 3.5}
+        mock_realized_history.return_value = {}
+        mock_unrealized_history.return_value = {}
+
+        render_gains_analysis(1, date(2024, 1, 1), date(2024, 1, 31), MagicMock())
+
+        mock_st.caption.assert_not_called()
+        df_realized = mock_st.dataframe.call_args_list[0][0][0]
+        assert df_realized["Symbol"].tolist() == ["BBB", "AAA"]
+        assert df_realized["Realized Gains"].tolist() == ["$1,200.00", "$-50.00"]
+        df_unrealized = mock_st.dataframe.call_args_list[1][0][0]
+        assert df_unrealized["Unrealized Gains"].tolist() == ["$3.50"]
+
+    @patch("finarius_app.ui.analytics.gains.get_unrealized_gains_history")
+    @patch("finarius_app.ui.analytics.gains.get_realized_gains_history")
+    @patch("finarius_app.ui.analytics.gains.get_unrealized_gains_by_symbol")
+    @patch("finarius_app.ui.analytics.gains.get_realized_gains_by_symbol")
+    @patch("finarius_app.ui.analytics.gains.calculate_unrealized_gains")
+    @patch("finarius_app.ui.analytics.gains.calculate_realized_gains")
+    @patch("finarius_app.ui.analytics.gains.get_price_downloader")
+    @patch("finarius_app.ui.analytics.gains.st")
+    def test_render_gains_analysis_partial_failure(
+        self, mock_st, mock_downloader, mock_realized, mock_unrealized,
+        mock_realized_by_symbol, mock_unrealized_by_symbol,
+        mock_realized_history, mock_unrealized_history,
+    ):
+        """Test a failing metric is captioned while the other metrics still render."""
+        from finarius_app.ui.analytics.gains import render_gains_analysis
+
+        mock_st.columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
+        mock_realized.return_value = 10.0
+        mock_unrealized.side_effect = ValueError("no price")
+        mock_realized_by_symbol.return_value = {"AAA": 10.0}
+        mock_unrealized_by_symbol.return_value = {}
+        mock_realized_history.return_value = {date(2024, 1, 1): 10.0}
+        mock_unrealized_history.return_value = {}
+
+        with patch("finarius_app.ui.analytics.gains.get_plotly_express", return_value=None):
+            render_gains_analysis(1, date(2024, 1, 1), date(2024, 1, 31), MagicMock())
+
+        mock_st.caption.assert_called_once_with("⚠️ Unrealized gains could not be calculated")
+        mock_st.metric.assert_any_call("Realized Gains/Losses", "$10.00")
+        mock_st.metric.assert_any_call("Unrealized Gains/Losses", "N/A")
+        mock_st.metric.assert_any_call("Total P&L", "N/A")
+        assert mock_st.dataframe.call_args[0][0]["Symbol"].tolist() == ["AAA"]
+        mock_st.line_chart.assert_called_once()
+
+    @patch("finarius_app.ui.analytics.page.render_filters")
+    @patch("finarius_app.ui.analytics.page.get_cached_accounts")
+    @patch("finarius_app.ui.analytics.page.get_db")
+    @patch("finarius_app.ui.analytics.page.st")
+    def test_render_analytics_page_section_error(
+        self, mock_st, mock_get_db, mock_get_all_accounts, mock_render_filters
+    ):
+        """Test an error in one section only replaces that section with a warning."""
+        mock_get_all_accounts.return_value = [Account(name="Only", account_id=1)]
+        mock_render_filters.return_value = (1, date(2024, 1, 1), date(2024, 12, 31))
+        sections = [
+            "render_performance_analytics",
+            "render_gains_analysis",
+            "render_returns_analysis",
+            "render_risk_metrics",
+            "render_dividend_analytics",
+            "render_position_analytics",
+        ]
+        with patch.multiple(
+            "finarius_app.ui.analytics.page", **{name: DEFAULT for name in sections}
+        ) as mocks:
+            mocks["render_gains_analysis"].side_effect = KeyError("Realized")
+            render_analytics_page()
+
+        mock_st.warning.assert_called_once_with(
+            "⚠️ Error rendering gains/losses analysis. Please check the logs for details."
+        )
+        for name in sections:
+            mocks[name].assert_called_once()
+
+    @patch("finarius_app.ui.analytics.dividends.calculate_dividend_yield")
+    @patch("finarius_app.ui.analytics.dividends.get_dividend_by_symbol")
+    @patch("finarius_app.ui.analytics.dividends.calculate_dividend_income")
+    @patch("finarius_app.ui.analytics.dividends.get_dividend_history")
+    @patch("finarius_app.ui.analytics.dividends.st")
+    def test_render_dividend_analytics_failed_history(
+        self, mock_st, mock_history, mock_income, mock_by_symbol, mock_yield
+    ):
+        """Test failed dividend metrics are captioned rather than reported as no data."""
+        from finarius_app.ui.analytics.dividends import render_dividend_analytics
+
+        mock_history.side_effect = ValueError("bad row")
+        mock_income.return_value = 0.0
+        mock_by_symbol.return_value = {}
+        mock_yield.return_value = None
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+
+        render_dividend_analytics(1, date(2024, 1, 1), date(2024, 12, 31), MagicMock())
+
+        mock_st.caption.assert_called_once_with("⚠️ Dividend history could not be calculated")
+        mock_st.info.assert_any_call("No dividend data by symbol available")
+        infos = [call[0][0] for call in mock_st.info.call_args_list]
+        assert "No dividend data available for the selected period" not in infos
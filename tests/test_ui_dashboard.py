@@ -89,3 +89,53 @@ class TestDashboardUI:
         mock_render_transactions.assert_called_once()
         mock_render_dividends.assert_called_once()
 
+    @patch("finarius_app.ui.dashboard.dividends.get_dividend_by_symbol")
+    @patch("finarius_app.ui.dashboard.dividends.calculate_dividend_yield")
+    @patch("finarius_app.ui.dashboard.dividends.calculate_dividend_income")
+    @patch("finarius_app.ui.dashboard.dividends.st")
+    def test_render_dividend_summary_top_payers(
+        self, mock_st, mock_income, mock_yield, mock_by_symbol
+    ):
+        """Test that top dividend payers are ranked by amount and capped at 10."""
+        from finarius_app.ui.dashboard.dividends import render_dividend_summary
+
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+        mock_income.return_value = 0.0
+        mock_yield.return_value = None
+        by_symbol = {f"S{i}": float(i) for i in range(12)}
+        by_symbol["BIG"] = 1500.0
+        mock_by_symbol.return_value = by_symbol
+
+        render_dividend_summary(1, date(2024, 1, 1), date(2024, 12, 31), MagicMock())
+
+        df = mock_st.dataframe.call_args[0][0]
+        assert len(df) == 10
+        assert df["Symbol"].tolist()[:3] == ["BIG", "S11", "S10"]
+        assert df["Dividend Income"].iloc[0] == "$1,500.00"
+
+    @patch("finarius_app.core.engine.calculate_portfolio_value")
+    @patch("finarius_app.core.models.get_all_accounts")
+    @patch("finarius_app.ui.dashboard.dividends.get_dividend_by_symbol")
+    @patch("finarius_app.ui.dashboard.dividends.calculate_dividend_income")
+    @patch("finarius_app.ui.dashboard.dividends.st")
+    def test_render_dividend_summary_all_accounts(
+        self, mock_st, mock_income, mock_by_symbol, mock_get_all_accounts, mock_value
+    ):
+        """Test that dividends by symbol are summed across accounts."""
+        from finarius_app.ui.dashboard.dividends import render_dividend_summary
+
+        mock_st.columns.return_value = [MagicMock(), MagicMock()]
+        mock_get_all_accounts.return_value = [
+            Account(name="A", account_id=1),
+            Account(name="B", account_id=2),
+        ]
+        mock_income.side_effect = [5.0, 3.0]
+        mock_value.side_effect = [100.0, 60.0]
+        mock_by_symbol.side_effect = [{"AAPL": 5.0}, {"AAPL": 1.0, "MSFT": 2.0}]
+
+        render_dividend_summary(None, date(2024, 1, 1), date(2024, 12, 31), MagicMock())
+
+        mock_st.metric.assert_any_call("Dividend Yield", "5.00%")
+        df = mock_st.dataframe.call_args[0][0]
+        assert df["Symbol"].tolist() == ["AAPL", "MSFT"]
+        assert df["Dividend Income"].tolist() == ["$6.00", "$2.00"]
@@ -7,6 +7,7 @@ from finarius_app.ui.error_handler import (
     handle_error,
     error_handler,
     safe_execute,
+    try_execute,
 )
 
 
@@ -108,3 +109,20 @@ class TestErrorHandler:
 
         assert result == 8
 
+    def test_try_execute_success(self):
+        """Test try_execute reports success, even for a result equal to the default."""
+
+        def test_func(x: int, y: int = 0) -> None:
+            return None
+
+        assert try_execute(test_func, 5, y=3) == (True, None)
+
+    @patch("finarius_app.ui.error_handler.logger")
+    def test_try_execute_error(self, mock_logger):
+        """Test try_execute reports failure with the default value."""
+
+        def test_func() -> None:
+            raise ValueError("Test error")
+
+        assert try_execute(test_func, default=0.0) == (False, 0.0)
+        mock_logger.error.assert_called_once()
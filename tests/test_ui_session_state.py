@@ -4,10 +4,13 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from finarius_app.core.database import Database
+from finarius_app.core.models import Account
 from finarius_app.ui.session_state import (
     initialize_session_state,
     get_db,
     set_db,
+    get_price_downloader,
+    get_cached_accounts,
     clear_messages,
     set_error_message,
     set_success_message,
@@ -93,6 +96,29 @@ class TestSessionState:
 
         assert mock_st.session_state.db is db
 
+    @patch("finarius_app.core.prices.downloader.PriceDownloader")
+    @patch("finarius_app.ui.session_state.st")
+    def test_get_price_downloader(self, mock_st, mock_downloader_cls):
+        """Test the price downloader is shared until the database changes."""
+
+        class SessionState(dict):
+            __getattr__ = dict.__getitem__
+            __setattr__ = dict.__setitem__
+
+        mock_st.session_state = SessionState()
+        mock_downloader_cls.side_effect = lambda db: MagicMock(db=db)
+        db = MagicMock(spec=Database)
+
+        downloader = get_price_downloader(db)
+
+        assert downloader.db is db
+        assert get_price_downloader(db) is downloader
+        assert mock_downloader_cls.call_count == 1
+
+        other_db = MagicMock(spec=Database)
+        assert get_price_downloader(other_db).db is other_db
+        assert mock_downloader_cls.call_count == 2
+
     @patch("finarius_app.ui.session_state.st")
     def test_clear_messages(self, mock_st):
         """Test clearing messages."""
@@ -208,3 +234,19 @@ class TestSessionState:
 
         assert mock_st.session_state["test_key"] == "test_value"
 
+    @patch("finarius_app.ui.session_state.get_all_accounts")
+    def test_get_cached_accounts(self, mock_get_all_accounts):
+        """Test that the account list is reused until the database is written to."""
+        mock_db = MagicMock()
+        mock_db.get_connection.return_value.total_changes = 0
+        account = Account(name="Test Account", currency="USD", account_id=1)
+        mock_get_all_accounts.return_value = [account]
+
+        assert get_cached_accounts(mock_db) == [account]
+        get_cached_accounts(mock_db).clear()
+        assert get_cached_accounts(mock_db) == [account]
+        assert mock_get_all_accounts.call_count == 1
+
+        mock_db.get_connection.return_value.total_changes = 1
+        get_cached_accounts(mock_db)
+        assert mock_get_all_accounts.call_count == 2
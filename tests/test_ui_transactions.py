@@ -75,7 +75,7 @@ class TestTransactionsUI:
         # Setup filters st mock
         mock_st_filters.subheader = MagicMock()
         mock_st_filters.columns = MagicMock(return_value=[MagicMock(), MagicMock(), MagicMock(), MagicMock()])
-        mock_st_filters.selectbox = MagicMock(return_value="All Accounts")
+        mock_st_filters.selectbox = MagicMock(side_effect=[None, "Last Year", "All Types"])
         mock_st_filters.date_input = MagicMock(return_value=(date.today() - timedelta(days=30), date.today()))
         mock_st_filters.text_input = MagicMock(return_value="")
         
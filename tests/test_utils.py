@@ -1,11 +1,13 @@
 """Tests for utility functions module."""
 
+import numpy as np
 import pytest
 from datetime import date, timedelta
 from finarius_app.core.utils import (
     parse_date,
     format_date,
     get_date_range,
+    get_date_range_array,
     format_currency,
     format_percentage,
     round_decimal,
@@ -14,7 +16,10 @@ from finarius_app.core.utils import (
     validate_amount,
     safe_divide,
     calculate_percentage_change,
+    safe_divide_array,
+    percentage_change_array,
 )
+from finarius_app.core.config import Config
 from finarius_app.core.exceptions import ValidationError
 
 
@@ -44,6 +49,20 @@ class TestDateUtilities:
         result = parse_date("01/15/2024")
         assert result == date(2024, 1, 15)
 
+    def test_parse_date_auto_detect_layouts(self):
+        """Test automatic detection of every common layout."""
+        assert parse_date("2024-1-5") == date(2024, 1, 5)
+        assert parse_date("2024-01-15 10:30:00") == date(2024, 1, 15)
+        assert parse_date("15/01/2024") == date(2024, 1, 15)  # Not a valid US date
+        assert parse_date("02/03/2024") == date(2024, 2, 3)  # US order wins
+        assert parse_date("01-15-2024") == date(2024, 1, 15)
+        assert parse_date("15-01-2024") == date(2024, 1, 15)
+
+        with pytest.raises(ValidationError):
+            parse_date("2024-02-30")
+        with pytest.raises(ValidationError):
+            parse_date("2024-01-15 25:00:00")
+
     def test_parse_date_invalid(self):
         """Test parsing invalid date raises ValidationError."""
         with pytest.raises(ValidationError):
@@ -96,6 +115,22 @@ class TestDateUtilities:
         with pytest.raises(ValidationError):
             get_date_range(start, end)
 
+    def test_get_date_range_invalid_step(self):
+        """Test date range with a non-positive step raises ValidationError."""
+        with pytest.raises(ValidationError):
+            get_date_range(date(2024, 1, 1), date(2024, 1, 5), step_days=0)
+
+    def test_get_date_range_array(self):
+        """Test generating a datetime64 date range."""
+        result = get_date_range_array(date(2024, 1, 1), date(2024, 1, 10), step_days=3)
+        assert result.dtype == np.dtype("datetime64[D]")
+        assert result.tolist() == [
+            date(2024, 1, 1),
+            date(2024, 1, 4),
+            date(2024, 1, 7),
+            date(2024, 1, 10),
+        ]
+
 
 class TestNumberUtilities:
     """Test number formatting utilities."""
@@ -122,6 +157,18 @@ class TestNumberUtilities:
         result = format_currency(1234.56)
         assert "$" in result  # Default is USD
 
+    def test_format_currency_follows_config_changes(self):
+        """Test that cached display settings pick up config changes."""
+        config = Config()
+        previous = config.get("display.default_currency")
+        assert format_currency(1.0) == format_currency(1.0, previous)
+        try:
+            config.set("display.default_currency", "GBP")
+            assert format_currency(1.0) == "£1.00"
+        finally:
+            config.set("display.default_currency", previous)
+        assert format_currency(1.0) == format_currency(1.0, previous)
+
     def test_format_percentage_basic(self):
         """Test formatting percentage."""
         result = format_percentage(0.15)
@@ -152,6 +199,15 @@ class TestNumberUtilities:
         result = round_decimal(3.7, 0)
         assert result == 4.0
 
+    def test_round_decimal_half_up_on_decimal_repr(self):
+        """Test that halves round away from zero as written, not as stored."""
+        assert round_decimal(1.005, 2) == 1.01
+        assert round_decimal(2.675, 2) == 2.68
+        assert round_decimal(-3.145, 2) == -3.15
+        assert round_decimal(2.5, 0) == 3.0
+        assert round_decimal(1e-7, 2) == 0.0
+        assert round_decimal(42, 2) == 42.0
+
     def test_round_decimal_negative_decimals(self):
         """Test rounding with negative decimals raises ValidationError."""
         with pytest.raises(ValidationError):
@@ -174,6 +230,9 @@ class TestValidationUtilities:
         assert validate_symbol("   ") is False
         assert validate_symbol("A" * 11) is False  # Too long
         assert validate_symbol("!@#") is False  # Invalid characters
+        assert validate_symbol(".") is False  # Separators only
+        assert validate_symbol("-") is False
+        assert validate_symbol(".-.") is False
 
     def test_validate_symbol_special_chars(self):
         """Test symbols with special characters."""
@@ -254,6 +313,21 @@ class TestDataUtilities:
         result = calculate_percentage_change(100, -50)
         assert result == -1.5
 
+    def test_safe_divide_array(self):
+        """Test element-wise division with zero denominators."""
+        result = safe_divide_array(np.array([10.0, 5.0, 1.0]), np.array([2.0, 0.0, 4.0]))
+        assert result.tolist() == [5.0, 0.0, 0.25]
+        result = safe_divide_array(np.array([5.0]), np.array([0.0]), float("inf"))
+        assert result.tolist() == [float("inf")]
+
+    def test_percentage_change_array(self):
+        """Test consecutive changes match the scalar function, NaN after a zero."""
+        with np.errstate(all="raise"):
+            result = percentage_change_array(np.array([100.0, 110.0, 0.0, 5.0]))
+        assert result[0] == pytest.approx(calculate_percentage_change(100, 110))
+        assert result[1] == -1.0
+        assert np.isnan(result[2])
+
 
 class TestUtilityIntegration:
     """Test utility functions working together."""